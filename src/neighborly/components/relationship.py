@@ -2,20 +2,38 @@
 
 The relationship system tracks feelings of one character toward another character.
 Relationships are represented as independent GameObjects. Together they form a directed
-graph.
+graph. Alternatively, a RelationshipStore resource can store relationships as rows of
+arrays and only create GameObjects for them when they are needed. Relationships between
+inactive GameObjects may be moved out of the world into a RelationshipArchive.
 
 """
 
 from __future__ import annotations
 
-from typing import Any, Iterable, Mapping, Optional
+from typing import Any, Iterable, Iterator, Mapping, Optional, Sequence
 
 import attrs
+import numpy as np
+import polars as pl
 
-from neighborly.ecs import Component, GameObject
+from neighborly.components.stats import Stat, StatColumn, StatModifier, Stats
+from neighborly.components.traits import Trait, TraitIndex, Traits
+from neighborly.ecs import Active, Component, GameObject, World
 from neighborly.effects.base_types import Effect
 from neighborly.preconditions.base_types import Precondition
 
+RELATIONSHIP_STATS: tuple[tuple[str, Optional[tuple[float, float]]], ...] = (
+    ("reputation", (-100, 100)),
+    ("romance", (-100, 100)),
+    ("compatibility", None),
+    ("romantic_compatibility", None),
+    ("interaction_score", (0, 10)),
+)
+"""IDs and bounds of the stats given to every relationship."""
+
+MAX_RELATIONSHIP_TRAITS = 64
+"""The number of trait IDs that fit in a RelationshipStore trait mask."""
+
 
 class Relationship(Component):
     """Tags a GameObject as a relationship and tracks the owner and target."""
@@ -67,34 +85,67 @@ class Relationships(Component):
 
     Notes
     -----
-    This component helps build a directed graph structure within the ECS.
+    This component helps build a directed graph structure within the ECS. If the
+    world has a RelationshipStore, the store tracks which relationships exist instead
+    of this component.
     """
 
     __slots__ = (
         "_incoming",
         "_outgoing",
+        "_store",
+        "_trait_index",
     )
 
     _incoming: dict[GameObject, GameObject]
     """Relationship owners mapped to the Relationship GameObjects."""
     _outgoing: dict[GameObject, GameObject]
     """Relationship targets mapped to the Relationship GameObjects."""
+    _store: Optional[RelationshipStore]
+    """The world's RelationshipStore (None if relationships are always GameObjects)."""
+    _trait_index: TraitIndex
+    """Trait IDs mapped to the targets of outgoing relationships with that trait."""
 
     def __init__(self) -> None:
         super().__init__()
         self._incoming = {}
         self._outgoing = {}
+        self._store = None
+        self._trait_index = TraitIndex()
 
     @property
     def outgoing(self) -> Mapping[GameObject, GameObject]:
-        """Returns a mapping of the outgoing relationship collection."""
+        """Returns a mapping of the outgoing relationship collection.
+
+        If the world has a RelationshipStore, looking up a relationship in the
+        mapping creates its GameObject.
+        """
+        if self._store is not None:
+            return _RelationshipMapping(
+                self._store, self._store.get_outgoing_rows(self.gameobject)
+            )
+
         return self._outgoing
 
     @property
     def incoming(self) -> Mapping[GameObject, GameObject]:
-        """Returns a mapping of the incoming relationship collection."""
+        """Returns a mapping of the incoming relationship collection.
+
+        If the world has a RelationshipStore, looking up a relationship in the
+        mapping creates its GameObject.
+        """
+        if self._store is not None:
+            return _RelationshipMapping(
+                self._store, self._store.get_incoming_rows(self.gameobject)
+            )
+
         return self._incoming
 
+    def on_add(self) -> None:
+        self._store = self.gameobject.world.resource_manager.try_resource(
+            RelationshipStore
+        )
+
     def add_outgoing_relationship(
         self, target: GameObject, relationship: GameObject
     ) -> None:
@@ -113,7 +164,10 @@ class Relationships(Component):
                 "target: {target.name}"
             )
 
-        self._outgoing[target] = relationship
+        if self._store is None:
+            self._outgoing[target] = relationship
+
+        relationship.get_component(Traits).bind_index(self._trait_index, target)
 
     def remove_outgoing_relationship(self, target: GameObject) -> bool:
         """Remove the relationship GameObject to the target.
@@ -128,11 +182,13 @@ class Relationships(Component):
         bool
             Returns True if a relationship was removed. False otherwise.
         """
-        if target in self._outgoing:
-            del self._outgoing[target]
-            return True
+        if not self.has_outgoing_relationship(target):
+            return False
+
+        self._outgoing.pop(target, None)
+        self._trait_index.remove_key(target)
 
-        return False
+        return True
 
     def get_outgoing_relationship(self, target: GameObject) -> GameObject:
         """Get a relationship from one GameObject to another.
@@ -147,6 +203,11 @@ class Relationships(Component):
         GameObject
             A relationship instance.
         """
+        if self._store is not None:
+            return self._store.get_relationship(
+                self._store.get_outgoing_rows(self.gameobject)[target]
+            )
+
         return self._outgoing[target]
 
     def has_outgoing_relationship(self, target: GameObject) -> bool:
@@ -163,8 +224,44 @@ class Relationships(Component):
             True if there is an existing Relationship between the GameObjects,
             False otherwise.
         """
+        if self._store is not None:
+            return target in self._store.get_outgoing_rows(self.gameobject)
+
         return target in self._outgoing
 
+    def has_outgoing_trait(self, target: GameObject, trait: str) -> bool:
+        """Check if the outgoing relationship to a target has a trait.
+
+        Parameters
+        ----------
+        target
+            The target of the relationship.
+        trait
+            The ID of a trait.
+
+        Returns
+        -------
+        bool
+            True if there is a relationship to the target with the trait, False
+            otherwise.
+        """
+        return self._trait_index.has(trait, target)
+
+    def get_outgoing_with_traits(self, *traits: str) -> list[GameObject]:
+        """Get the targets of all outgoing relationships with the given traits.
+
+        Parameters
+        ----------
+        *traits
+            The IDs of traits.
+
+        Returns
+        -------
+        list[GameObject]
+            The targets of relationships with all the given traits.
+        """
+        return self._trait_index.get_keys(*traits)
+
     def add_incoming_relationship(
         self, owner: GameObject, relationship: GameObject
     ) -> None:
@@ -183,7 +280,8 @@ class Relationships(Component):
                 "target: {target.name}"
             )
 
-        self._incoming[owner] = relationship
+        if self._store is None:
+            self._incoming[owner] = relationship
 
     def remove_incoming_relationship(self, owner: GameObject) -> bool:
         """Remove the relationship GameObject to the owner.
@@ -198,11 +296,12 @@ class Relationships(Component):
         bool
             Returns True if a relationship was removed. False otherwise.
         """
-        if owner in self._incoming:
-            del self._incoming[owner]
-            return True
+        if not self.has_incoming_relationship(owner):
+            return False
+
+        self._incoming.pop(owner, None)
 
-        return False
+        return True
 
     def get_incoming_relationship(self, owner: GameObject) -> GameObject:
         """Get a relationship from one another GameObject to this one.
@@ -217,6 +316,11 @@ class Relationships(Component):
         GameObject
             A relationship instance.
         """
+        if self._store is not None:
+            return self._store.get_relationship(
+                self._store.get_incoming_rows(self.gameobject)[owner]
+            )
+
         return self._incoming[owner]
 
     def has_incoming_relationship(self, owner: GameObject) -> bool:
@@ -233,12 +337,15 @@ class Relationships(Component):
             True if there is an existing Relationship between the GameObjects,
             False otherwise.
         """
+        if self._store is not None:
+            return owner in self._store.get_incoming_rows(self.gameobject)
+
         return owner in self._incoming
 
     def to_dict(self) -> dict[str, Any]:
         return {
-            "outgoing": {str(k.uid): v.uid for k, v in self._outgoing.items()},
-            "incoming": {str(k.uid): v.uid for k, v in self._incoming.items()},
+            "outgoing": {str(k.uid): v.uid for k, v in self.outgoing.items()},
+            "incoming": {str(k.uid): v.uid for k, v in self.incoming.items()},
         }
 
     def __str__(self) -> str:
@@ -246,11 +353,162 @@ class Relationships(Component):
 
     def __repr__(self) -> str:
         return (
-            f"{self.__class__.__name__}(outgoing={self._outgoing}, "
-            f"incoming={self._incoming})"
+            f"{self.__class__.__name__}(outgoing={self.outgoing}, "
+            f"incoming={self.incoming})"
         )
 
 
+class _RelationshipMapping(Mapping[GameObject, GameObject]):
+    """A view of a GameObject's relationships in a RelationshipStore.
+
+    Looking up a relationship creates its GameObject if it does not have one.
+    """
+
+    __slots__ = ("_store", "_rows")
+
+    _store: RelationshipStore
+    """The store containing the relationships."""
+    _rows: Mapping[GameObject, int]
+    """GameObjects mapped to the rows of the relationships with them."""
+
+    def __init__(
+        self, store: RelationshipStore, rows: Mapping[GameObject, int]
+    ) -> None:
+        self._store = store
+        self._rows = rows
+
+    def __getitem__(self, key: GameObject) -> GameObject:
+        return self._store.get_relationship(self._rows[key])
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._rows
+
+    def __iter__(self) -> Iterator[GameObject]:
+        # Iterate over a copy since looking up relationships can change the rows
+        return iter(list(self._rows))
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self._rows)})"
+
+
+_DEFAULT_STATS: dict[str, Stat] = {
+    stat_id: Stat(base_value=0, bounds=bounds) for stat_id, bounds in RELATIONSHIP_STATS
+}
+"""Relationship stats with the values of a new relationship (do not modify)."""
+
+
+class RelationshipView:
+    """A read-only view of the stats and traits of a relationship.
+
+    Views read relationship data without creating GameObjects for relationships in a
+    RelationshipStore. A view of a relationship that does not exist has the default
+    values of relationship stats and no traits.
+    """
+
+    __slots__ = ("_relationships", "_target", "_stats", "_store", "_row")
+
+    _relationships: Optional[Relationships]
+    """The owner's Relationships component (None if there is no relationship)."""
+    _target: Optional[GameObject]
+    """The target of the relationship (None if there is no relationship)."""
+    _stats: Optional[Stats]
+    """The Stats component of the relationship's GameObject."""
+    _store: Optional[RelationshipStore]
+    """The store containing the relationship if it does not have a GameObject."""
+    _row: int
+    """The relationship's row in the store."""
+
+    def __init__(
+        self,
+        relationships: Optional[Relationships] = None,
+        target: Optional[GameObject] = None,
+        stats: Optional[Stats] = None,
+        store: Optional[RelationshipStore] = None,
+        row: int = -1,
+    ) -> None:
+        self._relationships = relationships
+        self._target = target
+        self._stats = stats
+        self._store = store
+        self._row = row
+
+    @property
+    def exists(self) -> bool:
+        """Is there a relationship behind this view."""
+        return self._relationships is not None
+
+    def get_stat_value(self, stat_id: str) -> float:
+        """Get the final value of a relationship stat.
+
+        Parameters
+        ----------
+        stat_id
+            The ID of the stat.
+
+        Returns
+        -------
+        float
+            The value of the stat.
+        """
+        if self._stats is not None:
+            return self._stats.get_stat(stat_id).value
+
+        if self._store is not None:
+            column = self._store.get_column(stat_id)
+            return float(column.get_values(np.array([self._row]))[0])
+
+        return _DEFAULT_STATS[stat_id].value
+
+    def get_normalized(self, stat_id: str) -> float:
+        """Get the normalized value of a bounded relationship stat.
+
+        Parameters
+        ----------
+        stat_id
+            The ID of the stat.
+
+        Returns
+        -------
+        float
+            The value of the stat scaled from 0.0 to 1.0.
+        """
+        if self._stats is not None:
+            return self._stats.get_stat(stat_id).normalized
+
+        if self._store is not None:
+            column = self._store.get_column(stat_id)
+
+            if not column.is_bounded[self._row]:
+                raise ValueError(
+                    "Cannot calculate normalized value of an unbound stat."
+                )
+
+            return float(column.get_normalized(np.array([self._row]))[0])
+
+        return _DEFAULT_STATS[stat_id].normalized
+
+    def has_trait(self, trait_id: str) -> bool:
+        """Check if the relationship has a trait.
+
+        Parameters
+        ----------
+        trait_id
+            The ID of a trait.
+
+        Returns
+        -------
+        bool
+            True if the relationship has the trait, False otherwise.
+        """
+        if self._relationships is None or self._target is None:
+            return False
+
+        return self._relationships.has_outgoing_trait(self._target, trait_id)
+
+
 @attrs.define
 class SocialRule:
     """A rule that modifies a relationship depending on some preconditions."""
@@ -326,3 +584,743 @@ class SocialRules(Component):
 
     def to_dict(self) -> dict[str, Any]:
         return {}
+
+
+class RelationshipStore:
+    """A shared resource that stores relationships as rows of arrays.
+
+    Relationships are rows in a graph keyed by their (owner, target) pair. The
+    relationship stats of every row are stored in one StatColumn per stat ID, and the
+    relationship's traits are stored in a bit mask. GameObjects are created for
+    relationships only when they are needed, and compact() turns relationships back
+    into rows. Each row keeps the ID of its relationship's GameObject reserved, so a
+    relationship has the same UID and GameObject instance every time it is created.
+    """
+
+    __slots__ = (
+        "_world",
+        "_rows",
+        "_free_rows",
+        "_owners",
+        "_targets",
+        "_uids",
+        "_relationships",
+        "_outgoing",
+        "_incoming",
+        "_columns",
+        "_traits",
+        "_trait_bits",
+        "_modifiers",
+        "_rules",
+        "trait_masks",
+        "is_active",
+    )
+
+    _world: World
+    """The world that the relationships belong to."""
+    _rows: dict[tuple[int, int], int]
+    """(owner ID, target ID) pairs mapped to rows."""
+    _free_rows: list[int]
+    """Rows of removed relationships that can be reused."""
+    _owners: list[Optional[GameObject]]
+    """The owner of the relationship in each row."""
+    _targets: list[Optional[GameObject]]
+    """The target of the relationship in each row."""
+    _uids: list[int]
+    """The UID of the relationship in each row."""
+    _relationships: list[Optional[GameObject]]
+    """The GameObject of the relationship in each row (None if it has none)."""
+    _outgoing: dict[GameObject, dict[GameObject, int]]
+    """Owners mapped to the rows of their relationships, keyed by target."""
+    _incoming: dict[GameObject, dict[GameObject, int]]
+    """Targets mapped to the rows of their relationships, keyed by owner."""
+    _columns: dict[str, StatColumn]
+    """Relationship stat IDs mapped to the columns storing their data."""
+    _traits: list[GameObject]
+    """Trait GameObjects ordered by their bit in the trait masks."""
+    _trait_bits: dict[str, int]
+    """Trait IDs mapped to their bit in the trait masks."""
+    _modifiers: dict[int, list[tuple[str, StatModifier]]]
+    """Rows without GameObjects mapped to the modifiers of their stats."""
+    _rules: dict[int, list[SocialRule]]
+    """Rows without GameObjects mapped to the social rules applied to them."""
+    trait_masks: np.ndarray
+    """A bit mask of the traits of each relationship without a GameObject."""
+    is_active: np.ndarray
+    """True for rows of active relationships."""
+
+    def __init__(self, world: World, capacity: int = 64) -> None:
+        self._world = world
+        self._rows = {}
+        self._free_rows = []
+        self._owners = []
+        self._targets = []
+        self._uids = []
+        self._relationships = []
+        self._outgoing = {}
+        self._incoming = {}
+        self._columns = {
+            stat_id: StatColumn(stat_id, capacity) for stat_id, _ in RELATIONSHIP_STATS
+        }
+        self._traits = []
+        self._trait_bits = {}
+        self._modifiers = {}
+        self._rules = {}
+        self.trait_masks = np.zeros(capacity, dtype=np.uint64)
+        self.is_active = np.zeros(capacity, dtype=np.bool_)
+
+    @property
+    def columns(self) -> Mapping[str, StatColumn]:
+        """Relationship stat IDs mapped to the columns storing their data."""
+        return self._columns
+
+    def get_column(self, stat_id: str) -> StatColumn:
+        """Get the column storing a relationship stat.
+
+        Parameters
+        ----------
+        stat_id
+            The ID of a stat in RELATIONSHIP_STATS.
+
+        Returns
+        -------
+        StatColumn
+            The column.
+        """
+        return self._columns[stat_id]
+
+    def get_row(self, owner: GameObject, target: GameObject) -> Optional[int]:
+        """Get the row of the relationship from the owner to the target.
+
+        Parameters
+        ----------
+        owner
+            The owner of the relationship.
+        target
+            The target of the relationship.
+
+        Returns
+        -------
+        int or None
+            The row, or None if there is no relationship.
+        """
+        return self._rows.get((owner.uid, target.uid))
+
+    def get_outgoing_rows(self, owner: GameObject) -> Mapping[GameObject, int]:
+        """Get the rows of a GameObject's outgoing relationships, keyed by target."""
+        return self._outgoing.get(owner, {})
+
+    def get_incoming_rows(self, target: GameObject) -> Mapping[GameObject, int]:
+        """Get the rows of a GameObject's incoming relationships, keyed by owner."""
+        return self._incoming.get(target, {})
+
+    def get_owner(self, row: int) -> GameObject:
+        """Get the owner of the relationship in a row."""
+        owner = self._owners[row]
+
+        if owner is None:
+            raise KeyError(row)
+
+        return owner
+
+    def get_target(self, row: int) -> GameObject:
+        """Get the target of the relationship in a row."""
+        target = self._targets[row]
+
+        if target is None:
+            raise KeyError(row)
+
+        return target
+
+    def get_uid(self, row: int) -> int:
+        """Get the UID of the relationship in a row."""
+        if self._owners[row] is None:
+            raise KeyError(row)
+
+        return self._uids[row]
+
+    def get_active_rows(self) -> np.ndarray:
+        """Get the rows of all active relationships."""
+        return np.flatnonzero(self.is_active)
+
+    def get_gameobject_ids(self, rows: np.ndarray) -> list[int]:
+        """Get the IDs of the relationship GameObjects in the given rows.
+
+        Rows of relationships without GameObjects are skipped.
+        """
+        return [self._uids[row] for row in rows if self._relationships[row] is not None]
+
+    def has_gameobject(self, row: int) -> bool:
+        """Check if the relationship in a row currently has a GameObject."""
+        return self._relationships[row] is not None
+
+    def has_trait(self, row: int, trait_id: str) -> bool:
+        """Check if the relationship in a row has a trait.
+
+        Parameters
+        ----------
+        row
+            A row.
+        trait_id
+            The ID of a trait.
+
+        Returns
+        -------
+        bool
+            True if the relationship has the trait, False otherwise.
+        """
+        relationship = self._relationships[row]
+
+        if relationship is not None:
+            return any(
+                trait.get_component(Trait).definition_id == trait_id
+                for trait in relationship.get_component(Traits).traits
+            )
+
+        bit = self._trait_bits.get(trait_id)
+
+        return bit is not None and bool(int(self.trait_masks[row]) >> bit & 1)
+
+    def get_traits(self, row: int) -> list[GameObject]:
+        """Get the traits of the relationship in a row.
+
+        Parameters
+        ----------
+        row
+            A row.
+
+        Returns
+        -------
+        list[GameObject]
+            Trait GameObjects.
+        """
+        relationship = self._relationships[row]
+
+        if relationship is not None:
+            return list(relationship.get_component(Traits).traits)
+
+        mask = int(self.trait_masks[row])
+
+        return [trait for bit, trait in enumerate(self._traits) if mask >> bit & 1]
+
+    def add_relationship(self, relationship: GameObject) -> int:
+        """Add a row for a relationship GameObject.
+
+        The data of the relationship's stats moves into the store's columns.
+
+        Parameters
+        ----------
+        relationship
+            A GameObject with Relationship and Stats components.
+
+        Returns
+        -------
+        int
+            The relationship's row.
+        """
+        relationship_data = relationship.get_component(Relationship)
+        owner, target = relationship_data.owner, relationship_data.target
+
+        if self._free_rows:
+            row = self._free_rows.pop()
+        else:
+            row = len(self._owners)
+            self._owners.append(None)
+            self._targets.append(None)
+            self._uids.append(-1)
+            self._relationships.append(None)
+
+            if row >= len(self.is_active):
+                self._grow(row + 1)
+
+        self._rows[(owner.uid, target.uid)] = row
+        self._owners[row] = owner
+        self._targets[row] = target
+        self._uids[row] = relationship.uid
+        self._relationships[row] = relationship
+        self._outgoing.setdefault(owner, {})[target] = row
+        self._incoming.setdefault(target, {})[owner] = row
+        self.is_active[row] = relationship.is_active
+
+        for stat_id, stat in relationship.get_component(Stats):
+            if column := self._columns.get(stat_id):
+                stat.attach(column, row)
+
+        return row
+
+    def remove_relationship(
+        self, owner: GameObject, target: GameObject
+    ) -> Optional[GameObject]:
+        """Remove the row of a relationship.
+
+        Parameters
+        ----------
+        owner
+            The owner of the relationship.
+        target
+            The target of the relationship.
+
+        Returns
+        -------
+        GameObject or None
+            The relationship's GameObject, or None if it did not have one.
+        """
+        row = self._rows.pop((owner.uid, target.uid))
+
+        del self._outgoing[owner][target]
+        del self._incoming[target][owner]
+
+        relationship = self._relationships[row]
+
+        if relationship is not None:
+            for _, stat in relationship.get_component(Stats):
+                stat.detach()
+        else:
+            self._world.gameobject_manager.release_id(self._uids[row])
+
+        self._owners[row] = None
+        self._targets[row] = None
+        self._relationships[row] = None
+        self._modifiers.pop(row, None)
+        self._rules.pop(row, None)
+        self.trait_masks[row] = 0
+        self.is_active[row] = False
+        self._free_rows.append(row)
+
+        return relationship
+
+    def deactivate(self, row: int) -> None:
+        """Deactivate the relationship in a row."""
+        self.is_active[row] = False
+
+        if (relationship := self._relationships[row]) is not None:
+            relationship.deactivate()
+
+    def get_relationship(self, row: int) -> GameObject:
+        """Get the GameObject of the relationship in a row, creating it if needed.
+
+        A created GameObject reuses the UID and instance of the relationship's
+        previous GameObject.
+
+        Parameters
+        ----------
+        row
+            A row.
+
+        Returns
+        -------
+        GameObject
+            The relationship.
+        """
+        if (relationship := self._relationships[row]) is not None:
+            return relationship
+
+        owner, target = self.get_owner(row), self.get_target(row)
+        stats = Stats()
+        social_rules = SocialRules()
+        traits = Traits()
+
+        relationship = self._world.gameobject_manager.spawn_gameobject(
+            components=[
+                Relationship(owner=owner, target=target),
+                stats,
+                social_rules,
+                traits,
+            ],
+            name=f"{owner.name} -> {target.name}",
+            gameobject_id=self._uids[row],
+        )
+
+        for stat_id, column in self._columns.items():
+            stats.add_stat(
+                stat_id,
+                Stat(
+                    base_value=float(column.base_values[row]),
+                    bounds=(
+                        (float(column.min_values[row]), float(column.max_values[row]))
+                        if column.is_bounded[row]
+                        else None
+                    ),
+                    is_discrete=bool(column.is_discrete[row]),
+                ),
+            )
+
+        for stat_id, modifier in self._modifiers.pop(row, ()):
+            stats.get_stat(stat_id).add_modifier(modifier)
+
+        for stat_id, stat in stats:
+            stat.attach(self._columns[stat_id], row)
+
+        for rule in self._rules.pop(row, ()):
+            social_rules.add_rule(rule)
+
+        mask = int(self.trait_masks[row])
+        for bit, trait in enumerate(self._traits):
+            if mask >> bit & 1:
+                traits.restore_trait(trait)
+        self.trait_masks[row] = 0
+
+        if not self.is_active[row]:
+            relationship.deactivate()
+
+        self._relationships[row] = relationship
+        owner.get_component(Relationships).add_outgoing_relationship(
+            target, relationship
+        )
+
+        return relationship
+
+    def materialize_all(self) -> None:
+        """Create GameObjects for all relationships that do not have one."""
+        for row, owner in enumerate(self._owners):
+            if owner is not None and self._relationships[row] is None:
+                self.get_relationship(row)
+
+    def _can_compact(self, row: int, relationship: GameObject) -> bool:
+        """Check if a relationship GameObject can be stored as a row."""
+        if relationship.children:
+            return False
+
+        for component_type in relationship.get_component_types():
+            if component_type not in (
+                Relationship,
+                Stats,
+                SocialRules,
+                Traits,
+                Active,
+            ):
+                return False
+
+        stats = list(relationship.get_component(Stats))
+
+        if len(stats) != len(self._columns):
+            return False
+
+        for stat_id, stat in stats:
+            column = self._columns.get(stat_id)
+
+            if column is None or stat.column is not column or column.is_ordered[row]:
+                return False
+
+        new_trait_ids = {
+            trait.get_component(Trait).definition_id
+            for trait in relationship.get_component(Traits).traits
+        }.difference(self._trait_bits)
+
+        return len(self._trait_bits) + len(new_trait_ids) <= MAX_RELATIONSHIP_TRAITS
+
+    def compact(self, row: int) -> bool:
+        """Destroy the GameObject of the relationship in a row, keeping its data.
+
+        The GameObject's ID stays reserved for when the relationship needs a
+        GameObject again. Relationships with components or stats that the store
+        cannot hold keep their GameObjects.
+
+        Parameters
+        ----------
+        row
+            A row.
+
+        Returns
+        -------
+        bool
+            True if the relationship is stored without a GameObject, False otherwise.
+        """
+        relationship = self._relationships[row]
+
+        if relationship is None:
+            return True
+
+        if not self._can_compact(row, relationship):
+            return False
+
+        modifiers: list[tuple[str, StatModifier]] = []
+        for stat_id, stat in relationship.get_component(Stats):
+            modifiers.extend((stat_id, modifier) for modifier in stat.modifiers)
+            stat.recalculate_value()
+            stat.detach()
+
+        if modifiers:
+            self._modifiers[row] = modifiers
+
+        if rules := list(relationship.get_component(SocialRules).rules):
+            self._rules[row] = rules
+
+        mask = 0
+        for trait in relationship.get_component(Traits).traits:
+            trait_id = trait.get_component(Trait).definition_id
+
+            if trait_id not in self._trait_bits:
+                self._trait_bits[trait_id] = len(self._traits)
+                self._traits.append(trait)
+
+            mask |= 1 << self._trait_bits[trait_id]
+        self.trait_masks[row] = mask
+
+        self.is_active[row] = relationship.is_active
+        self._relationships[row] = None
+
+        self._world.gameobject_manager.destroy_gameobject(relationship, keep_id=True)
+
+        return True
+
+    def compact_all(self) -> int:
+        """Store all relationships without GameObjects if possible.
+
+        Returns
+        -------
+        int
+            The number of GameObjects destroyed.
+        """
+        count = 0
+
+        for row, relationship in enumerate(self._relationships):
+            if relationship is not None and self.compact(row):
+                count += 1
+
+        return count
+
+    def _grow(self, min_capacity: int) -> None:
+        """Increase the number of rows to at least the given capacity."""
+        capacity = max(min_capacity, 2 * len(self.is_active))
+        extra = capacity - len(self.is_active)
+
+        self.trait_masks = np.concatenate(
+            (self.trait_masks, np.zeros(extra, dtype=np.uint64))
+        )
+        self.is_active = np.concatenate(
+            (self.is_active, np.zeros(extra, dtype=np.bool_))
+        )
+
+
+class RelationshipArchive:
+    """A shared resource that stores the data of relationships removed from the world.
+
+    Relationships between GameObjects that are both inactive are archived to free
+    memory and shorten queries. Archived data is read-only and kept in Polars data
+    frames that use the same columns as the tables created by
+    neighborly.data_analysis.create_sql_db().
+    """
+
+    __slots__ = ("_relationships", "_stats", "_traits")
+
+    _relationships: pl.DataFrame
+    """The UID, owner UID, target UID, and name of each relationship."""
+    _stats: pl.DataFrame
+    """The value of each stat of each relationship."""
+    _traits: pl.DataFrame
+    """The UID and display name of each trait of each relationship."""
+
+    def __init__(self) -> None:
+        self._relationships = pl.DataFrame(
+            schema={"uid": pl.Int64, "owner": pl.Int64, "target": pl.Int64, "name": str}
+        )
+        self._stats = pl.DataFrame(
+            schema={"gameobject": pl.Int64, "stat": str, "value": pl.Float64}
+        )
+        self._traits = pl.DataFrame(
+            schema={"gameobject": pl.Int64, "trait_uid": pl.Int64, "trait": str}
+        )
+
+    @property
+    def relationships(self) -> pl.DataFrame:
+        """The UID, owner UID, target UID, and name of each relationship."""
+        return self._relationships
+
+    @property
+    def stats(self) -> pl.DataFrame:
+        """The value of each stat of each relationship."""
+        return self._stats
+
+    @property
+    def traits(self) -> pl.DataFrame:
+        """The UID and display name of each trait of each relationship."""
+        return self._traits
+
+    def has_relationship(self, uid: int) -> bool:
+        """Check if a relationship is in the archive.
+
+        Parameters
+        ----------
+        uid
+            The UID of the relationship.
+
+        Returns
+        -------
+        bool
+            True if the relationship is in the archive, False otherwise.
+        """
+        return bool((self._relationships["uid"] == uid).any())
+
+    def get_outgoing(self, owner: int) -> pl.DataFrame:
+        """Get the archived relationships owned by a GameObject.
+
+        Parameters
+        ----------
+        owner
+            The UID of the owner.
+
+        Returns
+        -------
+        pl.DataFrame
+            The rows of the relationships table with the given owner.
+        """
+        return self._relationships.filter(pl.col("owner") == owner)
+
+    def get_stats(self, uid: int) -> dict[str, float]:
+        """Get the stat values of an archived relationship.
+
+        Parameters
+        ----------
+        uid
+            The UID of the relationship.
+
+        Returns
+        -------
+        dict[str, float]
+            Stat IDs mapped to the values of the stats when they were archived.
+        """
+        stats = self._stats.filter(pl.col("gameobject") == uid)
+        return dict(zip(stats["stat"], stats["value"]))
+
+    def get_traits(self, uid: int) -> list[str]:
+        """Get the display names of the traits of an archived relationship.
+
+        Parameters
+        ----------
+        uid
+            The UID of the relationship.
+
+        Returns
+        -------
+        list[str]
+            Trait display names.
+        """
+        return self._traits.filter(pl.col("gameobject") == uid)["trait"].to_list()
+
+    def add_rows(self, store: RelationshipStore, rows: Sequence[int]) -> None:
+        """Copy the data of relationships in a RelationshipStore into the archive.
+
+        The data is read from the store's columns, so no GameObjects are created for
+        the relationships. This does not remove the relationships from the store.
+
+        Parameters
+        ----------
+        store
+            The store containing the relationships.
+        rows
+            The rows of the relationships.
+        """
+        relationship_data: list[dict[str, Any]] = []
+        stat_data: list[dict[str, Any]] = []
+        trait_data: list[dict[str, Any]] = []
+
+        row_array = np.array(rows, dtype=np.int64)
+        stat_values = {
+            stat_id: column.get_values(row_array).tolist()
+            for stat_id, column in store.columns.items()
+        }
+
+        for i, row in enumerate(rows):
+            uid = store.get_uid(row)
+            owner, target = store.get_owner(row), store.get_target(row)
+
+            relationship_data.append(
+                {
+                    "uid": uid,
+                    "owner": owner.uid,
+                    "target": target.uid,
+                    # Match the name that a GameObject for the row would have
+                    "name": f"{owner.name} -> {target.name}({uid})",
+                }
+            )
+
+            for stat_id, values in stat_values.items():
+                stat_data.append(
+                    {"gameobject": uid, "stat": stat_id, "value": values[i]}
+                )
+
+            for trait in store.get_traits(row):
+                trait_data.append(
+                    {
+                        "gameobject": uid,
+                        "trait_uid": trait.uid,
+                        "trait": trait.get_component(Trait).display_name,
+                    }
+                )
+
+        self._append(relationship_data, stat_data, trait_data)
+
+    def add_relationships(self, relationships: Iterable[GameObject]) -> None:
+        """Copy the data of relationships into the archive.
+
+        This does not remove the relationships from the world.
+
+        Parameters
+        ----------
+        relationships
+            Relationship GameObjects.
+        """
+        relationship_data: list[dict[str, Any]] = []
+        stat_data: list[dict[str, Any]] = []
+        trait_data: list[dict[str, Any]] = []
+
+        for relationship in relationships:
+            relationship_component = relationship.get_component(Relationship)
+
+            relationship_data.append(
+                {
+                    "uid": relationship.uid,
+                    "owner": relationship_component.owner.uid,
+                    "target": relationship_component.target.uid,
+                    "name": relationship.name,
+                }
+            )
+
+            for stat_id, stat in relationship.get_component(Stats):
+                stat_data.append(
+                    {
+                        "gameobject": relationship.uid,
+                        "stat": stat_id,
+                        "value": stat.value,
+                    }
+                )
+
+            for trait in relationship.get_component(Traits).traits:
+                trait_data.append(
+                    {
+                        "gameobject": relationship.uid,
+                        "trait_uid": trait.uid,
+                        "trait": trait.get_component(Trait).display_name,
+                    }
+                )
+
+        self._append(relationship_data, stat_data, trait_data)
+
+    def _append(
+        self,
+        relationship_data: list[dict[str, Any]],
+        stat_data: list[dict[str, Any]],
+        trait_data: list[dict[str, Any]],
+    ) -> None:
+        """Add rows to the archive's data frames."""
+        self._relationships = pl.concat(
+            [
+                self._relationships,
+                pl.from_dicts(relationship_data, schema=self._relationships.schema),
+            ]
+        )
+        self._stats = pl.concat(
+            [self._stats, pl.from_dicts(stat_data, schema=self._stats.schema)]
+        )
+        self._traits = pl.concat(
+            [self._traits, pl.from_dicts(trait_data, schema=self._traits.schema)]
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the archive to a JSON-serializable dict."""
+        return {
+            "relationships": self._relationships.to_dict(as_series=False),
+            "stats": self._stats.to_dict(as_series=False),
+            "traits": self._traits.to_dict(as_series=False),
+        }
@@ -11,12 +11,15 @@ https://www.youtube.com/watch?v=SH25f3cXBVc.
 
 from __future__ import annotations
 
+import bisect
 import enum
 import math
 import sys
-from typing import Any, Iterator, Optional
+import threading
+from typing import Any, ClassVar, Iterable, Iterator, Optional, Sequence, cast
 
 import attrs
+import numpy as np
 
 from neighborly.ecs import Component
 
@@ -38,11 +41,21 @@ class Stat:
         "_base_value",
         "_value",
         "_modifiers",
+        "_modifier_orders",
+        "_modifiers_by_source",
+        "_flat_total",
+        "_percent_add_total",
+        "_percent_multiply_product",
+        "_is_ordered",
         "_is_dirty",
+        "_normalized",
         "_min_value",
         "_max_value",
         "_is_bounded",
         "_is_discrete",
+        "_owner",
+        "_column",
+        "_row",
     )
 
     _base_value: float
@@ -50,13 +63,36 @@ class Stat:
     _value: float
     """The final score of the stat clamped between the min and max values."""
     _modifiers: list[StatModifier]
-    """Active stat modifiers."""
+    """Active stat modifiers sorted by order."""
+    _modifier_orders: list[int]
+    """The order of each modifier in _modifiers (used for binary search)."""
+    _modifiers_by_source: dict[object, list[StatModifier]]
+    """Modifier sources mapped to the modifiers they added."""
+    _flat_total: float
+    """The sum of all FLAT modifiers."""
+    _percent_add_total: float
+    """The sum of all PERCENT_ADD modifiers."""
+    _percent_multiply_product: float
+    """The product of (1 + value) for all PERCENT_MULTIPLY modifiers."""
+    _is_ordered: bool
+    """Do custom modifier orders interleave modifier types.
+
+    If True, the totals cannot be used, and modifiers are applied one at a time.
+    """
+    _normalized: Optional[float]
+    """The cached normalized value (None if it needs to be calculated)."""
     _min_value: float
     """The minimum score the overall stat is clamped to."""
     _max_value: float
     """The maximum score the overall stat is clamped to."""
     _is_discrete: bool
     """Should the final calculated stat value be converted to an int."""
+    _owner: Optional[Stats]
+    """The Stats component that contains this stat."""
+    _column: Optional[StatColumn]
+    """The column storing the stat's base value and final value (if any)."""
+    _row: int
+    """The stat's row within its column."""
 
     def __init__(
         self,
@@ -67,8 +103,18 @@ class Stat:
         self._base_value = base_value
         self._value = base_value
         self._modifiers = []
+        self._modifier_orders = []
+        self._modifiers_by_source = {}
+        self._flat_total = 0.0
+        self._percent_add_total = 0.0
+        self._percent_multiply_product = 1.0
+        self._is_ordered = False
         self._is_dirty = False
+        self._normalized = None
         self._is_discrete = is_discrete
+        self._owner = None
+        self._column = None
+        self._row = -1
 
         if bounds is None:
             self._min_value = sys.float_info.min
@@ -81,21 +127,106 @@ class Stat:
     @property
     def base_value(self) -> float:
         """Get the base value of the relationship stat."""
+        if self._column is not None:
+            return float(self._column.base_values[self._row])
         return self._base_value
 
     @base_value.setter
     def base_value(self, value: float) -> None:
         """Set the base value of the relationship stat."""
-        self._base_value = value
-        self._is_dirty = True
+        if self._column is not None:
+            self._column.base_values[self._row] = value
+        else:
+            self._base_value = value
+        self._mark_dirty()
 
     @property
     def value(self) -> float:
         """Get the final calculated value of the stat."""
+        if self._column is not None:
+            if self._column.is_dirty[self._row]:
+                self.recalculate_value()
+            return float(self._column.values[self._row])
+
         if self._is_dirty:
             self.recalculate_value()
         return self._value
 
+    @property
+    def modifiers(self) -> Sequence[StatModifier]:
+        """Active stat modifiers in order of application."""
+        return self._modifiers
+
+    @property
+    def column(self) -> Optional[StatColumn]:
+        """The column storing this stat's data (None if the stat stores its own)."""
+        return self._column
+
+    @property
+    def owner(self) -> Optional[Stats]:
+        """The Stats component that contains this stat."""
+        return self._owner
+
+    @owner.setter
+    def owner(self, value: Optional[Stats]) -> None:
+        """Set the Stats component that contains this stat."""
+        self._owner = value
+
+    def _mark_dirty(self) -> None:
+        """Flag the value for recalculation and record the change on the owner."""
+        if self._column is not None:
+            self._column.is_dirty[self._row] = True
+        else:
+            self._is_dirty = True
+
+        if self._owner is not None:
+            self._owner.mark_changed()
+
+    def _on_modifiers_changed(self) -> None:
+        """Update the column's modifier totals and flag the value as dirty."""
+        if self._column is not None:
+            self._write_modifier_totals()
+        self._mark_dirty()
+
+    def _write_modifier_totals(self) -> None:
+        """Copy the modifier totals into the stat's column row."""
+        column = cast(StatColumn, self._column)
+        column.flat_totals[self._row] = self._flat_total
+        column.percent_add_totals[self._row] = self._percent_add_total
+        column.percent_multiply_products[self._row] = self._percent_multiply_product
+        column.is_ordered[self._row] = self._is_ordered
+
+    def attach(self, column: StatColumn, row: int) -> None:
+        """Move the stat's data into a row of a column.
+
+        Parameters
+        ----------
+        column
+            The column to store the stat's data in.
+        row
+            The row to use.
+        """
+        if self._column is not None:
+            self.detach()
+
+        column.bind(row, self)
+        self._column = column
+        self._row = row
+        self._write_modifier_totals()
+
+    def detach(self) -> None:
+        """Move the stat's data out of its column and back into the stat."""
+        if self._column is None:
+            return
+
+        self._base_value = float(self._column.base_values[self._row])
+        self._value = float(self._column.values[self._row])
+        self._is_dirty = bool(self._column.is_dirty[self._row])
+        self._normalized = None
+        self._column.unbind(self._row, self)
+        self._column = None
+        self._row = -1
+
     @property
     def is_bounded(self) -> bool:
         """Returns True if the stat has min and max values."""
@@ -113,9 +244,132 @@ class Stat:
 
     def add_modifier(self, modifier: StatModifier) -> None:
         """Add a modifier to the stat."""
-        self._modifiers.append(modifier)
-        self._modifiers.sort(key=lambda m: m.order)
-        self._is_dirty = True
+        # Modifiers with equal orders stay in the order they were added
+        index = bisect.bisect_right(self._modifier_orders, modifier.order)
+        self._modifiers.insert(index, modifier)
+        self._modifier_orders.insert(index, modifier.order)
+
+        try:
+            self._modifiers_by_source.setdefault(modifier.source, []).append(modifier)
+        except TypeError:
+            # Unhashable sources are found by searching all modifiers
+            pass
+
+        if modifier.modifier_type == StatModifierType.FLAT:
+            self._flat_total += modifier.value
+        elif modifier.modifier_type == StatModifierType.PERCENT_ADD:
+            self._percent_add_total += modifier.value
+        else:
+            self._percent_multiply_product *= 1 + modifier.value
+
+        self._is_ordered = self._is_ordered or self._breaks_grouping(index)
+
+        self._on_modifiers_changed()
+
+    def _breaks_grouping(self, index: int) -> bool:
+        """Check if a new modifier interleaves modifier types.
+
+        The totals can only be used when all FLAT modifiers come first and the
+        PERCENT_ADD modifiers are next to each other.
+
+        Parameters
+        ----------
+        index
+            The index of the new modifier.
+
+        Returns
+        -------
+        bool
+            True if the modifiers must be applied one at a time.
+        """
+        modifier_type = self._modifiers[index].modifier_type
+        previous_type = self._modifiers[index - 1].modifier_type if index > 0 else None
+        next_type = (
+            self._modifiers[index + 1].modifier_type
+            if index + 1 < len(self._modifiers)
+            else None
+        )
+
+        if modifier_type == StatModifierType.FLAT:
+            return previous_type is not None and previous_type != modifier_type
+
+        if next_type == StatModifierType.FLAT:
+            return True
+
+        if modifier_type == StatModifierType.PERCENT_ADD:
+            # Starting a second group of PERCENT_ADD modifiers
+            return (
+                previous_type != StatModifierType.PERCENT_ADD
+                and next_type != StatModifierType.PERCENT_ADD
+                and any(
+                    m.modifier_type == StatModifierType.PERCENT_ADD
+                    for m in self._modifiers
+                    if m is not self._modifiers[index]
+                )
+            )
+
+        # Splitting a group of PERCENT_ADD modifiers
+        return previous_type == next_type == StatModifierType.PERCENT_ADD
+
+    def _remove_modifiers(self, modifiers: Iterable[StatModifier]) -> None:
+        """Remove modifier instances and recalculate the totals."""
+        for modifier in modifiers:
+            # Only modifiers with the same order need to be searched
+            start = bisect.bisect_left(self._modifier_orders, modifier.order)
+            end = bisect.bisect_right(self._modifier_orders, modifier.order, start)
+
+            for index in range(start, end):
+                if self._modifiers[index] is modifier:
+                    del self._modifiers[index]
+                    del self._modifier_orders[index]
+                    break
+
+            try:
+                source_modifiers = self._modifiers_by_source.get(modifier.source)
+            except TypeError:
+                continue
+
+            if source_modifiers is not None:
+                source_modifiers[:] = [m for m in source_modifiers if m is not modifier]
+                if not source_modifiers:
+                    del self._modifiers_by_source[modifier.source]
+
+        self._recalculate_modifier_totals()
+        self._on_modifiers_changed()
+
+    def _recalculate_modifier_totals(self) -> None:
+        """Recalculate the modifier totals from scratch.
+
+        Totals are recalculated after removals (instead of subtracting) so that
+        they do not accumulate floating-point error.
+        """
+        flat_total = 0.0
+        percent_add_total = 0.0
+        percent_multiply_product = 1.0
+        is_ordered = False
+        previous_type = StatModifierType.FLAT
+
+        for modifier in self._modifiers:
+            modifier_type = modifier.modifier_type
+
+            if modifier_type == StatModifierType.FLAT:
+                flat_total += modifier.value
+                is_ordered = is_ordered or previous_type != StatModifierType.FLAT
+            elif modifier_type == StatModifierType.PERCENT_ADD:
+                is_ordered = is_ordered or (
+                    percent_add_total != 0.0
+                    and previous_type != StatModifierType.PERCENT_ADD
+                )
+                percent_add_total += modifier.value
+            else:
+                percent_multiply_product *= 1 + modifier.value
+
+            previous_type = modifier_type
+
+        self._flat_total = flat_total
+        self._percent_add_total = percent_add_total
+        self._percent_multiply_product = percent_multiply_product
+        self._is_ordered = is_ordered
 
     def remove_modifier(self, modifier: StatModifier) -> bool:
         """Remove a modifier from the stat.
@@ -130,12 +384,15 @@ class Stat:
         bool
             True if the modifier was removed, False otherwise.
         """
-        try:
-            self._modifiers.remove(modifier)
-            self._is_dirty = True
-            return True
-        except ValueError:
-            return False
+        start = bisect.bisect_left(self._modifier_orders, modifier.order)
+        end = bisect.bisect_right(self._modifier_orders, modifier.order, start)
+
+        for index in range(start, end):
+            if self._modifiers[index] == modifier:
+                self._remove_modifiers((self._modifiers[index],))
+                return True
+
+        return False
 
     def remove_modifiers_from_source(self, source: object) -> bool:
         """Remove all modifiers applied from the given source.
@@ -150,15 +407,16 @@ class Stat:
         bool
             True if any modifiers were removed, False otherwise.
         """
-        did_remove: bool = False
+        try:
+            modifiers = list(self._modifiers_by_source.get(source, ()))
+        except TypeError:
+            modifiers = [m for m in self._modifiers if m.source == source]
 
-        for modifier in [*self._modifiers]:
-            if modifier.source == source:
-                self._is_dirty = True
-                did_remove = True
-                self._modifiers.remove(modifier)
+        if modifiers:
+            self._remove_modifiers(modifiers)
+            return True
 
-        return did_remove
+        return False
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize the stat to a dict for data analysis."""
@@ -169,7 +427,42 @@ class Stat:
     def recalculate_value(self) -> None:
         """Recalculate the stat's value due to a previous change."""
 
-        final_value: float = self._base_value
+        if not self._is_ordered:
+            final_value = self._calculate_from_totals()
+        else:
+            final_value = self._calculate_in_order()
+
+        if self._is_bounded:
+            final_value = max(self._min_value, min(self._max_value, final_value))
+
+        if self._is_discrete:
+            final_value = float(math.trunc(final_value))
+
+        if self._column is not None:
+            self._column.values[self._row] = final_value
+            self._column.normalized_values[self._row] = (
+                self._normalize(final_value) if self._is_bounded else 0.0
+            )
+            self._column.is_dirty[self._row] = False
+        else:
+            self._value = final_value
+            self._normalized = None
+            self._is_dirty = False
+
+    def _calculate_from_totals(self) -> float:
+        """Calculate the stat's unclamped value using the modifier totals."""
+        if not self._modifiers:
+            return self.base_value
+
+        return (
+            (self.base_value + self._flat_total)
+            * (1 + self._percent_add_total)
+            * self._percent_multiply_product
+        )
+
+    def _calculate_in_order(self) -> float:
+        """Calculate the stat's unclamped value by applying modifiers in order."""
+        final_value: float = self.base_value
         sum_percent_add: float = 0.0
 
         for i, modifier in enumerate(self._modifiers):
@@ -190,23 +483,33 @@ class Stat:
             elif modifier.modifier_type == StatModifierType.PERCENT_MULTIPLY:
                 final_value *= 1 + modifier.value
 
-        self._value = final_value
+        return final_value
 
-        if self._is_bounded:
-            self._value = max(self._min_value, min(self._max_value, self._value))
+    @property
+    def normalized(self) -> float:
+        """Get the normalized value from 0.0 to 1.0.
 
-        if self._is_discrete:
-            self._value = float(math.trunc(self._value))
+        The normalized value is cached until the stat's value changes.
+        """
+        if not self._is_bounded:
+            raise ValueError("Cannot calculate normalized value of an unbound stat.")
 
-        self._is_dirty = False
+        if self._column is not None:
+            if self._column.is_dirty[self._row]:
+                self.recalculate_value()
+            return float(self._column.normalized_values[self._row])
 
-    @property
-    def normalized(self) -> float:
-        """Get the normalized value from 0.0 to 1.0."""
-        if self.is_bounded:
-            return (self.value - self._min_value) / (self._max_value - self._min_value)
+        if self._is_dirty:
+            self.recalculate_value()
+
+        if self._normalized is None:
+            self._normalized = self._normalize(self._value)
 
-        raise ValueError("Cannot calculate normalized value of an unbound stat.")
+        return self._normalized
+
+    def _normalize(self, value: float) -> float:
+        """Scale a value using the stat's bounds."""
+        return (value - self._min_value) / (self._max_value - self._min_value)
 
     def __str__(self) -> str:
         return str(self.value)
@@ -266,17 +569,497 @@ class StatModifier:
         }
 
 
+class StatColumn:
+    """Columnar storage for every instance of a single stat ID.
+
+    Each row holds one stat's base value, final value, bounds, and running totals of
+    its modifiers, and rows are indexed by the owning GameObject's slot index. The
+    Stat instances bound to the column remain the public interface to the data.
+    """
+
+    __slots__ = (
+        "_stat_id",
+        "_stats",
+        "base_values",
+        "values",
+        "normalized_values",
+        "flat_totals",
+        "percent_add_totals",
+        "percent_multiply_products",
+        "min_values",
+        "max_values",
+        "is_bounded",
+        "is_discrete",
+        "is_dirty",
+        "is_ordered",
+        "is_bound",
+    )
+
+    _stat_id: str
+    """The ID of the stats stored in the column."""
+    _stats: list[Optional[Stat]]
+    """The Stat instance bound to each row."""
+    base_values: np.ndarray
+    """The base value of each stat."""
+    values: np.ndarray
+    """The last calculated final value of each stat."""
+    normalized_values: np.ndarray
+    """The final value of each bounded stat scaled to [0.0, 1.0] using its bounds.
+
+    Unbounded stats have a normalized value of 0.0.
+    """
+    flat_totals: np.ndarray
+    """The sum of each stat's FLAT modifiers."""
+    percent_add_totals: np.ndarray
+    """The sum of each stat's PERCENT_ADD modifiers."""
+    percent_multiply_products: np.ndarray
+    """The product of (1 + value) for each stat's PERCENT_MULTIPLY modifiers."""
+    min_values: np.ndarray
+    """The lower bound of each stat."""
+    max_values: np.ndarray
+    """The upper bound of each stat."""
+    is_bounded: np.ndarray
+    """True for stats that are clamped to their bounds."""
+    is_discrete: np.ndarray
+    """True for stats whose final values are truncated to integers."""
+    is_dirty: np.ndarray
+    """True for stats whose final values need to be recalculated."""
+    is_ordered: np.ndarray
+    """True for stats with modifiers whose custom orders interleave modifier types.
+
+    These stats cannot use the modifier totals and are recalculated one at a time.
+    """
+    is_bound: np.ndarray
+    """True for rows that are bound to stats."""
+
+    def __init__(self, stat_id: str, capacity: int = 64) -> None:
+        self._stat_id = stat_id
+        self._stats = [None] * capacity
+        self.base_values = np.zeros(capacity, dtype=np.float64)
+        self.values = np.zeros(capacity, dtype=np.float64)
+        self.normalized_values = np.zeros(capacity, dtype=np.float64)
+        self.flat_totals = np.zeros(capacity, dtype=np.float64)
+        self.percent_add_totals = np.zeros(capacity, dtype=np.float64)
+        self.percent_multiply_products = np.ones(capacity, dtype=np.float64)
+        self.min_values = np.zeros(capacity, dtype=np.float64)
+        self.max_values = np.zeros(capacity, dtype=np.float64)
+        self.is_bounded = np.zeros(capacity, dtype=np.bool_)
+        self.is_discrete = np.zeros(capacity, dtype=np.bool_)
+        self.is_dirty = np.zeros(capacity, dtype=np.bool_)
+        self.is_ordered = np.zeros(capacity, dtype=np.bool_)
+        self.is_bound = np.zeros(capacity, dtype=np.bool_)
+
+    @property
+    def stat_id(self) -> str:
+        """The ID of the stats stored in the column."""
+        return self._stat_id
+
+    @property
+    def capacity(self) -> int:
+        """The number of rows allocated for the column."""
+        return len(self._stats)
+
+    def get_stat(self, row: int) -> Optional[Stat]:
+        """Get the Stat instance bound to a row.
+
+        Parameters
+        ----------
+        row
+            A row index.
+
+        Returns
+        -------
+        Stat or None
+            The stat bound to the row, or None if the row is unused.
+        """
+        if row >= len(self._stats):
+            return None
+        return self._stats[row]
+
+    def get_rows(self) -> np.ndarray:
+        """Get the indices of rows that are bound to stats."""
+        return np.flatnonzero(self.is_bound)
+
+    def get_bound_mask(self, rows: np.ndarray) -> np.ndarray:
+        """Check which of several rows are bound to stats.
+
+        Parameters
+        ----------
+        rows
+            Row indices. Rows beyond the column's capacity are not bound.
+
+        Returns
+        -------
+        np.ndarray
+            A boolean array that is True for rows bound to stats.
+        """
+        mask = np.zeros(len(rows), dtype=np.bool_)
+        in_range = rows < len(self._stats)
+        mask[in_range] = self.is_bound[rows[in_range]]
+        return mask
+
+    def _grow(self, min_capacity: int) -> None:
+        """Increase the number of rows to at least the given capacity."""
+        capacity = max(min_capacity, 2 * len(self._stats))
+        extra = capacity - len(self._stats)
+
+        self._stats.extend([None] * extra)
+
+        for name in (
+            "base_values",
+            "values",
+            "normalized_values",
+            "flat_totals",
+            "percent_add_totals",
+            "min_values",
+            "max_values",
+            "is_bounded",
+            "is_discrete",
+            "is_dirty",
+            "is_ordered",
+            "is_bound",
+        ):
+            array: np.ndarray = getattr(self, name)
+            setattr(
+                self, name, np.concatenate((array, np.zeros(extra, dtype=array.dtype)))
+            )
+
+        self.percent_multiply_products = np.concatenate(
+            (self.percent_multiply_products, np.ones(extra, dtype=np.float64))
+        )
+
+    def bind(self, row: int, stat: Stat) -> None:
+        """Copy a stat's data into a row.
+
+        Parameters
+        ----------
+        row
+            The row to store the stat in.
+        stat
+            The stat to store.
+
+        Notes
+        -----
+        This method is called by Stat.attach(). Stats previously bound to the row
+        (for example, stats of a deleted GameObject whose slot was reused) are
+        detached first.
+        """
+        if row >= len(self._stats):
+            self._grow(row + 1)
+
+        previous_stat = self._stats[row]
+        if previous_stat is not None and previous_stat is not stat:
+            previous_stat.detach()
+
+        self._stats[row] = stat
+        self.base_values[row] = stat.base_value
+        self.values[row] = stat.value
+        self.min_values[row], self.max_values[row] = stat.bounds
+        self.is_bounded[row] = stat.is_bounded
+        self.is_discrete[row] = stat.is_discrete
+        self.normalized_values[row] = stat.normalized if stat.is_bounded else 0.0
+        self.is_dirty[row] = False
+        self.is_bound[row] = True
+
+    def unbind(self, row: int, stat: Stat) -> None:
+        """Clear a row.
+
+        Parameters
+        ----------
+        row
+            The row to clear.
+        stat
+            The stat bound to the row.
+        """
+        if self._stats[row] is stat:
+            self._stats[row] = None
+            self.is_dirty[row] = False
+            self.is_bound[row] = False
+
+    def get_values(self, rows: np.ndarray) -> np.ndarray:
+        """Get the final values of several stats, recalculating them if needed.
+
+        Parameters
+        ----------
+        rows
+            Row indices.
+
+        Returns
+        -------
+        np.ndarray
+            The final value of the stat in each row.
+        """
+        self._recalculate_rows(rows[self.is_dirty[rows]])
+        return self.values[rows]
+
+    def get_normalized(self, rows: np.ndarray) -> np.ndarray:
+        """Get the normalized values of several stats, recalculating them if needed.
+
+        Parameters
+        ----------
+        rows
+            Row indices.
+
+        Returns
+        -------
+        np.ndarray
+            The normalized value of the stat in each row.
+        """
+        self._recalculate_rows(rows[self.is_dirty[rows]])
+        return self.normalized_values[rows]
+
+    def _normalize(self, rows: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """Scale the values of bounded stats to [0.0, 1.0] using their bounds."""
+        min_values = self.min_values[rows]
+        ranges = self.max_values[rows] - min_values
+
+        return np.divide(
+            values - min_values,
+            ranges,
+            out=np.zeros(len(rows), dtype=np.float64),
+            where=self.is_bounded[rows] & (ranges != 0),
+        )
+
+    def set_base_values(self, rows: np.ndarray, values: np.ndarray) -> None:
+        """Set the base values of several stats.
+
+        Parameters
+        ----------
+        rows
+            Row indices.
+        values
+            The new base value of the stat in each row.
+        """
+        self.base_values[rows] = values
+        self.is_dirty[rows] = True
+
+    def recalculate_all(self) -> None:
+        """Recalculate the final values of all dirty stats in the column."""
+        self._recalculate_rows(np.flatnonzero(self.is_dirty))
+
+    def _recalculate_rows(self, rows: np.ndarray) -> None:
+        """Recalculate the final values of the stats in the given rows."""
+        if len(rows) == 0:
+            return
+
+        ordered_rows = rows[self.is_ordered[rows]]
+        rows = rows[~self.is_ordered[rows]]
+
+        values = (
+            (self.base_values[rows] + self.flat_totals[rows])
+            * (1 + self.percent_add_totals[rows])
+            * self.percent_multiply_products[rows]
+        )
+        values = np.where(
+            self.is_bounded[rows],
+            np.clip(values, self.min_values[rows], self.max_values[rows]),
+            values,
+        )
+        values = np.where(self.is_discrete[rows], np.trunc(values), values)
+
+        self.values[rows] = values
+        self.normalized_values[rows] = self._normalize(rows, values)
+        self.is_dirty[rows] = False
+
+        for row in ordered_rows:
+            stat = self._stats[row]
+            if stat is not None:
+                stat.recalculate_value()
+
+
+class StatStore:
+    """A shared resource that stores stats in columns instead of individual objects.
+
+    When this resource is in the world, Stats components move the data of their
+    stats into one column per stat ID. Then, recalculate_all() updates every dirty
+    stat with a few array operations.
+    """
+
+    __slots__ = ("_columns",)
+
+    _columns: dict[str, StatColumn]
+    """Stat IDs mapped to their columns."""
+
+    def __init__(self) -> None:
+        self._columns = {}
+
+    @property
+    def columns(self) -> dict[str, StatColumn]:
+        """Stat IDs mapped to their columns."""
+        return self._columns
+
+    def get_column(self, stat_id: str) -> StatColumn:
+        """Get the column for a stat ID, creating it if it does not exist.
+
+        Parameters
+        ----------
+        stat_id
+            A stat ID.
+
+        Returns
+        -------
+        StatColumn
+            The column.
+        """
+        if column := self._columns.get(stat_id):
+            return column
+
+        column = StatColumn(stat_id)
+        self._columns[stat_id] = column
+        return column
+
+    def recalculate_all(self) -> None:
+        """Recalculate the final values of all dirty stats."""
+        for column in self._columns.values():
+            column.recalculate_all()
+
+
+class StatSchema:
+    """Interns stat IDs as small integer slots.
+
+    Every Stats component stores its stats in a list indexed by these slots. Hot code
+    can look up a slot once (for example, at import time) and then call
+    Stats.get_stat_by_slot() instead of using string IDs. Slots are assigned in the
+    order stat IDs are first seen, so they are only valid within a single process.
+    """
+
+    _slots: ClassVar[dict[str, int]] = {}
+    """Stat IDs mapped to their slots."""
+    _stat_ids: ClassVar[list[str]] = []
+    """Stat IDs ordered by slot."""
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+    """Prevents systems running concurrently from assigning the same slot twice."""
+
+    @classmethod
+    def get_slot(cls, stat_id: str) -> int:
+        """Get the slot of a stat ID, assigning a new slot if needed.
+
+        Parameters
+        ----------
+        stat_id
+            A stat ID.
+
+        Returns
+        -------
+        int
+            The stat's slot.
+        """
+        slot = cls._slots.get(stat_id)
+
+        if slot is not None:
+            return slot
+
+        with cls._lock:
+            if stat_id not in cls._slots:
+                cls._slots[stat_id] = len(cls._stat_ids)
+                cls._stat_ids.append(stat_id)
+
+            return cls._slots[stat_id]
+
+    @classmethod
+    def try_slot(cls, stat_id: str) -> Optional[int]:
+        """Get the slot of a stat ID without assigning a new slot.
+
+        Parameters
+        ----------
+        stat_id
+            A stat ID.
+
+        Returns
+        -------
+        int or None
+            The stat's slot, or None if the stat ID does not have one.
+        """
+        return cls._slots.get(stat_id)
+
+    @classmethod
+    def get_stat_id(cls, slot: int) -> str:
+        """Get the stat ID assigned to a slot.
+
+        Parameters
+        ----------
+        slot
+            A slot.
+
+        Returns
+        -------
+        str
+            The stat ID.
+        """
+        return cls._stat_ids[slot]
+
+
 class Stats(Component):
-    """Tracks all the various stats for a GameObject."""
+    """Tracks all the various stats for a GameObject.
 
-    __slots__ = ("_stats",)
+    Stats are stored in a list indexed by their StatSchema slots. Changes to the
+    contained stats mark this component as changed, so systems can use Changed[Stats]
+    query filters. If the world has a StatStore resource, the stats' data is stored
+    in the StatStore's columns while the component is attached to a GameObject.
+    """
+
+    __slots__ = ("_stats", "_slots")
 
-    _stats: dict[str, Stat]
-    """Map of Stat IDs to Stat instances."""
+    _stats: list[Optional[Stat]]
+    """Stat instances indexed by their StatSchema slots."""
+    _slots: list[int]
+    """The slots of the stats in the order they were added."""
 
     def __init__(self) -> None:
         super().__init__()
-        self._stats = {}
+        self._stats = []
+        self._slots = []
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Slots are assigned per process, so stats are saved using their string IDs
+        state = {
+            name: getattr(self, name)
+            for name in ("_gameobject", "_has_gameobject")
+            if hasattr(self, name)
+        }
+        state["stats"] = [
+            (StatSchema.get_stat_id(slot), self._stats[slot]) for slot in self._slots
+        ]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self._stats = []
+        self._slots = []
+
+        for name, value in state.items():
+            if name != "stats":
+                setattr(self, name, value)
+
+        for stat_id, stat in state["stats"]:
+            self._set_stat(StatSchema.get_slot(stat_id), stat)
+
+    def _set_stat(self, slot: int, stat: Stat) -> None:
+        """Store a stat in a slot."""
+        if slot >= len(self._stats):
+            self._stats.extend([None] * (slot + 1 - len(self._stats)))
+
+        if self._stats[slot] is None:
+            self._slots.append(slot)
+
+        self._stats[slot] = stat
+
+    def _get_stat_store(self) -> Optional[StatStore]:
+        """Get the world's StatStore if this component is attached to a GameObject."""
+        try:
+            gameobject = self._gameobject
+        except AttributeError:
+            return None
+
+        return gameobject.world.resource_manager.try_resource(StatStore)
+
+    def on_add(self) -> None:
+        if store := self._get_stat_store():
+            for stat_id, stat in self:
+                stat.attach(store.get_column(stat_id), self.gameobject.index)
+
+    def on_remove(self) -> None:
+        for _, stat in self:
+            stat.detach()
 
     def add_stat(self, stat_id: str, stat: Stat) -> None:
         """Add a new stat.
@@ -288,7 +1071,13 @@ class Stats(Component):
         stat
             A stat instance.
         """
-        self._stats[stat_id] = stat
+        self._set_stat(StatSchema.get_slot(stat_id), stat)
+        stat.owner = self
+
+        if store := self._get_stat_store():
+            stat.attach(store.get_column(stat_id), self.gameobject.index)
+
+        self.mark_changed()
 
     def has_stat(self, stat_id: str) -> bool:
         """Check if a stat exists.
@@ -303,7 +1092,12 @@ class Stats(Component):
         bool
             True if the character has a stat mapped to the ID, False otherwise.
         """
-        return stat_id in self._stats
+        slot = StatSchema.try_slot(stat_id)
+        return (
+            slot is not None
+            and slot < len(self._stats)
+            and self._stats[slot] is not None
+        )
 
     def get_stat(self, stat_id: str) -> Stat:
         """Get a stat.
@@ -318,7 +1112,35 @@ class Stats(Component):
         Stat
             The Stat instance associated with the given ID.
         """
-        return self._stats[stat_id]
+        slot = StatSchema.try_slot(stat_id)
+
+        if slot is None:
+            raise KeyError(stat_id)
+
+        return self.get_stat_by_slot(slot)
+
+    def get_stat_by_slot(self, slot: int) -> Stat:
+        """Get a stat using its StatSchema slot.
+
+        Parameters
+        ----------
+        slot
+            The slot of a stat ID.
+
+        Returns
+        -------
+        Stat
+            The Stat instance in the slot.
+        """
+        try:
+            stat = self._stats[slot]
+        except IndexError:
+            stat = None
+
+        if stat is None:
+            raise KeyError(StatSchema.get_stat_id(slot))
+
+        return stat
 
     def remove_stat(self, stat_id: str) -> bool:
         """Remove a stat.
@@ -333,14 +1155,22 @@ class Stats(Component):
         bool
             True if the stat was removed successfully, False otherwise.
         """
-        if stat_id in self._stats:
-            del self._stats[stat_id]
-            return True
+        if not self.has_stat(stat_id):
+            return False
 
-        return False
+        slot = StatSchema.get_slot(stat_id)
+        stat = cast(Stat, self._stats[slot])
+        self._stats[slot] = None
+        self._slots.remove(slot)
+
+        stat.detach()
+        stat.owner = None
+        self.mark_changed()
+        return True
 
     def __iter__(self) -> Iterator[tuple[str, Stat]]:
-        return iter(self._stats.items())
+        for slot in self._slots:
+            yield StatSchema.get_stat_id(slot), cast(Stat, self._stats[slot])
 
     def to_dict(self) -> dict[str, Any]:
-        return {stat_id: stat.value for stat_id, stat in self._stats.items()}
+        return {stat_id: stat.value for stat_id, stat in self}
@@ -6,7 +6,7 @@ This module contains class definitions for implementing the trait system.
 
 from __future__ import annotations
 
-from typing import Any, Iterable
+from typing import Any, Iterable, Optional
 
 from ordered_set import OrderedSet
 
@@ -121,20 +121,81 @@ class Trait(Component):
         }
 
 
+class TraitIndex:
+    """Tracks which of a collection of GameObjects have each trait.
+
+    GameObjects are stored in the index using a key, such as the target of a
+    relationship. Traits components bound to the index keep it up-to-date.
+    """
+
+    __slots__ = ("_keys",)
+
+    _keys: dict[str, dict[GameObject, None]]
+    """Trait IDs mapped to the keys of the GameObjects with that trait."""
+
+    def __init__(self) -> None:
+        self._keys = {}
+
+    def add(self, trait_id: str, key: GameObject) -> None:
+        """Record that the GameObject with the given key has a trait."""
+        self._keys.setdefault(trait_id, {})[key] = None
+
+    def remove(self, trait_id: str, key: GameObject) -> None:
+        """Record that the GameObject with the given key no longer has a trait."""
+        if keys := self._keys.get(trait_id):
+            keys.pop(key, None)
+
+    def remove_key(self, key: GameObject) -> None:
+        """Remove a key from the index."""
+        for keys in self._keys.values():
+            keys.pop(key, None)
+
+    def has(self, trait_id: str, key: GameObject) -> bool:
+        """Check if the GameObject with the given key has a trait."""
+        return key in self._keys.get(trait_id, ())
+
+    def get_keys(self, *trait_ids: str) -> list[GameObject]:
+        """Get the keys of all GameObjects with the given traits.
+
+        Parameters
+        ----------
+        *trait_ids
+            The IDs of traits.
+
+        Returns
+        -------
+        list[GameObject]
+            Keys of GameObjects with all the traits in the order the first trait
+            was added to them.
+        """
+        keys = [self._keys.get(trait_id, {}) for trait_id in trait_ids]
+
+        if not keys:
+            return []
+
+        return [key for key in keys[0] if all(key in k for k in keys[1:])]
+
+
 class Traits(Component):
     """Tracks the traits attached to a GameObject."""
 
-    __slots__ = "_traits", "_conflicting_traits"
+    __slots__ = "_traits", "_conflicting_traits", "_index", "_index_key"
 
     _traits: OrderedSet[GameObject]
     """References to traits attached to the GameObject."""
     _conflicting_traits: set[str]
     """IDs of all traits that conflict with the equipped traits."""
+    _index: Optional[TraitIndex]
+    """An index updated when traits are added or removed."""
+    _index_key: Optional[GameObject]
+    """The key of this GameObject within the index."""
 
     def __init__(self) -> None:
         super().__init__()
         self._traits = OrderedSet([])
         self._conflicting_traits = set()
+        self._index = None
+        self._index_key = None
 
     @property
     def traits(self) -> Iterable[GameObject]:
@@ -145,6 +206,22 @@ class Traits(Component):
         """Check if a trait is present."""
         return trait in self._traits
 
+    def bind_index(self, index: TraitIndex, key: GameObject) -> None:
+        """Keep an index up-to-date with the traits of this GameObject.
+
+        Parameters
+        ----------
+        index
+            The index to update.
+        key
+            The key of this GameObject within the index.
+        """
+        self._index = index
+        self._index_key = key
+
+        for trait in self._traits:
+            index.add(trait.get_component(Trait).definition_id, key)
+
     def add_trait(self, trait: GameObject) -> bool:
         """Add a trait to the tracker.
 
@@ -170,9 +247,29 @@ class Traits(Component):
         self._conflicting_traits = self._conflicting_traits.union(
             trait.get_component(Trait).conflicting_traits
         )
+        if self._index is not None and self._index_key is not None:
+            self._index.add(trait.get_component(Trait).definition_id, self._index_key)
         trait.get_component(Trait).apply(self.gameobject)
         return True
 
+    def restore_trait(self, trait: GameObject) -> None:
+        """Add a trait without applying its effects.
+
+        This is used to rebuild a GameObject whose trait effects are already
+        reflected in its other components.
+
+        Parameters
+        ----------
+        trait
+            A trait to add.
+        """
+        self._traits.add(trait)
+        self._conflicting_traits = self._conflicting_traits.union(
+            trait.get_component(Trait).conflicting_traits
+        )
+        if self._index is not None and self._index_key is not None:
+            self._index.add(trait.get_component(Trait).definition_id, self._index_key)
+
     def remove_trait(self, trait: GameObject) -> bool:
         """Remove a trait from the tracker.
 
@@ -195,6 +292,11 @@ class Traits(Component):
                     remaining_trait.get_component(Trait).conflicting_traits
                 )
 
+            if self._index is not None and self._index_key is not None:
+                self._index.remove(
+                    trait.get_component(Trait).definition_id, self._index_key
+                )
+
             trait.get_component(Trait).remove(self.gameobject)
 
             return True
@@ -39,3 +39,21 @@ class SimulationConfig:
 
     settlement: Union[str, list[str]] = attrs.field(factory=list[str])
     """Settlement definition ID to instantiate during simulation initialization."""
+
+    component_storage: str = "esper"
+    """The backend used to store component data ("esper" or "archetype")."""
+
+    profile_systems: bool = False
+    """Toggles recording per-system update times in the SystemProfiler resource."""
+
+    queue_events: bool = False
+    """Toggles sending events to listeners in batches at the end of each phase."""
+
+    columnar_stats: bool = False
+    """Toggles storing stat data in a StatStore resource with one array per stat."""
+
+    compact_relationships: bool = False
+    """Toggles storing relationships in a RelationshipStore instead of GameObjects."""
+
+    archive_relationships: bool = False
+    """Toggles moving relationships between inactive GameObjects to an archive."""
@@ -18,14 +18,18 @@ import tqdm
 from neighborly.components.business import Business, JobRole, Occupation
 from neighborly.components.character import Character, Pregnant
 from neighborly.components.location import FrequentedLocations
-from neighborly.components.relationship import Relationship
+from neighborly.components.relationship import (
+    Relationship,
+    RelationshipArchive,
+    RelationshipStore,
+)
 from neighborly.components.residence import Resident, ResidentialUnit
 from neighborly.components.settlement import District, Settlement
 from neighborly.components.skills import Skill, Skills
 from neighborly.components.stats import Stats
 from neighborly.components.traits import Trait, Traits
 from neighborly.data_collection import DataTables
-from neighborly.ecs import Active, Component
+from neighborly.ecs import Active, Component, TagComponent
 from neighborly.life_event import GlobalEventHistory
 from neighborly.simulation import Simulation
 
@@ -194,6 +198,10 @@ def _tabulate_gameobject_data(
     all_tables
         The cumulative dict of tables that will become a SQl context
 
+    Notes
+    -----
+    Tag components are shared by all GameObjects, so their tables only list the UIDs
+    of the GameObjects with each tag and do not use the component table functions.
     """
     # Data rows for the "gameobjects" table
     gameobject_data: list[dict[str, Any]] = []
@@ -201,6 +209,9 @@ def _tabulate_gameobject_data(
     # Component instances separated by type name
     component_data: dict[str, list[Component]] = {}
 
+    # UIDs of GameObjects with each tag separated by type name
+    tag_data: dict[str, list[int]] = {}
+
     for obj in sim.world.gameobject_manager.gameobjects:
         gameobject_data.append(
             {
@@ -212,6 +223,10 @@ def _tabulate_gameobject_data(
 
         # Sort its components by category into the component_data dict
         for c in obj.get_components():
+            if isinstance(c, TagComponent):
+                tag_data.setdefault(c.__class__.__name__, []).append(obj.uid)
+                continue
+
             if c.__class__.__name__ not in component_data:
                 component_data[c.__class__.__name__] = []
             component_data[c.__class__.__name__].append(c)
@@ -226,6 +241,12 @@ def _tabulate_gameobject_data(
         else:
             all_tables[type_name] = _build_component_table(components)
 
+    for type_name, uids in tag_data.items():
+        if type_name in skipped_components:
+            continue
+
+        all_tables[type_name] = pl.DataFrame({"uid": uids}, schema={"uid": int})
+
     all_tables["gameobjects"] = pl.from_dicts(
         gameobject_data,
         schema={
@@ -555,6 +576,31 @@ def _build_settlement_table(components: list[Component]) -> pl.DataFrame:
     return pl.from_dicts(data, schema={"uid": int, "name": str, "population": int})
 
 
+def _tabulate_archived_relationships(
+    sim: Simulation, all_tables: dict[str, pl.DataFrame]
+) -> None:
+    """Add archived relationships to the gameobject and component tables."""
+    archive = sim.world.resource_manager.try_resource(RelationshipArchive)
+
+    if archive is None or archive.relationships.is_empty():
+        return
+
+    archived_tables = {
+        "gameobjects": archive.relationships.select(
+            "uid", pl.lit(False).alias("active"), "name"
+        ),
+        "Relationship": archive.relationships.select("owner", "target", "uid"),
+        "Stats": archive.stats,
+        "Traits": archive.traits,
+    }
+
+    for name, df in archived_tables.items():
+        if name in all_tables:
+            all_tables[name] = pl.concat([all_tables[name], df], how="diagonal")
+        else:
+            all_tables[name] = df
+
+
 def create_sql_db(
     sim: Simulation,
     component_table_builders: Optional[dict[str, ComponentTableFn]] = None,
@@ -579,6 +625,10 @@ def create_sql_db(
     # the steps below will add entries to this dict.
     all_tables: dict[str, pl.DataFrame] = {}
 
+    # Relationships only appear in the component tables if they have GameObjects
+    if store := sim.world.resource_manager.try_resource(RelationshipStore):
+        store.materialize_all()
+
     # First, we extract game object and component data. There will be one table that
     # hold information about the gameobjects themselves and each component type will
     # have a dedicated table. The format of the component tables may be overwritten
@@ -618,6 +668,10 @@ def create_sql_db(
         components_to_skip,
     )
 
+    # Archived relationships are no longer in the world, so their rows are added to
+    # the tables separately
+    _tabulate_archived_relationships(sim, all_tables)
+
     # Second, we tabulate the event data. This will create two additional tables. The
     # "events" table holds the event_type, event_id, and timestamp. The "event_roles"
     # table hold the names of event roles, UIDs of the gameobjects, and the event_ids.
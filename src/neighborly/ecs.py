@@ -4,7 +4,11 @@ This ECS implementation blends Unity-style GameObjects with the
 ECS logic from the Python esper library and the Bevy Game Engine.
 
 This ECS implementation is not thread-safe. It assumes that everything happens
-sequentially on the same thread.
+sequentially on the same thread. The only exception is SystemGroups that set
+``parallel = True``. They run systems with non-conflicting declared reads and writes
+concurrently, and it is up to those systems to declare their accesses accurately.
+The World's query counts and the change logs used by Added[...] and Changed[...]
+filters are guarded by locks, so concurrent systems can share them.
 
 Sources:
 
@@ -19,11 +23,18 @@ Sources:
 
 from __future__ import annotations
 
+import collections
 import logging
+import pathlib
+import random
+import threading
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     Any,
     Callable,
+    ClassVar,
     Iterable,
     Iterator,
     Optional,
@@ -34,11 +45,19 @@ from typing import (
     overload,
 )
 
+import attrs
 import esper
+import polars as pl
 from ordered_set import OrderedSet
 
 _LOGGER = logging.getLogger(__name__)
 
+ENTITY_INDEX_BITS = 32
+"""The number of low bits of a GameObject ID used for its slot index."""
+
+ENTITY_INDEX_MASK = (1 << ENTITY_INDEX_BITS) - 1
+"""Bit mask to extract the slot index from a GameObject ID."""
+
 _CT = TypeVar("_CT", bound="Component")
 _RT = TypeVar("_RT", bound="Any")
 _ST = TypeVar("_ST", bound="ISystem")
@@ -223,14 +242,20 @@ class GameObject:
         "_metadata",
         "_component_types",
         "_component_manager",
+        "_query_cache",
+        "_tag_index",
     )
 
     _id: int
     """A GameObject's unique ID."""
     _world: World
     """The world instance a GameObject belongs to."""
-    _component_manager: esper.World
-    """Reference to Esper ECS instance with all the component data."""
+    _component_manager: ComponentStorage
+    """Reference to the storage with all the component data."""
+    _query_cache: ComponentQueryCache
+    """Reference to the cached query results to update when components change."""
+    _tag_index: TagIndex
+    """Reference to the storage for tag components."""
     _name: str
     """The name of the GameObject."""
     children: list[GameObject]
@@ -246,12 +271,16 @@ class GameObject:
         self,
         unique_id: int,
         world: World,
-        component_manager: esper.World,
+        component_manager: ComponentStorage,
+        query_cache: ComponentQueryCache,
+        tag_index: TagIndex,
         name: str = "",
     ) -> None:
         self._id = unique_id
         self._world = world
         self._component_manager = component_manager
+        self._query_cache = query_cache
+        self._tag_index = tag_index
         self.parent = None
         self.children = []
         self._metadata = {}
@@ -263,6 +292,16 @@ class GameObject:
         """A GameObject's ID."""
         return self._id
 
+    @property
+    def index(self) -> int:
+        """The GameObject's slot index (reused after the GameObject is deleted)."""
+        return self._id & ENTITY_INDEX_MASK
+
+    @property
+    def generation(self) -> int:
+        """The number of GameObjects that used this GameObject's slot before it."""
+        return self._id >> ENTITY_INDEX_BITS
+
     @property
     def world(self) -> World:
         """The World instance to which a GameObject belongs."""
@@ -323,9 +362,9 @@ class GameObject:
             Component instances
         """
         try:
-            return self._component_manager.components_for_entity(self.uid)
-        except KeyError:
-            # Ignore errors if gameobject is not found in esper ecs
+            return tuple(self.get_component(ct) for ct in self._component_types)
+        except ComponentNotFoundError:
+            # Ignore errors if gameobject is not found in the component storage
             return ()
 
     def get_component_types(self) -> tuple[Type[Component], ...]:
@@ -351,9 +390,16 @@ class GameObject:
         _CT
             The added component
         """
-        component.gameobject = self
-        self._component_manager.add_component(self.uid, component)
-        self._component_types.append(type(component))
+        component_type = type(component)
+
+        if self._tag_index.is_tag_type(component_type):
+            self._tag_index.add_tag(self.uid, cast(Type[TagComponent], component_type))
+        else:
+            component.gameobject = self
+            self._component_manager.add_component(self.uid, component)
+
+        self._component_types.append(component_type)
+        self._query_cache.on_component_added(self.uid, component_type)
         component.on_add()
 
         return component
@@ -378,7 +424,15 @@ class GameObject:
             component = self.get_component(component_type)
             component.on_remove()
             self._component_types.remove(type(component))
-            self._component_manager.remove_component(self.uid, component_type)
+
+            if self._tag_index.is_tag_type(component_type):
+                self._tag_index.remove_tag(
+                    self.uid, cast(Type[TagComponent], component_type)
+                )
+            else:
+                self._component_manager.remove_component(self.uid, component_type)
+
+            self._query_cache.on_component_removed(self.uid, component_type)
             return True
 
         except KeyError:
@@ -399,6 +453,13 @@ class GameObject:
         _CT
             The instance of the component with the given type.
         """
+        if self._tag_index.is_tag_type(component_type):
+            if self._tag_index.has_tag(
+                self.uid, cast(Type[TagComponent], component_type)
+            ):
+                return component_type()
+            raise ComponentNotFoundError(component_type)
+
         try:
             return self._component_manager.component_for_entity(
                 self.uid, component_type
@@ -419,10 +480,7 @@ class GameObject:
         bool
             True if all component types are present on a GameObject.
         """
-        try:
-            return self._component_manager.has_components(self.uid, *component_types)
-        except KeyError:
-            return False
+        return all(self.has_component(ct) for ct in component_types)
 
     def has_component(self, component_type: Type[Component]) -> bool:
         """Check if this entity has a component.
@@ -437,6 +495,11 @@ class GameObject:
         bool
             True if the component exists, False otherwise.
         """
+        if self._tag_index.is_tag_type(component_type):
+            return self._tag_index.has_tag(
+                self.uid, cast(Type[TagComponent], component_type)
+            )
+
         try:
             return self._component_manager.has_component(self.uid, component_type)
         except KeyError:
@@ -455,6 +518,9 @@ class GameObject:
         _CT or None
             The instance of the component.
         """
+        if self._tag_index.is_tag_type(component_type):
+            return component_type() if self.has_component(component_type) else None
+
         try:
             return self._component_manager.try_component(self.uid, component_type)
         except KeyError:
@@ -595,6 +661,19 @@ class GameObject:
     def __hash__(self) -> int:
         return self._id
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        # The ID is restored before the other attributes, so GameObjects can be
+        # hashed while the objects that reference them are being unpickled.
+        return (
+            _restore_gameobject,
+            (self._id,),
+            {name: getattr(self, name) for name in GameObject.__slots__},
+        )
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+
     def __str__(self) -> str:
         return self.name
 
@@ -602,6 +681,13 @@ class GameObject:
         return f"{self.__class__.__name__}(id={self.uid}, name={self.name})"
 
 
+def _restore_gameobject(unique_id: int) -> GameObject:
+    """Create an empty GameObject with the given ID while unpickling a world."""
+    gameobject = GameObject.__new__(GameObject)
+    gameobject._id = unique_id
+    return gameobject
+
+
 class Component(ABC):
     """A collection of data attributes associated with a GameObject."""
 
@@ -646,6 +732,23 @@ class Component(ABC):
         """Lifecycle method called when the component is removed from a GameObject."""
         return
 
+    def mark_changed(self) -> None:
+        """Record that the component's data changed during the current change tick.
+
+        Components are not able to detect changes to their attributes on their own.
+        So, code that modifies a component should call this method for the change
+        to be visible to Changed[...] query filters. Components that are not attached
+        to a GameObject are ignored.
+        """
+        try:
+            gameobject = self._gameobject
+        except AttributeError:
+            return
+
+        gameobject.world.gameobject_manager.query_cache.on_component_changed(
+            gameobject.uid, type(self)
+        )
+
     @abstractmethod
     def to_dict(self) -> dict[str, Any]:
         """Serialize the component to a JSON-serializable dictionary."""
@@ -653,7 +756,49 @@ class Component(ABC):
 
 
 class TagComponent(Component):
-    """An Empty component used to mark a GameObject as having a state or type."""
+    """An Empty component used to mark a GameObject as having a state or type.
+
+    Tags are not stored with other component data. Instead, the world's TagIndex
+    tracks which GameObjects have each tag. Each tag type has a single shared instance,
+    so tags do not reference a GameObject. For the same reason, tag types cannot
+    override the on_add() and on_remove() lifecycle methods.
+    """
+
+    _instance: ClassVar[Optional[TagComponent]] = None
+    """The shared instance of the tag type."""
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        for method_name in ("on_add", "on_remove"):
+            if method_name in cls.__dict__:
+                raise TypeError(
+                    f"Tag component {cls.__name__} cannot override {method_name}() "
+                    "because its instance is shared by all GameObjects."
+                )
+
+    def __new__(cls) -> TagComponent:
+        instance = cls.__dict__.get("_instance")
+
+        if instance is None:
+            instance = super().__new__(cls)
+            cls._instance = instance
+
+        return instance
+
+    @property
+    def gameobject(self) -> GameObject:
+        """Tags are shared by all GameObjects, so they do not have a GameObject."""
+        raise AttributeError(
+            f"Tag component {type(self).__name__} does not belong to a GameObject."
+        )
+
+    @gameobject.setter
+    def gameobject(self, value: GameObject) -> None:
+        raise RuntimeError("Cannot assign a tag component to a GameObject.")
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return type(self), ()
 
     def __str__(self) -> str:
         return self.__class__.__name__
@@ -669,6 +814,47 @@ class Active(TagComponent):
     """Tags a GameObject as active within the simulation."""
 
 
+class _ChangeFilterMeta(type):
+    """Metaclass that creates change filters by subscripting filter classes.
+
+    Subscripting goes through the metaclass instead of __class_getitem__, so type
+    checkers see ``Changed[Stats]`` as a filter instance instead of a class.
+    """
+
+    def __getitem__(cls, component_type: Type[Component]) -> ChangeFilter:
+        return cls(component_type)
+
+
+class ChangeFilter(metaclass=_ChangeFilterMeta):
+    """Base class for query filters that match recently added or changed components.
+
+    Filters are created by subscripting a filter class with a component type, for
+    example, ``Changed[Stats]`` or ``Added[Pregnant]``.
+    """
+
+    __slots__ = ("component_type",)
+
+    component_type: Type[Component]
+    """The component type to check."""
+
+    def __init__(self, component_type: Type[Component]) -> None:
+        self.component_type = component_type
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}[{self.component_type.__name__}]"
+
+
+class Added(ChangeFilter):
+    """Matches GameObjects whose component was added since a given change tick."""
+
+
+class Changed(ChangeFilter):
+    """Matches GameObjects whose component was added or changed since a change tick.
+
+    Changes are only recorded when code calls Component.mark_changed().
+    """
+
+
 class ISystem(ABC):
     """Abstract Interface for ECS systems."""
 
@@ -744,17 +930,180 @@ class ISystem(ABC):
         raise NotImplementedError
 
 
+@attrs.define(frozen=True)
+class SystemSchedule:
+    """Specifies which world steps a system updates on.
+
+    By default, systems update every step. Systems that do not need that resolution
+    can update every N steps. Alternatively, they can update every step but spread
+    their per-GameObject work across N steps by only processing the GameObjects in
+    the current shard.
+    """
+
+    interval: int = attrs.field(default=1, validator=attrs.validators.ge(1))
+    """The number of world steps between updates."""
+
+    offset: int = attrs.field(default=0, validator=attrs.validators.ge(0))
+    """Shifts which steps the system updates on (used to stagger systems)."""
+
+    spread: bool = False
+    """Update every step but only process one shard of GameObjects per step."""
+
+    def is_due(self, tick: int) -> bool:
+        """Check if a system with this schedule should update.
+
+        Parameters
+        ----------
+        tick
+            The world's current tick.
+
+        Returns
+        -------
+        bool
+            True if the system should update, False otherwise.
+        """
+        return self.spread or (tick - self.offset) % self.interval == 0
+
+    def in_shard(self, tick: int, gameobject_id: int) -> bool:
+        """Check if a GameObject should be processed during the given tick.
+
+        GameObjects are split into shards using their IDs, so each GameObject is
+        processed once every interval.
+
+        Parameters
+        ----------
+        tick
+            The world's current tick.
+        gameobject_id
+            The ID of a GameObject.
+
+        Returns
+        -------
+        bool
+            True if the GameObject belongs to the current shard or the schedule is
+            not spread. False otherwise.
+        """
+        if not self.spread:
+            return True
+
+        return gameobject_id % self.interval == (tick - self.offset) % self.interval
+
+
 class System(ISystem, ABC):
     """Base class for systems, providing implementation for most lifecycle methods."""
 
-    __slots__ = ("_active",)
+    __slots__ = ("_active", "_schedule", "_rng", "_last_run_tick")
+
+    default_schedule: ClassVar[SystemSchedule] = SystemSchedule()
+    """The schedule given to new instances of the system."""
+    reads: ClassVar[Optional[tuple[Type[Any], ...]]] = None
+    """Component and resource types the system reads (None if undeclared)."""
+    writes: ClassVar[Optional[tuple[Type[Any], ...]]] = None
+    """Component and resource types the system modifies (None if undeclared)."""
 
     _active: bool
     """Will this system update during the next simulation step."""
+    _schedule: SystemSchedule
+    """Specifies which world steps the system updates on."""
+    _rng: Optional[random.Random]
+    """The system's own random number stream when it runs concurrently."""
+    _last_run_tick: int
+    """The world's change tick when the system last updated."""
 
     def __init__(self) -> None:
         super().__init__()
         self._active = True
+        self._schedule = self.default_schedule
+        self._rng = None
+        self._last_run_tick = 0
+
+    @property
+    def active(self) -> bool:
+        """Will this system update during the next simulation step."""
+        return self._active
+
+    @property
+    def last_run_tick(self) -> int:
+        """The world's change tick when the system last updated (0 if never)."""
+        return self._last_run_tick
+
+    @last_run_tick.setter
+    def last_run_tick(self, value: int) -> None:
+        """Set the change tick of the system's last update."""
+        self._last_run_tick = value
+
+    @property
+    def schedule(self) -> SystemSchedule:
+        """Specifies which world steps the system updates on."""
+        return self._schedule
+
+    @schedule.setter
+    def schedule(self, value: SystemSchedule) -> None:
+        """Set which world steps the system updates on."""
+        self._schedule = value
+
+    def get_rng(self, world: World) -> random.Random:
+        """Get the random number generator the system should use.
+
+        Systems running in parallel SystemGroups receive their own stream, seeded from
+        the world's random.Random resource, so results do not depend on the order
+        that threads finish. Otherwise, this is the world's random.Random resource.
+
+        Parameters
+        ----------
+        world
+            The world instance the system is updating.
+
+        Returns
+        -------
+        random.Random
+            A random number generator.
+        """
+        if self._rng is not None:
+            return self._rng
+        return world.resource_manager.get_resource(random.Random)
+
+    def set_rng(self, rng: Optional[random.Random]) -> None:
+        """Set the system's own random number stream.
+
+        Parameters
+        ----------
+        rng
+            A random number generator, or None to use the world's generator.
+        """
+        self._rng = rng
+
+    def conflicts_with(self, other: System) -> bool:
+        """Check if this system and another system cannot safely run concurrently.
+
+        Systems that do not declare their reads and writes conflict with every
+        other system.
+
+        Parameters
+        ----------
+        other
+            Another system.
+
+        Returns
+        -------
+        bool
+            True if either system writes data that the other reads or writes.
+        """
+        if (self.reads is None and self.writes is None) or (
+            other.reads is None and other.writes is None
+        ):
+            return True
+
+        reads = set(self.reads or ())
+        writes = set(self.writes or ())
+        other_reads = set(other.reads or ())
+        other_writes = set(other.writes or ())
+
+        return bool(
+            writes.intersection(other_reads)
+            or writes.intersection(other_writes)
+            or other_writes.intersection(reads)
+        )
 
     def set_active(self, value: bool) -> None:
         """Toggle if this system is active and will update.
@@ -817,14 +1166,24 @@ class SystemGroup(System, ABC):
     SystemGroups allow users to better structure the execution order of their systems.
     """
 
-    __slots__ = ("_children",)
+    __slots__ = ("_children", "_stages")
+
+    use_command_buffer: ClassVar[bool] = False
+    """Flush the world's CommandBuffer after each child system runs."""
+    flush_events: ClassVar[bool] = False
+    """Send queued events to listeners after each child system runs."""
+    parallel: ClassVar[bool] = False
+    """Run children with non-conflicting reads and writes concurrently."""
 
     _children: list[tuple[int, System]]
     """The systems that belong to this group"""
+    _stages: Optional[list[list[System]]]
+    """Cached batches of children that can run concurrently (parallel groups only)."""
 
     def __init__(self) -> None:
         super().__init__()
         self._children = []
+        self._stages = None
 
     def set_active(self, value: bool) -> None:
         super().set_active(value)
@@ -853,6 +1212,7 @@ class SystemGroup(System, ABC):
         """
         self._children.append((priority, system))
         self._children.sort(key=lambda pair: pair[0], reverse=True)
+        self._stages = None
 
     def remove_child(self, system_type: Type[System]) -> None:
         """Remove a child system.
@@ -871,6 +1231,7 @@ class SystemGroup(System, ABC):
 
         if children_to_remove:
             self._children.remove(children_to_remove[0])
+            self._stages = None
 
     def on_update(self, world: World) -> None:
         """Run all sub-systems.
@@ -880,24 +1241,285 @@ class SystemGroup(System, ABC):
         world
             The world instance the system is updating
         """
+        command_buffer = (
+            world.resource_manager.get_resource(CommandBuffer)
+            if self.use_command_buffer
+            else None
+        )
+
+        event_manager = world.event_manager if self.flush_events else None
+
+        profiler = world.resource_manager.try_resource(SystemProfiler)
+        if profiler is not None and not profiler.enabled:
+            profiler = None
+
+        tick = world.tick
+
+        if self.parallel:
+            self._update_stages(world, command_buffer, event_manager, profiler)
+            return
+
         for _, child in self._children:
-            child.on_start_running(world)
-            if child.should_run_system(world):
-                child.on_update(world)
-            child.on_stop_running(world)
+            if not child.schedule.is_due(tick):
+                continue
+
+            change_tick = world.increment_change_tick()
+
+            if profiler is None:
+                child.on_start_running(world)
+                if child.should_run_system(world):
+                    child.on_update(world)
+                    child.last_run_tick = change_tick
+                child.on_stop_running(world)
+            else:
+                start_time = time.perf_counter()
+                start_entity_count = world.entities_queried
+
+                child.on_start_running(world)
+                if child.should_run_system(world):
+                    child.on_update(world)
+                    child.last_run_tick = change_tick
+                child.on_stop_running(world)
+
+                profiler.record(
+                    child,
+                    tick,
+                    time.perf_counter() - start_time,
+                    world.entities_queried - start_entity_count,
+                )
+
+            if command_buffer is not None:
+                command_buffer.flush()
+
+            if event_manager is not None:
+                event_manager.flush_events()
+
+    def _update_stages(
+        self,
+        world: World,
+        command_buffer: Optional[CommandBuffer],
+        event_manager: Optional[EventManager],
+        profiler: Optional[SystemProfiler],
+    ) -> None:
+        """Run children in batches, running the systems in each batch concurrently."""
+        scheduler = world.resource_manager.get_resource(SystemScheduler)
+        world_rng = world.resource_manager.try_resource(random.Random)
+
+        if self._stages is None:
+            self._stages = scheduler.build_stages(child for _, child in self._children)
+
+        tick = world.tick
+
+        for stage in self._stages:
+            due_systems = [child for child in stage if child.schedule.is_due(tick)]
+
+            for child in due_systems:
+                child.on_start_running(world)
+
+            systems = [child for child in due_systems if child.should_run_system(world)]
+
+            # Seed per-system streams in a fixed order so results are reproducible
+            if len(systems) > 1 and world_rng is not None:
+                for child in systems:
+                    child.set_rng(random.Random(world_rng.getrandbits(64)))
+
+            change_tick = world.increment_change_tick()
+
+            results = scheduler.run_concurrently(world, systems)
+
+            for child in systems:
+                child.set_rng(None)
+                child.last_run_tick = change_tick
+
+            for child in due_systems:
+                child.on_stop_running(world)
+
+            if profiler is not None:
+                for child, (elapsed_time, entity_count) in zip(systems, results):
+                    profiler.record(child, tick, elapsed_time, entity_count)
+
+            if command_buffer is not None:
+                command_buffer.flush()
+
+            if event_manager is not None:
+                event_manager.flush_events()
+
+
+class SystemScheduler:
+    """Runs batches of non-conflicting systems on a thread pool.
+
+    Parallel SystemGroups use the scheduler to split their children into stages.
+    Each system is placed in the stage after the latest earlier sibling that it
+    conflicts with. So, systems that touch the same data still run in priority order,
+    while systems with disjoint reads and writes run at the same time.
+    """
+
+    __slots__ = ("_max_workers", "_executor")
+
+    _max_workers: Optional[int]
+    """The maximum number of worker threads (None uses the executor's default)."""
+    _executor: Optional[ThreadPoolExecutor]
+    """The thread pool, created the first time a stage has multiple systems."""
+
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        """
+        Parameters
+        ----------
+        max_workers
+            The maximum number of worker threads, by default None.
+        """
+        self._max_workers = max_workers
+        self._executor = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Worker threads cannot be pickled. A new pool is created when needed.
+        return {"_max_workers": self._max_workers}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self._max_workers = state["_max_workers"]
+        self._executor = None
+
+    @staticmethod
+    def build_stages(systems: Iterable[System]) -> list[list[System]]:
+        """Split systems into batches that can run concurrently.
+
+        Parameters
+        ----------
+        systems
+            Systems in the order they would run sequentially.
+
+        Returns
+        -------
+        list[list[System]]
+            Batches of systems. No two systems in a batch conflict.
+        """
+        stages: list[list[System]] = []
+        placed: list[tuple[System, int]] = []
+
+        for system in systems:
+            stage_index = 0
+
+            for other, other_stage_index in placed:
+                if other_stage_index >= stage_index and system.conflicts_with(other):
+                    stage_index = other_stage_index + 1
+
+            if stage_index == len(stages):
+                stages.append([])
+
+            stages[stage_index].append(system)
+            placed.append((system, stage_index))
+
+        return stages
+
+    def run_concurrently(
+        self, world: World, systems: list[System]
+    ) -> list[tuple[float, int]]:
+        """Update systems at the same time and wait for all of them to finish.
+
+        Parameters
+        ----------
+        world
+            The world instance the systems are updating.
+        systems
+            Systems that do not conflict with each other.
+
+        Returns
+        -------
+        list[tuple[float, int]]
+            The wall time each system spent updating (in seconds) and the number of
+            results its component queries returned.
+        """
+        if len(systems) <= 1:
+            return [self._timed_update(world, system) for system in systems]
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="neighborly"
+            )
+
+        futures = [
+            self._executor.submit(self._timed_update, world, system)
+            for system in systems
+        ]
+
+        # Calling result() re-raises any exception from the worker thread
+        return [future.result() for future in futures]
+
+    @staticmethod
+    def _timed_update(world: World, system: System) -> tuple[float, int]:
+        """Update a system and return its wall time and number of query results."""
+        start_time = time.perf_counter()
+        start_entity_count = world.thread_entities_queried
+        system.on_update(world)
+        return (
+            time.perf_counter() - start_time,
+            world.thread_entities_queried - start_entity_count,
+        )
+
+    def shutdown(self) -> None:
+        """Stop the worker threads."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
 
 
 class SystemManager(SystemGroup):
-    """Manages system instances for a single world instance."""
+    """Manages system instances for a single world instance.
 
-    __slots__ = ("_world",)
+    The manager keeps a registry that maps every system type (and each of its base
+    system types) to the registered instances and their parent groups. So, getting,
+    adding, and removing systems by type does not require searching the system tree.
+    Systems need to be added using add_system() to be registered.
+    """
+
+    __slots__ = ("_world", "_registry")
+
+    # Always flush recorded commands and events at the boundaries between
+    # top-level phases
+    use_command_buffer = True
+    flush_events = True
 
     _world: World
     """The world instance associated with the SystemManager."""
+    _registry: dict[Type[ISystem], list[tuple[SystemGroup, System]]]
+    """System types mapped to instances and their parent groups, in add order."""
 
     def __init__(self, world: World) -> None:
         super().__init__()
         self._world = world
+        self._registry = {}
+
+    def _register(self, group: SystemGroup, system: System) -> None:
+        """Add a system and its existing children to the registry."""
+        for system_type in type(system).__mro__:
+            if issubclass(system_type, ISystem):
+                if system_type not in self._registry:
+                    self._registry[system_type] = []
+                self._registry[system_type].append((group, system))
+
+        if isinstance(system, SystemGroup):
+            for _, child in system.iter_children():
+                self._register(system, child)
+
+    def _unregister(self, system: System) -> None:
+        """Remove a system and its children from the registry."""
+        for system_type in type(system).__mro__:
+            entries = self._registry.get(system_type)
+
+            if entries is None:
+                continue
+
+            for i, (_, registered) in enumerate(entries):
+                if registered is system:
+                    del entries[i]
+                    break
+
+            if not entries:
+                del self._registry[system_type]
+
+        if isinstance(system, SystemGroup):
+            for _, child in system.iter_children():
+                self._unregister(child)
 
     def add_system(
         self,
@@ -919,23 +1541,18 @@ class SystemManager(SystemGroup):
 
         if system_group is None:
             self.add_child(system, priority)
+            self._register(self, system)
             return
 
-        stack = [child for _, child in self._children]
-
-        while stack:
-            current_sys = stack.pop()
-
-            if isinstance(current_sys, system_group):
-                current_sys.add_child(system)
-                system.on_add(self._world)
-                return
+        entries = self._registry.get(system_group)
 
-            if isinstance(current_sys, SystemGroup):
-                for _, child in current_sys.iter_children():
-                    stack.append(child)
+        if not entries:
+            raise SystemNotFoundError(system_group)
 
-        raise SystemNotFoundError(system_group)
+        group = cast(SystemGroup, entries[0][1])
+        group.add_child(system)
+        self._register(group, system)
+        system.on_add(self._world)
 
     def get_system(self, system_type: Type[_ST]) -> _ST:
         """Attempt to get a System of the given type.
@@ -950,19 +1567,10 @@ class SystemManager(SystemGroup):
         _ST or None
             The system instance if one is found.
         """
-        stack: list[tuple[SystemGroup, System]] = [
-            (self, child) for _, child in self._children
-        ]
-
-        while stack:
-            _, current_sys = stack.pop()
+        entries = self._registry.get(system_type)
 
-            if isinstance(current_sys, system_type):
-                return current_sys
-
-            if isinstance(current_sys, SystemGroup):
-                for _, child in current_sys.iter_children():
-                    stack.append((current_sys, child))
+        if entries:
+            return cast(_ST, entries[0][1])
 
         raise SystemNotFoundError(system_type)
 
@@ -976,29 +1584,36 @@ class SystemManager(SystemGroup):
 
         Notes
         -----
-        This function performs a Depth-first search through
-        the tree of system groups to find the one with the
-        matching type.
-
         No exception is raised if it does not find a matching
         system.
         """
+        # Parents are registered before their children, so removing a matching
+        # group first also unregisters any matching systems nested inside it.
+        for group, system in list(self._registry.get(system_type, ())):
+            if not any(s is system for _, s in self._registry.get(system_type, ())):
+                continue
 
-        stack: list[tuple[SystemGroup, System]] = [
-            (self, c) for _, c in self.iter_children()
-        ]
-
-        while stack:
-            group, current_sys = stack.pop()
+            group.remove_child(system_type)
+            self._unregister(system)
+            system.on_destroy(self._world)
 
-            if isinstance(current_sys, system_type):
-                group.remove_child(system_type)
-                current_sys.on_destroy(self._world)
+    def get_oldest_run_tick(self) -> int:
+        """Get the oldest last_run_tick of all active systems.
 
-            else:
-                if isinstance(current_sys, SystemGroup):
-                    for _, child in current_sys.iter_children():
-                        stack.append((current_sys, child))
+        Returns
+        -------
+        int
+            The change tick, or the world's current change tick if there are no
+            active systems.
+        """
+        return min(
+            (
+                system.last_run_tick
+                for _, system in self._registry.get(System, ())
+                if system.active
+            ),
+            default=self._world.change_tick,
+        )
 
     def update_systems(self) -> None:
         """Update all systems in the manager."""
@@ -1100,11 +1715,27 @@ class ResourceManager:
 
 
 class EventManager:
-    """Manages event listeners for a single World instance."""
+    """Manages event listeners for a single World instance.
+
+    Listeners registered to an event type are also called for that type's subclasses.
+    The combined listeners for each concrete event type are cached in a dispatch
+    table, which is cleared whenever a listener is added.
+
+    By default, listeners are called as soon as an event is dispatched. In queued
+    mode, dispatched events are stored until flush_events() is called. Then, event
+    listeners are called for each event in dispatch order and batch listeners are
+    called once per concrete event type with a list of all its queued events.
+    SystemGroups that set ``flush_events`` flush the queue after each child system.
+    """
 
     __slots__ = (
         "_general_event_listeners",
         "_event_listeners_by_type",
+        "_batch_listeners_by_type",
+        "_dispatch_table",
+        "_batch_dispatch_table",
+        "_queued",
+        "_queue",
         "_world",
         "_next_event_id",
     )
@@ -1117,13 +1748,44 @@ class EventManager:
     """Event listeners that are called when any event fires."""
     _event_listeners_by_type: dict[Type[Event], OrderedSet[Callable[[Event], None]]]
     """Event listeners that are only called when a specific type of event fires."""
+    _batch_listeners_by_type: dict[
+        Type[Event], OrderedSet[Callable[[Type[Event], list[Event]], None]]
+    ]
+    """Listeners that receive lists of events of a specific type."""
+    _dispatch_table: dict[Type[Event], tuple[Callable[[Event], None], ...]]
+    """Concrete event types mapped to all the listeners called when they fire."""
+    _batch_dispatch_table: dict[
+        Type[Event], tuple[Callable[[Type[Event], list[Event]], None], ...]
+    ]
+    """Concrete event types mapped to all the batch listeners called when they fire."""
+    _queued: bool
+    """Are dispatched events stored until the next flush."""
+    _queue: list[Event]
+    """Events waiting to be sent to listeners, in dispatch order."""
 
     def __init__(self, world: World) -> None:
         self._world = world
         self._general_event_listeners = OrderedSet([])
         self._event_listeners_by_type = {}
+        self._batch_listeners_by_type = {}
+        self._dispatch_table = {}
+        self._batch_dispatch_table = {}
+        self._queued = False
+        self._queue = []
         self._next_event_id = 0
 
+    @property
+    def queued(self) -> bool:
+        """Are dispatched events stored until the next flush."""
+        return self._queued
+
+    @queued.setter
+    def queued(self, value: bool) -> None:
+        """Toggle queued mode. Turning it off flushes any queued events."""
+        self._queued = value
+        if not value:
+            self.flush_events()
+
     def on_event(
         self,
         event_type: Type[_ET_contra],
@@ -1131,6 +1793,8 @@ class EventManager:
     ) -> None:
         """Register a listener function to a specific event type.
 
+        The listener is also called when subclasses of the event type fire.
+
         Parameters
         ----------
         event_type
@@ -1145,6 +1809,7 @@ class EventManager:
             self._event_listeners_by_type[event_type],
         )
         listener_set.add(listener)
+        self._dispatch_table.clear()
 
     def on_any_event(self, listener: Callable[[Event], None]) -> None:
         """Register a listener function to all event types.
@@ -1155,24 +1820,151 @@ class EventManager:
             A function to be called any time an event fires.
         """
         self._general_event_listeners.append(listener)
+        self._dispatch_table.clear()
 
-    def dispatch_event(self, event: Event) -> None:
-        """Fire an event and trigger associated event listeners.
+    def on_events(
+        self,
+        event_type: Type[_ET_contra],
+        listener: Callable[[Type[_ET_contra], list[_ET_contra]], None],
+    ) -> None:
+        """Register a listener function that receives batches of events.
+
+        The listener is called with a concrete event type (the given type or one of
+        its subclasses) and the list of events of that type dispatched since the last
+        flush. When the EventManager is not queued, each batch has a single event.
 
         Parameters
         ----------
-        event
-            The event to fire
-        """
-
-        for callback_fn in self._event_listeners_by_type.get(
-            type(event), OrderedSet([])
-        ):
-            callback_fn(event)
+        event_type
+            The type of event to listen for.
+        listener
+            A function to be called with batches of events.
+        """
+        if event_type not in self._batch_listeners_by_type:
+            self._batch_listeners_by_type[event_type] = OrderedSet([])
+        listener_set = cast(
+            OrderedSet[Callable[[Type[_ET_contra], list[_ET_contra]], None]],
+            self._batch_listeners_by_type[event_type],
+        )
+        listener_set.add(listener)
+        self._batch_dispatch_table.clear()
+
+    def get_listeners(
+        self, event_type: Type[Event]
+    ) -> tuple[Callable[[Event], None], ...]:
+        """Get all the listeners called when an event type fires.
+
+        Parameters
+        ----------
+        event_type
+            A concrete event type.
+
+        Returns
+        -------
+        tuple[Callable[[Event], None], ...]
+            Listeners for the event type, followed by listeners for its base
+            classes (in method resolution order), followed by listeners for any
+            event. Each listener appears once.
+        """
+        try:
+            return self._dispatch_table[event_type]
+        except KeyError:
+            pass
+
+        listeners: dict[Callable[[Event], None], None] = {}
+
+        for base_type in event_type.__mro__:
+            for listener in self._event_listeners_by_type.get(base_type, ()):
+                listeners[listener] = None
+
+        for listener in self._general_event_listeners:
+            listeners[listener] = None
+
+        result = tuple(listeners)
+        self._dispatch_table[event_type] = result
+        return result
+
+    def get_batch_listeners(
+        self, event_type: Type[Event]
+    ) -> tuple[Callable[[Type[Event], list[Event]], None], ...]:
+        """Get all the batch listeners called when an event type fires.
+
+        Parameters
+        ----------
+        event_type
+            A concrete event type.
 
-        for callback_fn in self._general_event_listeners:
+        Returns
+        -------
+        tuple[Callable[[Type[Event], list[Event]], None], ...]
+            Batch listeners for the event type, followed by batch listeners for its
+            base classes (in method resolution order). Each listener appears once.
+        """
+        try:
+            return self._batch_dispatch_table[event_type]
+        except KeyError:
+            pass
+
+        listeners: dict[Callable[[Type[Event], list[Event]], None], None] = {}
+
+        for base_type in event_type.__mro__:
+            for listener in self._batch_listeners_by_type.get(base_type, ()):
+                listeners[listener] = None
+
+        result = tuple(listeners)
+        self._batch_dispatch_table[event_type] = result
+        return result
+
+    def dispatch_event(self, event: Event) -> None:
+        """Fire an event and trigger associated event listeners.
+
+        Parameters
+        ----------
+        event
+            The event to fire
+        """
+        if self._queued:
+            self._queue.append(event)
+            return
+
+        event_type = type(event)
+
+        for callback_fn in self.get_listeners(event_type):
             callback_fn(event)
 
+        batch_listeners = self.get_batch_listeners(event_type)
+        if batch_listeners:
+            batch = [event]
+            for batch_fn in batch_listeners:
+                batch_fn(event_type, batch)
+
+    def flush_events(self) -> None:
+        """Send all queued events to their listeners.
+
+        Events dispatched by listeners during the flush are sent during the same
+        flush.
+        """
+        while self._queue:
+            events = self._queue
+            self._queue = []
+
+            batches: dict[Type[Event], list[Event]] = {}
+
+            for event in events:
+                event_type = type(event)
+
+                for callback_fn in self.get_listeners(event_type):
+                    callback_fn(event)
+
+                if event_type in batches:
+                    batches[event_type].append(event)
+                else:
+                    batches[event_type] = [event]
+
+            for event_type, batch in batches.items():
+                for batch_fn in self.get_batch_listeners(event_type):
+                    batch_fn(event_type, batch)
+
     def get_next_event_id(self) -> int:
         """Get an ID number for a new event instance."""
         event_id = self._next_event_id
@@ -1180,35 +1972,1108 @@ class EventManager:
         return event_id
 
 
+class ComponentStorage(ABC):
+    """Abstract interface for data structures that store component instances.
+
+    GameObjects and the World access component data exclusively through this
+    interface, allowing the storage strategy to be swapped without changing the
+    public ECS API.
+
+    Notes
+    -----
+    Like esper, methods that look up a specific GameObject raise a KeyError when the
+    GameObject does not exist in the storage.
+    """
+
+    @abstractmethod
+    def create_entity(self, entity: Optional[int] = None) -> int:
+        """Create a new entity without any components.
+
+        Parameters
+        ----------
+        entity
+            The ID to give the entity. If None, the storage picks a new ID.
+
+        Returns
+        -------
+        int
+            The ID of the new entity.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete_entity(self, entity: int) -> None:
+        """Delete an entity and all of its components.
+
+        Parameters
+        ----------
+        entity
+            The ID of the entity.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def add_component(self, entity: int, component: Component) -> None:
+        """Add a component to an entity, replacing any component of the same type.
+
+        Parameters
+        ----------
+        entity
+            The ID of the entity.
+        component
+            The component instance.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def remove_component(self, entity: int, component_type: Type[Component]) -> None:
+        """Remove a component from an entity.
+
+        Parameters
+        ----------
+        entity
+            The ID of the entity.
+        component_type
+            The type of the component to remove.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def component_for_entity(self, entity: int, component_type: Type[_CT]) -> _CT:
+        """Get an entity's component of the given type.
+
+        Parameters
+        ----------
+        entity
+            The ID of the entity.
+        component_type
+            The type of the component.
+
+        Returns
+        -------
+        _CT
+            The component instance.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def components_for_entity(self, entity: int) -> tuple[Component, ...]:
+        """Get all the components attached to an entity.
+
+        Parameters
+        ----------
+        entity
+            The ID of the entity.
+
+        Returns
+        -------
+        tuple[Component, ...]
+            Component instances.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def has_component(self, entity: int, component_type: Type[Component]) -> bool:
+        """Check if an entity has a component of the given type.
+
+        Parameters
+        ----------
+        entity
+            The ID of the entity.
+        component_type
+            The type of the component.
+
+        Returns
+        -------
+        bool
+            True if the component exists, False otherwise.
+        """
+        raise NotImplementedError
+
+    def has_components(self, entity: int, *component_types: Type[Component]) -> bool:
+        """Check if an entity has all the given component types.
+
+        Parameters
+        ----------
+        entity
+            The ID of the entity.
+        *component_types
+            The types of the components.
+
+        Returns
+        -------
+        bool
+            True if all the components exist, False otherwise.
+        """
+        return all(self.has_component(entity, ct) for ct in component_types)
+
+    def try_component(self, entity: int, component_type: Type[_CT]) -> Optional[_CT]:
+        """Get an entity's component of the given type, if it exists.
+
+        Parameters
+        ----------
+        entity
+            The ID of the entity.
+        component_type
+            The type of the component.
+
+        Returns
+        -------
+        _CT or None
+            The component instance.
+        """
+        if self.has_component(entity, component_type):
+            return self.component_for_entity(entity, component_type)
+        return None
+
+    @abstractmethod
+    def get_components(
+        self, component_types: tuple[Type[Component], ...]
+    ) -> Iterable[tuple[int, tuple[Component, ...]]]:
+        """Get all entities that have the given component types.
+
+        Parameters
+        ----------
+        component_types
+            The component types to check for.
+
+        Returns
+        -------
+        Iterable[tuple[int, tuple[Component, ...]]]
+            Pairs of entity IDs and instances of the given component types, in-order.
+        """
+        raise NotImplementedError
+
+
+class EsperComponentStorage(ComponentStorage):
+    """Stores component data using an esper ECS World.
+
+    Esper stores components in dicts of dicts, and queries intersect the sets of
+    entities that have each component type.
+    """
+
+    __slots__ = ("_world",)
+
+    _world: esper.World
+    """The esper instance with all the component data."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._world = esper.World()
+
+    def create_entity(self, entity: Optional[int] = None) -> int:
+        if entity is None:
+            return self._world.create_entity()
+
+        # esper does not support choosing entity IDs, so register it directly
+        self._world._entities[entity] = {}  # pylint: disable=protected-access
+        return entity
+
+    def delete_entity(self, entity: int) -> None:
+        self._world.delete_entity(entity, True)
+
+    def add_component(self, entity: int, component: Component) -> None:
+        self._world.add_component(entity, component)
+
+    def remove_component(self, entity: int, component_type: Type[Component]) -> None:
+        self._world.remove_component(entity, component_type)
+
+    def component_for_entity(self, entity: int, component_type: Type[_CT]) -> _CT:
+        return self._world.component_for_entity(entity, component_type)
+
+    def components_for_entity(self, entity: int) -> tuple[Component, ...]:
+        return self._world.components_for_entity(entity)
+
+    def has_component(self, entity: int, component_type: Type[Component]) -> bool:
+        return self._world.has_component(entity, component_type)
+
+    def has_components(self, entity: int, *component_types: Type[Component]) -> bool:
+        return self._world.has_components(entity, *component_types)
+
+    def try_component(self, entity: int, component_type: Type[_CT]) -> Optional[_CT]:
+        return self._world.try_component(entity, component_type)
+
+    def get_components(
+        self, component_types: tuple[Type[Component], ...]
+    ) -> Iterable[tuple[int, tuple[Component, ...]]]:
+        return [
+            (entity, tuple(components))
+            for entity, components in self._world.get_components(*component_types)
+        ]
+
+
+class _Archetype:
+    """A table of entities that share the exact same set of component types.
+
+    Each component type has a column (list) of instances, and the entity at index i
+    of the entity list owns the instances at index i of every column.
+    """
+
+    __slots__ = ("component_types", "entities", "columns", "add_edges", "remove_edges")
+
+    component_types: frozenset[Type[Component]]
+    """The component types of entities in this archetype."""
+    entities: list[int]
+    """The IDs of entities in this archetype, ordered by row."""
+    columns: dict[Type[Component], list[Component]]
+    """Component types mapped to instances, ordered by row."""
+    add_edges: dict[Type[Component], _Archetype]
+    """Cached archetypes reached by adding a component type."""
+    remove_edges: dict[Type[Component], _Archetype]
+    """Cached archetypes reached by removing a component type."""
+
+    def __init__(self, column_types: Iterable[Type[Component]]) -> None:
+        self.columns = {ct: [] for ct in column_types}
+        self.component_types = frozenset(self.columns)
+        self.entities = []
+        self.add_edges = {}
+        self.remove_edges = {}
+
+    def append(self, entity: int, components: Iterable[Component]) -> int:
+        """Add a new row to the table and return its index."""
+        self.entities.append(entity)
+        for column, component in zip(self.columns.values(), components):
+            column.append(component)
+        return len(self.entities) - 1
+
+    def swap_remove(self, row: int) -> Optional[int]:
+        """Remove a row by moving the last row into its place.
+
+        Returns
+        -------
+        int or None
+            The ID of the entity moved into the removed row, if any.
+        """
+        last_row = len(self.entities) - 1
+        moved_entity: Optional[int] = None
+
+        if row != last_row:
+            moved_entity = self.entities[last_row]
+            self.entities[row] = moved_entity
+            for column in self.columns.values():
+                column[row] = column[last_row]
+
+        self.entities.pop()
+        for column in self.columns.values():
+            column.pop()
+
+        return moved_entity
+
+
+class ArchetypeComponentStorage(ComponentStorage):
+    """Stores component data in archetype tables.
+
+    Entities with identical sets of component types are stored together in the same
+    table. Adding or removing a component moves an entity's row to another table.
+    Queries find the tables whose component types are a superset of the queried types
+    and iterate their columns directly instead of probing a hash table per entity.
+    """
+
+    __slots__ = ("_next_entity_id", "_archetypes", "_locations", "_query_archetypes")
+
+    _next_entity_id: int
+    """The ID given to the next created entity."""
+    _archetypes: dict[frozenset[Type[Component]], _Archetype]
+    """All archetypes mapped to their component types."""
+    _locations: dict[int, tuple[_Archetype, int]]
+    """Entity IDs mapped to their archetype and row."""
+    _query_archetypes: dict[frozenset[Type[Component]], list[_Archetype]]
+    """Queried sets of component types mapped to the archetypes that match them."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._next_entity_id = 0
+        self._archetypes = {frozenset(): _Archetype(())}
+        self._locations = {}
+        self._query_archetypes = {}
+
+    def _get_archetype(self, column_types: tuple[Type[Component], ...]) -> _Archetype:
+        """Get the archetype for a set of component types, creating it if needed."""
+        key = frozenset(column_types)
+
+        if archetype := self._archetypes.get(key):
+            return archetype
+
+        archetype = _Archetype(column_types)
+        self._archetypes[key] = archetype
+
+        for query, archetypes in self._query_archetypes.items():
+            if query <= key:
+                archetypes.append(archetype)
+
+        return archetype
+
+    def _move_entity(
+        self, entity: int, target: _Archetype, added: Optional[Component] = None
+    ) -> None:
+        """Move an entity's components to a different archetype."""
+        source, row = self._locations[entity]
+
+        # Columns are matched by type since archetypes reached through different
+        # paths may order their columns differently.
+        components = [
+            source.columns[ct][row] if ct in source.columns else cast(Component, added)
+            for ct in target.columns
+        ]
+
+        new_row = target.append(entity, components)
+
+        if (moved_entity := source.swap_remove(row)) is not None:
+            self._locations[moved_entity] = (source, row)
+
+        self._locations[entity] = (target, new_row)
+
+    def create_entity(self, entity: Optional[int] = None) -> int:
+        if entity is None:
+            self._next_entity_id += 1
+            entity = self._next_entity_id
+        archetype = self._archetypes[frozenset()]
+        self._locations[entity] = (archetype, archetype.append(entity, ()))
+        return entity
+
+    def delete_entity(self, entity: int) -> None:
+        archetype, row = self._locations.pop(entity)
+
+        if (moved_entity := archetype.swap_remove(row)) is not None:
+            self._locations[moved_entity] = (archetype, row)
+
+    def add_component(self, entity: int, component: Component) -> None:
+        component_type = type(component)
+        source, row = self._locations[entity]
+
+        if component_type in source.columns:
+            source.columns[component_type][row] = component
+            return
+
+        if (target := source.add_edges.get(component_type)) is None:
+            target = self._get_archetype((*source.columns, component_type))
+            source.add_edges[component_type] = target
+
+        self._move_entity(entity, target, component)
+
+    def remove_component(self, entity: int, component_type: Type[Component]) -> None:
+        source, _ = self._locations[entity]
+
+        if component_type not in source.columns:
+            raise KeyError(component_type)
+
+        if (target := source.remove_edges.get(component_type)) is None:
+            target = self._get_archetype(
+                tuple(ct for ct in source.columns if ct is not component_type)
+            )
+            source.remove_edges[component_type] = target
+
+        self._move_entity(entity, target)
+
+    def component_for_entity(self, entity: int, component_type: Type[_CT]) -> _CT:
+        archetype, row = self._locations[entity]
+        return cast(_CT, archetype.columns[component_type][row])
+
+    def components_for_entity(self, entity: int) -> tuple[Component, ...]:
+        archetype, row = self._locations[entity]
+        return tuple(column[row] for column in archetype.columns.values())
+
+    def has_component(self, entity: int, component_type: Type[Component]) -> bool:
+        return component_type in self._locations[entity][0].component_types
+
+    def has_components(self, entity: int, *component_types: Type[Component]) -> bool:
+        return self._locations[entity][0].component_types.issuperset(component_types)
+
+    def try_component(self, entity: int, component_type: Type[_CT]) -> Optional[_CT]:
+        archetype, row = self._locations[entity]
+        if column := archetype.columns.get(component_type):
+            return cast(_CT, column[row])
+        return None
+
+    def get_components(
+        self, component_types: tuple[Type[Component], ...]
+    ) -> Iterable[tuple[int, tuple[Component, ...]]]:
+        query = frozenset(component_types)
+
+        if (archetypes := self._query_archetypes.get(query)) is None:
+            archetypes = [
+                a for a in self._archetypes.values() if query <= a.component_types
+            ]
+            self._query_archetypes[query] = archetypes
+
+        results: list[tuple[int, tuple[Component, ...]]] = []
+
+        for archetype in archetypes:
+            if archetype.entities:
+                results.extend(
+                    zip(
+                        archetype.entities,
+                        zip(*[archetype.columns[ct] for ct in component_types]),
+                    )
+                )
+
+        return results
+
+
+class TagIndex:
+    """Stores which GameObjects have each tag component.
+
+    Each tag type is assigned a bit. GameObjects map to a bit mask of their tags, and
+    each tag type maps to the set of GameObject IDs with that tag. So, checking for a
+    tag is a single mask test, and queries intersect tag sets before looking at other
+    component data.
+    """
+
+    __slots__ = ("_bits", "_is_tag_type", "_entities", "_masks")
+
+    _bits: dict[Type[TagComponent], int]
+    """Tag types mapped to their bits."""
+    _is_tag_type: dict[Type[Component], bool]
+    """Cached results of checking if component types are tag types."""
+    _entities: dict[Type[TagComponent], set[int]]
+    """Tag types mapped to the IDs of GameObjects with the tag."""
+    _masks: dict[int, int]
+    """GameObject IDs mapped to the bits of their tags."""
+
+    def __init__(self) -> None:
+        self._bits = {}
+        self._is_tag_type = {}
+        self._entities = {}
+        self._masks = {}
+
+    def is_tag_type(self, component_type: Type[Component]) -> bool:
+        """Check if a component type is a tag type.
+
+        Parameters
+        ----------
+        component_type
+            A component type.
+
+        Returns
+        -------
+        bool
+            True if the type is a subclass of TagComponent.
+        """
+        try:
+            return self._is_tag_type[component_type]
+        except KeyError:
+            result = issubclass(component_type, TagComponent)
+            self._is_tag_type[component_type] = result
+            return result
+
+    def get_bit(self, tag_type: Type[TagComponent]) -> int:
+        """Get the bit assigned to a tag type.
+
+        Parameters
+        ----------
+        tag_type
+            A tag type.
+
+        Returns
+        -------
+        int
+            An integer with a single bit set.
+        """
+        try:
+            return self._bits[tag_type]
+        except KeyError:
+            bit = 1 << len(self._bits)
+            self._bits[tag_type] = bit
+            self._entities[tag_type] = set()
+            return bit
+
+    def add_tag(self, gameobject_id: int, tag_type: Type[TagComponent]) -> None:
+        """Add a tag to a GameObject.
+
+        Parameters
+        ----------
+        gameobject_id
+            The ID of a GameObject.
+        tag_type
+            The type of the tag.
+        """
+        bit = self.get_bit(tag_type)
+        self._masks[gameobject_id] = self._masks.get(gameobject_id, 0) | bit
+        self._entities[tag_type].add(gameobject_id)
+
+    def remove_tag(self, gameobject_id: int, tag_type: Type[TagComponent]) -> None:
+        """Remove a tag from a GameObject.
+
+        Parameters
+        ----------
+        gameobject_id
+            The ID of a GameObject.
+        tag_type
+            The type of the tag.
+        """
+        mask = self._masks.get(gameobject_id, 0) & ~self.get_bit(tag_type)
+
+        if mask:
+            self._masks[gameobject_id] = mask
+        else:
+            self._masks.pop(gameobject_id, None)
+
+        self._entities[tag_type].discard(gameobject_id)
+
+    def has_tag(self, gameobject_id: int, tag_type: Type[TagComponent]) -> bool:
+        """Check if a GameObject has a tag.
+
+        Parameters
+        ----------
+        gameobject_id
+            The ID of a GameObject.
+        tag_type
+            The type of the tag.
+
+        Returns
+        -------
+        bool
+            True if the GameObject has the tag.
+        """
+        bit = self._bits.get(tag_type, 0)
+        return bit != 0 and self._masks.get(gameobject_id, 0) & bit != 0
+
+    def get_entities(self, tag_type: Type[TagComponent]) -> set[int]:
+        """Get the IDs of all GameObjects with a tag.
+
+        Parameters
+        ----------
+        tag_type
+            The type of the tag.
+
+        Returns
+        -------
+        set[int]
+            GameObject IDs. This collection is owned by the index and should not be
+            modified.
+        """
+        self.get_bit(tag_type)
+        return self._entities[tag_type]
+
+    def get_entities_with_all(
+        self, tag_types: Iterable[Type[TagComponent]]
+    ) -> set[int]:
+        """Get the IDs of all GameObjects that have every given tag.
+
+        Parameters
+        ----------
+        tag_types
+            Tag types.
+
+        Returns
+        -------
+        set[int]
+            GameObject IDs.
+        """
+        tag_sets = sorted((self.get_entities(t) for t in tag_types), key=len)
+
+        if not tag_sets:
+            return set()
+
+        return tag_sets[0].intersection(*tag_sets[1:])
+
+    def remove_gameobject(self, gameobject_id: int) -> None:
+        """Remove all tags from a GameObject.
+
+        Parameters
+        ----------
+        gameobject_id
+            The ID of a GameObject.
+        """
+        mask = self._masks.pop(gameobject_id, 0)
+
+        if mask:
+            for tag_type, bit in self._bits.items():
+                if mask & bit:
+                    self._entities[tag_type].discard(gameobject_id)
+
+
+class ComponentQueryCache:
+    """Incrementally maintained results for component queries.
+
+    The first time a tuple of component types is queried, the cache builds the full
+    result set from the component data. Afterward, GameObjects notify the cache when
+    components are added or removed, and only the cached queries that contain the
+    changed component type are updated. So, repeated queries cost O(result) instead of
+    re-intersecting every component collection.
+
+    Query results are ordered by when GameObjects started matching the query.
+
+    The cache also logs when components were added or changed for Added[...] and
+    Changed[...] filters. At the end of each step, the world discards log entries
+    older than the last update of every active system.
+    """
+
+    __slots__ = (
+        "_component_manager",
+        "_tag_index",
+        "_queries",
+        "_queries_by_type",
+        "_lock",
+        "_tick_lock",
+        "_change_tick",
+        "_added_ticks",
+        "_changed_ticks",
+    )
+
+    _component_manager: ComponentStorage
+    """The storage with all the component data."""
+    _tag_index: TagIndex
+    """The storage for tag components."""
+    _queries: dict[tuple[Type[Component], ...], dict[int, tuple[Component, ...]]]
+    """Cached queries mapped to GameObject IDs and their matching components."""
+    _queries_by_type: dict[Type[Component], list[tuple[Type[Component], ...]]]
+    """Component types mapped to the cached queries that include them."""
+    _lock: threading.Lock
+    """Prevents systems running concurrently from building the same query twice."""
+    _tick_lock: threading.Lock
+    """Guards the change logs while systems run concurrently."""
+    _change_tick: int
+    """A counter that advances before each system update."""
+    _added_ticks: dict[Type[Component], dict[int, int]]
+    """Component types mapped to GameObject IDs and the tick the component was added.
+
+    Each inner dict is ordered by tick, oldest first.
+    """
+    _changed_ticks: dict[Type[Component], dict[int, int]]
+    """Component types mapped to GameObject IDs and the last tick the component was
+    added or changed.
+
+    Each inner dict is ordered by tick, oldest first.
+    """
+
+    def __init__(
+        self, component_manager: ComponentStorage, tag_index: TagIndex
+    ) -> None:
+        self._component_manager = component_manager
+        self._tag_index = tag_index
+        self._queries = {}
+        self._queries_by_type = {}
+        self._lock = threading.Lock()
+        self._tick_lock = threading.Lock()
+        self._change_tick = 1
+        self._added_ticks = {}
+        self._changed_ticks = {}
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Locks cannot be pickled, so new ones are created when unpickling.
+        return {
+            name: getattr(self, name)
+            for name in self.__slots__
+            if name not in ("_lock", "_tick_lock")
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._lock = threading.Lock()
+        self._tick_lock = threading.Lock()
+
+    @property
+    def change_tick(self) -> int:
+        """The current change tick."""
+        return self._change_tick
+
+    def increment_change_tick(self) -> int:
+        """Advance the change tick.
+
+        Returns
+        -------
+        int
+            The new change tick.
+        """
+        self._change_tick += 1
+        return self._change_tick
+
+    def get_components(
+        self, component_types: tuple[Type[Component], ...]
+    ) -> dict[int, tuple[Component, ...]]:
+        """Get the cached results of a query, building them if necessary.
+
+        Parameters
+        ----------
+        component_types
+            The component types to query for.
+
+        Returns
+        -------
+        dict[int, tuple[Component, ...]]
+            GameObject IDs mapped to instances of the given component types, in-order.
+            This collection is owned by the cache and should not be modified.
+        """
+        try:
+            return self._queries[component_types]
+        except KeyError:
+            return self._build_query(component_types)
+
+    def _build_query(
+        self, component_types: tuple[Type[Component], ...]
+    ) -> dict[int, tuple[Component, ...]]:
+        """Compute the results of a new query and start tracking it."""
+        with self._lock:
+            if component_types in self._queries:
+                return self._queries[component_types]
+
+            tag_types = [
+                ct for ct in component_types if self._tag_index.is_tag_type(ct)
+            ]
+
+            if tag_types:
+                # Intersect the tag sets first and only look up component data for
+                # GameObjects that have every tag
+                results: dict[int, tuple[Component, ...]] = {}
+
+                for entity in sorted(
+                    self._tag_index.get_entities_with_all(
+                        cast("list[Type[TagComponent]]", tag_types)
+                    )
+                ):
+                    try:
+                        results[entity] = self._get_row(entity, component_types)
+                    except KeyError:
+                        continue
+            else:
+                results = {
+                    entity: tuple(components)
+                    for entity, components in sorted(
+                        self._component_manager.get_components(component_types),
+                        key=lambda entry: entry[0],
+                    )
+                }
+
+            self._queries[component_types] = results
+
+            for component_type in set(component_types):
+                if component_type not in self._queries_by_type:
+                    self._queries_by_type[component_type] = []
+                self._queries_by_type[component_type].append(component_types)
+
+            return results
+
+    def _get_row(
+        self, gameobject_id: int, component_types: tuple[Type[Component], ...]
+    ) -> tuple[Component, ...]:
+        """Get a GameObject's instances of the given component types.
+
+        Raises a KeyError if the GameObject is missing any of the components.
+        """
+        tag_index = self._tag_index
+        component_manager = self._component_manager
+        row: list[Component] = []
+
+        for component_type in component_types:
+            if tag_index.is_tag_type(component_type):
+                if not tag_index.has_tag(
+                    gameobject_id, cast(Type[TagComponent], component_type)
+                ):
+                    raise KeyError(component_type)
+                row.append(component_type())
+            else:
+                row.append(
+                    component_manager.component_for_entity(
+                        gameobject_id, component_type
+                    )
+                )
+
+        return tuple(row)
+
+    def on_component_added(
+        self, gameobject_id: int, component_type: Type[Component]
+    ) -> None:
+        """Update cached queries affected by a component addition.
+
+        Parameters
+        ----------
+        gameobject_id
+            The ID of the GameObject the component was added to.
+        component_type
+            The type of the added component.
+        """
+        for query in self._queries_by_type.get(component_type, ()):
+            try:
+                self._queries[query][gameobject_id] = self._get_row(
+                    gameobject_id, query
+                )
+            except KeyError:
+                # The GameObject is missing other components in the query
+                continue
+
+        self._record_tick(self._added_ticks, gameobject_id, component_type)
+        self._record_tick(self._changed_ticks, gameobject_id, component_type)
+
+    def on_component_changed(
+        self, gameobject_id: int, component_type: Type[Component]
+    ) -> None:
+        """Record that a component changed during the current change tick.
+
+        Parameters
+        ----------
+        gameobject_id
+            The ID of the GameObject that owns the component.
+        component_type
+            The type of the changed component.
+        """
+        self._record_tick(self._changed_ticks, gameobject_id, component_type)
+
+    def on_components_changed(
+        self, gameobject_ids: Iterable[int], component_type: Type[Component]
+    ) -> None:
+        """Record that a component changed on several GameObjects.
+
+        Parameters
+        ----------
+        gameobject_ids
+            The IDs of the GameObjects that own the components.
+        component_type
+            The type of the changed components.
+        """
+        with self._tick_lock:
+            for gameobject_id in gameobject_ids:
+                self._record_tick_unlocked(
+                    self._changed_ticks, gameobject_id, component_type
+                )
+
+    def _record_tick(
+        self,
+        ticks_by_type: dict[Type[Component], dict[int, int]],
+        gameobject_id: int,
+        component_type: Type[Component],
+    ) -> None:
+        """Move a GameObject to the end of a change log with the current tick."""
+        with self._tick_lock:
+            self._record_tick_unlocked(ticks_by_type, gameobject_id, component_type)
+
+    def _record_tick_unlocked(
+        self,
+        ticks_by_type: dict[Type[Component], dict[int, int]],
+        gameobject_id: int,
+        component_type: Type[Component],
+    ) -> None:
+        """Version of _record_tick() for callers that hold the tick lock."""
+        ticks = ticks_by_type.get(component_type)
+
+        if ticks is None:
+            ticks_by_type[component_type] = {gameobject_id: self._change_tick}
+            return
+
+        # Re-insert the entry so the log stays ordered by tick
+        ticks.pop(gameobject_id, None)
+        ticks[gameobject_id] = self._change_tick
+
+    def get_changes(self, change_filter: ChangeFilter, since: int) -> list[int]:
+        """Get the GameObjects matching a change filter.
+
+        Parameters
+        ----------
+        change_filter
+            An Added[...] or Changed[...] filter.
+        since
+            Only include changes made after this change tick.
+
+        Returns
+        -------
+        list[int]
+            GameObject IDs, ordered from the least to most recent change.
+        """
+        ticks = self._get_change_log(change_filter).get(
+            change_filter.component_type, {}
+        )
+
+        results: list[int] = []
+
+        with self._tick_lock:
+            # Logs are ordered by tick, so stop at the first entry that is too old
+            for gameobject_id in reversed(ticks):
+                if ticks[gameobject_id] <= since:
+                    break
+                results.append(gameobject_id)
+
+        results.reverse()
+        return results
+
+    def matches(
+        self, change_filter: ChangeFilter, gameobject_id: int, since: int
+    ) -> bool:
+        """Check if a GameObject matches a change filter.
+
+        Parameters
+        ----------
+        change_filter
+            An Added[...] or Changed[...] filter.
+        gameobject_id
+            The ID of a GameObject.
+        since
+            Only consider changes made after this change tick.
+
+        Returns
+        -------
+        bool
+            True if the GameObject's component was added/changed after the tick.
+        """
+        ticks = self._get_change_log(change_filter).get(
+            change_filter.component_type, {}
+        )
+        return ticks.get(gameobject_id, 0) > since
+
+    def prune_change_logs(self, tick: int) -> None:
+        """Discard change log entries made at or before a change tick.
+
+        Parameters
+        ----------
+        tick
+            A change tick. Change filters evaluated with a ``since`` tick greater
+            than or equal to this tick are not affected.
+        """
+        with self._tick_lock:
+            for ticks_by_type in (self._added_ticks, self._changed_ticks):
+                for ticks in ticks_by_type.values():
+                    # Logs are ordered by tick, so stop at the first recent entry
+                    stale_ids: list[int] = []
+                    for gameobject_id, change_tick in ticks.items():
+                        if change_tick > tick:
+                            break
+                        stale_ids.append(gameobject_id)
+
+                    for gameobject_id in stale_ids:
+                        del ticks[gameobject_id]
+
+    def _get_change_log(
+        self, change_filter: ChangeFilter
+    ) -> dict[Type[Component], dict[int, int]]:
+        """Get the change log used to evaluate a filter."""
+        if isinstance(change_filter, Added):
+            return self._added_ticks
+        return self._changed_ticks
+
+    def on_component_removed(
+        self, gameobject_id: int, component_type: Type[Component]
+    ) -> None:
+        """Update cached queries affected by a component removal.
+
+        Parameters
+        ----------
+        gameobject_id
+            The ID of the GameObject the component was removed from.
+        component_type
+            The type of the removed component.
+        """
+        for query in self._queries_by_type.get(component_type, ()):
+            self._queries[query].pop(gameobject_id, None)
+
+        with self._tick_lock:
+            self._added_ticks.get(component_type, {}).pop(gameobject_id, None)
+            self._changed_ticks.get(component_type, {}).pop(gameobject_id, None)
+
+    def on_gameobject_deleted(self, gameobject_id: int) -> None:
+        """Remove a deleted GameObject from all cached queries.
+
+        Parameters
+        ----------
+        gameobject_id
+            The ID of the deleted GameObject.
+        """
+        for results in self._queries.values():
+            results.pop(gameobject_id, None)
+
+        with self._tick_lock:
+            for ticks in self._added_ticks.values():
+                ticks.pop(gameobject_id, None)
+
+            for ticks in self._changed_ticks.values():
+                ticks.pop(gameobject_id, None)
+
+    def clear(self) -> None:
+        """Discard all cached queries."""
+        self._queries.clear()
+        self._queries_by_type.clear()
+        self._added_ticks.clear()
+        self._changed_ticks.clear()
+
+
 class GameObjectManager:
-    """Manages GameObject and Component Data for a single World instance."""
+    """Manages GameObject and Component Data for a single World instance.
+
+    GameObject IDs are generational handles. The low ENTITY_INDEX_BITS bits are a slot
+    index and the remaining bits count how many times the slot was reused. Slots are
+    recycled after GameObjects are deleted by clear_dead_gameobjects(), so the range of
+    indices stays proportional to the number of live GameObjects. Stale references to
+    deleted GameObjects keep their old generation, so they never match the GameObject
+    that reuses their slot.
+
+    A GameObject destroyed with ``keep_id=True`` keeps its ID reserved. It can be
+    spawned again with the same ID and GameObject instance, so references to it stay
+    valid. IDs can also be reserved for GameObjects that will be spawned later using
+    reserve_gameobject(). Reserved IDs are only recycled after they are released
+    with release_id().
+    """
 
     __slots__ = (
         "world",
         "_component_manager",
+        "_tag_index",
+        "_query_cache",
         "_gameobjects",
         "_dead_gameobjects",
+        "_generations",
+        "_free_indices",
+        "_reserved",
     )
 
     world: World
     """The manager's associated World instance."""
-    _component_manager: esper.World
-    """Esper ECS instance used for efficiency."""
+    _component_manager: ComponentStorage
+    """The storage with all the component data."""
+    _tag_index: TagIndex
+    """The storage for tag components."""
+    _query_cache: ComponentQueryCache
+    """Cached results of component queries."""
     _gameobjects: dict[int, GameObject]
     """Mapping of GameObjects to unique identifiers."""
     _dead_gameobjects: OrderedSet[int]
     """IDs of GameObjects to clean-up following destruction."""
+    _generations: list[int]
+    """The current generation of each slot index (index 0 is never used)."""
+    _free_indices: collections.deque[int]
+    """Slot indices available for reuse, oldest first."""
+    _reserved: dict[int, GameObject]
+    """Reserved IDs mapped to the GameObjects to spawn with them."""
 
-    def __init__(self, world: World) -> None:
+    def __init__(
+        self, world: World, component_storage: Optional[ComponentStorage] = None
+    ) -> None:
+        """
+        Parameters
+        ----------
+        world
+            The manager's associated World instance.
+        component_storage
+            The storage to use for component data, by default EsperComponentStorage.
+        """
         self.world = world
         self._gameobjects = {}
-        self._component_manager = esper.World()
+        self._component_manager = (
+            component_storage
+            if component_storage is not None
+            else EsperComponentStorage()
+        )
+        self._tag_index = TagIndex()
+        self._query_cache = ComponentQueryCache(
+            self._component_manager, self._tag_index
+        )
         self._dead_gameobjects = OrderedSet([])
+        self._generations = [0]
+        self._free_indices = collections.deque()
+        self._reserved = {}
+
+    @property
+    def component_manager(self) -> ComponentStorage:
+        """Get the storage with all the component data."""
+        return self._component_manager
+
+    @property
+    def tag_index(self) -> TagIndex:
+        """Get the storage for tag components."""
+        return self._tag_index
 
     @property
-    def component_manager(self) -> esper.World:
-        """Get the esper world instance with all the component data."""
-        return self._component_manager
+    def query_cache(self) -> ComponentQueryCache:
+        """Get the cached results of component queries."""
+        return self._query_cache
 
     @property
     def gameobjects(self) -> Iterable[GameObject]:
@@ -1225,6 +3090,7 @@ class GameObjectManager:
         self,
         components: Optional[list[Component]] = None,
         name: str = "",
+        gameobject_id: Optional[int] = None,
     ) -> GameObject:
         """Create a new GameObject and add it to the world.
 
@@ -1234,21 +3100,39 @@ class GameObjectManager:
             A collection of component instances to add to the GameObject.
         name
             A name to give the GameObject.
+        gameobject_id
+            A reserved ID to spawn the GameObject with. The GameObject instance that
+            reserved the ID is added back to the world.
 
         Returns
         -------
         GameObject
             The created GameObject.
         """
-        entity_id = self._component_manager.create_entity()
+        if gameobject_id is None:
+            gameobject = GameObject(
+                unique_id=self._allocate_id(),
+                world=self.world,
+                component_manager=self._component_manager,
+                query_cache=self._query_cache,
+                tag_index=self._tag_index,
+                name=name,
+            )
+        else:
+            if gameobject_id not in self._reserved:
+                raise ValueError(f"GameObject ID {gameobject_id} is not reserved.")
 
-        gameobject = GameObject(
-            unique_id=entity_id,
-            world=self.world,
-            component_manager=self._component_manager,
-            name=name,
-        )
+            if gameobject_id in self._gameobjects:
+                # The GameObject was destroyed this step and still needs clean-up
+                self._dead_gameobjects.discard(gameobject_id)
+                self._delete_gameobject(gameobject_id)
+
+            gameobject = self._reserved.pop(gameobject_id)
 
+            if name:
+                gameobject.name = name
+
+        self._component_manager.create_entity(gameobject.uid)
         self._gameobjects[gameobject.uid] = gameobject
 
         if components:
@@ -1259,6 +3143,65 @@ class GameObjectManager:
 
         return gameobject
 
+    def reserve_gameobject(self, name: str = "") -> GameObject:
+        """Create a GameObject with a new ID without adding it to the world.
+
+        The GameObject is added to the world by passing its ID to
+        spawn_gameobject(). Until then, it does not exist and it has no components.
+
+        Parameters
+        ----------
+        name
+            A name to give the GameObject.
+
+        Returns
+        -------
+        GameObject
+            The reserved GameObject.
+        """
+        gameobject = GameObject(
+            unique_id=self._allocate_id(),
+            world=self.world,
+            component_manager=self._component_manager,
+            query_cache=self._query_cache,
+            tag_index=self._tag_index,
+            name=name,
+        )
+
+        self._reserved[gameobject.uid] = gameobject
+
+        return gameobject
+
+    def _allocate_id(self) -> int:
+        """Get the ID for a new GameObject, reusing a free slot if one exists."""
+        if self._free_indices:
+            index = self._free_indices.popleft()
+        else:
+            index = len(self._generations)
+            self._generations.append(0)
+
+        return (self._generations[index] << ENTITY_INDEX_BITS) | index
+
+    def is_stale(self, gameobject_id: int) -> bool:
+        """Check if an ID belongs to a GameObject whose slot was freed.
+
+        Parameters
+        ----------
+        gameobject_id
+            The ID of a GameObject.
+
+        Returns
+        -------
+        bool
+            True if the GameObject was deleted, False otherwise.
+        """
+        index = gameobject_id & ENTITY_INDEX_MASK
+
+        if index >= len(self._generations):
+            return False
+
+        return self._generations[index] != gameobject_id >> ENTITY_INDEX_BITS
+
     def get_gameobject(self, gameobject_id: int) -> GameObject:
         """Get a GameObject.
 
@@ -1292,13 +3235,33 @@ class GameObjectManager:
         """
         return gameobject_id in self._gameobjects
 
-    def destroy_gameobject(self, gameobject: GameObject) -> None:
+    def release_id(self, gameobject_id: int) -> None:
+        """Allow a reserved ID to be recycled.
+
+        Parameters
+        ----------
+        gameobject_id
+            An ID reserved by reserve_gameobject() or by destroying a GameObject
+            with ``keep_id=True``.
+        """
+        del self._reserved[gameobject_id]
+
+        if gameobject_id in self._gameobjects:
+            # The ID is freed when the GameObject is cleaned up
+            return
+
+        self._free_id(gameobject_id)
+
+    def destroy_gameobject(self, gameobject: GameObject, keep_id: bool = False) -> None:
         """Remove a gameobject from the world.
 
         Parameters
         ----------
         gameobject
             The GameObject to remove.
+        keep_id
+            Reserve the GameObject's ID so that it can be spawned again by passing
+            its ID to spawn_gameobject().
 
         Note
         ----
@@ -1309,6 +3272,9 @@ class GameObjectManager:
 
         self._dead_gameobjects.append(gameobject.uid)
 
+        if keep_id:
+            self._reserved[gameobject.uid] = gameobject
+
         # Deactivate first
         gameobject.deactivate()
 
@@ -1323,17 +3289,356 @@ class GameObjectManager:
     def clear_dead_gameobjects(self) -> None:
         """Delete gameobjects that were removed from the world."""
         for gameobject_id in self._dead_gameobjects:
-            if len(self._gameobjects[gameobject_id].get_components()) > 0:
-                self._component_manager.delete_entity(gameobject_id, True)
+            self._delete_gameobject(gameobject_id)
 
-            gameobject = self._gameobjects[gameobject_id]
+            if gameobject_id not in self._reserved:
+                self._free_id(gameobject_id)
 
-            if gameobject.parent is not None:
-                gameobject.parent.remove_child(gameobject)
-
-            del self._gameobjects[gameobject_id]
         self._dead_gameobjects.clear()
 
+    def _delete_gameobject(self, gameobject_id: int) -> None:
+        """Delete the data of a GameObject that was removed from the world."""
+        gameobject = self._gameobjects.pop(gameobject_id)
+
+        if len(gameobject.get_components()) > 0:
+            self._query_cache.on_gameobject_deleted(gameobject_id)
+
+        self._component_manager.delete_entity(gameobject_id)
+        self._tag_index.remove_gameobject(gameobject_id)
+
+        if gameobject.parent is not None:
+            gameobject.parent.remove_child(gameobject)
+
+    def _free_id(self, gameobject_id: int) -> None:
+        """Make the slot of a deleted GameObject's ID available for reuse."""
+        # Invalidate existing references to the slot before it is reused
+        index = gameobject_id & ENTITY_INDEX_MASK
+        self._generations[index] += 1
+        self._free_indices.append(index)
+
+
+class CommandBuffer:
+    """Records structural changes to the world and applies them later as a batch.
+
+    Systems can record GameObject spawns, component additions/removals, and
+    GameObject destruction while iterating query results, instead of changing the
+    world in the middle of the iteration. Recorded commands are replayed in the order
+    they were recorded when the buffer is flushed. SystemGroups that set
+    ``use_command_buffer`` flush the buffer after each child system runs.
+
+    Notes
+    -----
+    GameObjects spawned through the buffer do not exist until the buffer is flushed.
+    Their IDs are reserved when the spawn is recorded, so other commands can refer
+    to them.
+    """
+
+    __slots__ = ("_world", "_commands")
+
+    _world: World
+    """The world instance to apply commands to."""
+    _commands: list[tuple[Callable[..., Any], tuple[Any, ...]]]
+    """Recorded functions and their arguments, in the order they were recorded."""
+
+    def __init__(self, world: World) -> None:
+        self._world = world
+        self._commands = []
+
+    def spawn_gameobject(
+        self,
+        components: Optional[list[Component]] = None,
+        name: str = "",
+    ) -> GameObject:
+        """Record the creation of a new GameObject.
+
+        Parameters
+        ----------
+        components
+            A collection of component instances to add to the GameObject.
+        name
+            A name to give the GameObject.
+
+        Returns
+        -------
+        GameObject
+            The GameObject that will be spawned when the buffer is flushed. Until
+            then, it should only be passed to other commands.
+        """
+        gameobject_manager = self._world.gameobject_manager
+        gameobject = gameobject_manager.reserve_gameobject(name)
+
+        self._commands.append(
+            (gameobject_manager.spawn_gameobject, (components, "", gameobject.uid))
+        )
+
+        return gameobject
+
+    def add_component(self, gameobject: GameObject, component: Component) -> None:
+        """Record adding a component to a GameObject.
+
+        Parameters
+        ----------
+        gameobject
+            The GameObject to add the component to.
+        component
+            The component.
+        """
+        self._commands.append((gameobject.add_component, (component,)))
+
+    def remove_component(
+        self, gameobject: GameObject, component_type: Type[Component]
+    ) -> None:
+        """Record removing a component from a GameObject.
+
+        Parameters
+        ----------
+        gameobject
+            The GameObject to remove the component from.
+        component_type
+            The type of the component to remove.
+        """
+        self._commands.append((gameobject.remove_component, (component_type,)))
+
+    def destroy_gameobject(self, gameobject: GameObject) -> None:
+        """Record removing a GameObject from the world.
+
+        Parameters
+        ----------
+        gameobject
+            The GameObject to remove.
+        """
+        self._commands.append(
+            (self._world.gameobject_manager.destroy_gameobject, (gameobject,))
+        )
+
+    def flush(self) -> None:
+        """Apply all recorded commands in the order they were recorded.
+
+        Commands recorded while flushing (for example, by Component.on_add()) are
+        applied during the same flush.
+        """
+        while self._commands:
+            commands = self._commands
+            self._commands = []
+
+            for command, args in commands:
+                command(*args)
+
+    def clear(self) -> None:
+        """Discard all recorded commands without applying them.
+
+        The IDs reserved for GameObjects that were not spawned are released.
+        """
+        gameobject_manager = self._world.gameobject_manager
+
+        for command, args in self._commands:
+            if command == gameobject_manager.spawn_gameobject:
+                gameobject_manager.release_id(args[2])
+
+        self._commands.clear()
+
+    def __len__(self) -> int:
+        return len(self._commands)
+
+
+class SystemProfile:
+    """Timing statistics collected for a single system type."""
+
+    __slots__ = (
+        "name",
+        "call_count",
+        "total_time",
+        "max_time",
+        "entity_count",
+        "samples",
+    )
+
+    name: str
+    """The name of the system type."""
+    call_count: int
+    """The number of times the system updated."""
+    total_time: float
+    """The total wall time spent updating the system (in seconds)."""
+    max_time: float
+    """The longest wall time of a single update (in seconds)."""
+    entity_count: int
+    """The total number of query results the system iterated over."""
+    samples: collections.deque[tuple[int, float, int]]
+    """(tick, wall time, entity count) for the most recent updates."""
+
+    def __init__(self, name: str, window_size: int) -> None:
+        self.name = name
+        self.call_count = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.entity_count = 0
+        self.samples = collections.deque(maxlen=window_size)
+
+    @property
+    def mean_time(self) -> float:
+        """The average wall time of a single update (in seconds)."""
+        if self.call_count == 0:
+            return 0.0
+        return self.total_time / self.call_count
+
+
+class SystemProfiler:
+    """Records how long systems take to update.
+
+    When enabled, SystemGroups record the wall time, call count, and number of
+    queried entities for each child system (including nested SystemGroups) every time
+    it updates. The most recent updates are kept in a rolling window for building
+    per-tick histograms. When disabled, SystemGroups skip all timing.
+    """
+
+    __slots__ = ("enabled", "_window_size", "_profiles")
+
+    enabled: bool
+    """Should SystemGroups record timing data."""
+    _window_size: int
+    """The number of recent updates to keep per system."""
+    _profiles: dict[Type[ISystem], SystemProfile]
+    """Statistics for each system type, in the order they first updated."""
+
+    def __init__(self, enabled: bool = False, window_size: int = 120) -> None:
+        """
+        Parameters
+        ----------
+        enabled
+            Should SystemGroups record timing data, by default False.
+        window_size
+            The number of recent updates to keep per system, by default 120.
+        """
+        self.enabled = enabled
+        self._window_size = window_size
+        self._profiles = {}
+
+    @property
+    def profiles(self) -> Iterable[SystemProfile]:
+        """Statistics for all the systems that have updated while profiling."""
+        return self._profiles.values()
+
+    def record(
+        self, system: ISystem, tick: int, elapsed_time: float, entity_count: int
+    ) -> None:
+        """Record a single system update.
+
+        Parameters
+        ----------
+        system
+            The system that updated.
+        tick
+            The world tick when the system updated.
+        elapsed_time
+            The wall time of the update (in seconds).
+        entity_count
+            The number of query results returned during the update.
+        """
+        system_type = type(system)
+
+        profile = self._profiles.get(system_type)
+
+        if profile is None:
+            profile = SystemProfile(system_type.__name__, self._window_size)
+            self._profiles[system_type] = profile
+
+        profile.call_count += 1
+        profile.total_time += elapsed_time
+        profile.entity_count += entity_count
+        if elapsed_time > profile.max_time:
+            profile.max_time = elapsed_time
+        profile.samples.append((tick, elapsed_time, entity_count))
+
+    def get_profile(self, system_type: Type[ISystem]) -> SystemProfile:
+        """Get the statistics for a system type.
+
+        Parameters
+        ----------
+        system_type
+            The system type.
+
+        Returns
+        -------
+        SystemProfile
+            The system's statistics.
+        """
+        return self._profiles[system_type]
+
+    def get_histogram(
+        self, system_type: Type[ISystem], bin_count: int = 10
+    ) -> list[tuple[float, int]]:
+        """Bin the system's recent update times.
+
+        Parameters
+        ----------
+        system_type
+            The system type.
+        bin_count
+            The number of equal-width bins, by default 10.
+
+        Returns
+        -------
+        list[tuple[float, int]]
+            The lower edge of each bin (in seconds) and the number of updates in it.
+        """
+        times = [elapsed for _, elapsed, _ in self._profiles[system_type].samples]
+
+        if not times:
+            return []
+
+        low, high = min(times), max(times)
+        bin_width = (high - low) / bin_count or 1.0
+        counts = [0] * bin_count
+
+        for elapsed in times:
+            counts[min(int((elapsed - low) / bin_width), bin_count - 1)] += 1
+
+        return [(low + i * bin_width, count) for i, count in enumerate(counts)]
+
+    def reset(self) -> None:
+        """Discard all recorded statistics."""
+        self._profiles.clear()
+
+    def to_dataframe(self) -> pl.DataFrame:
+        """Summarize the recorded statistics as a polars DataFrame.
+
+        Returns
+        -------
+        pl.DataFrame
+            One row per system with call counts, timings (in seconds), and entity
+            counts.
+        """
+        profiles = list(self._profiles.values())
+
+        return pl.DataFrame(
+            {
+                "system": [p.name for p in profiles],
+                "call_count": [p.call_count for p in profiles],
+                "total_time": [p.total_time for p in profiles],
+                "mean_time": [p.mean_time for p in profiles],
+                "max_time": [p.max_time for p in profiles],
+                "entity_count": [p.entity_count for p in profiles],
+            },
+            schema={
+                "system": pl.Utf8,
+                "call_count": pl.Int64,
+                "total_time": pl.Float64,
+                "mean_time": pl.Float64,
+                "max_time": pl.Float64,
+                "entity_count": pl.Int64,
+            },
+        )
+
+    def to_csv(self, path: Union[str, pathlib.Path]) -> None:
+        """Write the summary from to_dataframe() to a CSV file.
+
+        Parameters
+        ----------
+        path
+            The path of the CSV file.
+        """
+        self.to_dataframe().write_csv(path)
+
 
 _T1 = TypeVar("_T1", bound=Component)
 _T2 = TypeVar("_T2", bound=Component)
@@ -1353,6 +3658,10 @@ class World:
         "_gameobject_manager",
         "_system_manager",
         "_event_manager",
+        "_tick",
+        "_entities_queried",
+        "_query_lock",
+        "_thread_queries",
     )
 
     _gameobject_manager: GameObjectManager
@@ -1363,12 +3672,103 @@ class World:
     """The systems run every simulation step."""
     _event_manager: EventManager
     """Manages event listeners."""
-
-    def __init__(self) -> None:
+    _tick: int
+    """The number of completed calls to step()."""
+    _entities_queried: int
+    """The total number of results returned by component queries."""
+    _query_lock: threading.Lock
+    """Guards the query count while systems run concurrently."""
+    _thread_queries: threading.local
+    """The number of query results returned to each thread (as ``count``)."""
+
+    def __init__(self, component_storage: Optional[ComponentStorage] = None) -> None:
+        """
+        Parameters
+        ----------
+        component_storage
+            The storage to use for component data, by default EsperComponentStorage.
+        """
         self._resource_manager = ResourceManager(self)
         self._system_manager = SystemManager(self)
         self._event_manager = EventManager(self)
-        self._gameobject_manager = GameObjectManager(self)
+        self._gameobject_manager = GameObjectManager(self, component_storage)
+        self._resource_manager.add_resource(CommandBuffer(self))
+        self._resource_manager.add_resource(SystemProfiler())
+        self._resource_manager.add_resource(SystemScheduler())
+        self._tick = 0
+        self._entities_queried = 0
+        self._query_lock = threading.Lock()
+        self._thread_queries = threading.local()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Locks and thread-local data cannot be pickled, so they are recreated.
+        return {
+            name: getattr(self, name)
+            for name in self.__slots__
+            if name not in ("_query_lock", "_thread_queries")
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._query_lock = threading.Lock()
+        self._thread_queries = threading.local()
+
+    @property
+    def tick(self) -> int:
+        """The number of completed simulation steps."""
+        return self._tick
+
+    @property
+    def change_tick(self) -> int:
+        """The current change tick (advanced before each system update)."""
+        return self._gameobject_manager.query_cache.change_tick
+
+    def increment_change_tick(self) -> int:
+        """Advance the change tick.
+
+        Returns
+        -------
+        int
+            The new change tick.
+        """
+        return self._gameobject_manager.query_cache.increment_change_tick()
+
+    def mark_components_changed(
+        self, component_type: Type[Component], gameobject_ids: Iterable[int]
+    ) -> None:
+        """Record that a component changed on several GameObjects at once.
+
+        This is the batch version of Component.mark_changed() for systems that
+        modify component data without going through the component instances.
+
+        Parameters
+        ----------
+        component_type
+            The type of the changed components.
+        gameobject_ids
+            The IDs of the GameObjects that own the components.
+        """
+        self._gameobject_manager.query_cache.on_components_changed(
+            gameobject_ids, component_type
+        )
+
+    @property
+    def entities_queried(self) -> int:
+        """The total number of results returned by component queries."""
+        return self._entities_queried
+
+    @property
+    def thread_entities_queried(self) -> int:
+        """The number of results returned by component queries on this thread."""
+        return getattr(self._thread_queries, "count", 0)
+
+    def _count_query_results(self, count: int) -> None:
+        """Add to the totals of results returned by component queries."""
+        with self._query_lock:
+            self._entities_queried += count
+
+        self._thread_queries.count = self.thread_entities_queried + count
 
     @property
     def system_manager(self) -> SystemManager:
@@ -1404,9 +3804,11 @@ class World:
             A list of tuples containing the ID of a GameObject and its respective
             component instance.
         """
-        return self._gameobject_manager.component_manager.get_component(  # type: ignore
-            component_type
-        )
+        results = self._gameobject_manager.query_cache.get_components((component_type,))
+
+        self._count_query_results(len(results))
+
+        return [(uid, cast(_CT, components[0])) for uid, components in results.items()]
 
     @overload
     def get_components(
@@ -1526,15 +3928,68 @@ class World:
             list of tuples containing a GameObject ID and an additional tuple with
             the instances of the given component types, in-order.
         """
-        ret = self._gameobject_manager.component_manager.get_components(
-            *component_types
-        )
+        ret = self._gameobject_manager.query_cache.get_components(component_types)
+
+        self._count_query_results(len(ret))
+
+        # We have to ignore the type because the cache stores results for any
+        # combination of component types
+        return list(ret.items())  # type: ignore
 
-        # We have to ignore the type because of esper's lax type hinting for
-        # world.get_components()
-        return ret  # type: ignore
+    def get_changed_components(
+        self,
+        component_types: tuple[Type[Component], ...],
+        filters: tuple[ChangeFilter, ...],
+        since: int,
+    ) -> list[tuple[int, tuple[Any, ...]]]:
+        """Get GameObjects with the given components that match change filters.
+
+        Only GameObjects whose components were added/changed after the given change
+        tick are visited, so the cost is proportional to the number of changes
+        instead of the number of GameObjects with the components.
+
+        Parameters
+        ----------
+        component_types
+            The components to check for.
+        filters
+            Added[...] and Changed[...] filters that must all match.
+        since
+            Only consider changes made after this change tick. Systems usually pass
+            their last_run_tick.
+
+        Returns
+        -------
+        list[tuple[int, tuple[Any, ...]]]
+            Tuples containing a GameObject ID and the instances of the given
+            component types, in-order. Results are ordered from the least to most
+            recent change of the first filter's component.
+        """
+        query_cache = self._gameobject_manager.query_cache
+        results = query_cache.get_components(component_types)
+
+        matches = [
+            (gameobject_id, results[gameobject_id])
+            for gameobject_id in query_cache.get_changes(filters[0], since)
+            if gameobject_id in results
+            and all(query_cache.matches(f, gameobject_id, since) for f in filters[1:])
+        ]
+
+        self._count_query_results(len(matches))
+
+        return matches
 
     def step(self) -> None:
         """Advance the simulation as single tick and call all the systems."""
         self._gameobject_manager.clear_dead_gameobjects()
         self._system_manager.update_systems()
+        self._tick += 1
+
+        # No active system can see changes made before its last update, so they do
+        # not need to be logged anymore
+        self._gameobject_manager.query_cache.prune_change_logs(
+            self._system_manager.get_oldest_run_tick()
+        )
+
+        # Changes made between steps should be visible to every system
+        self.increment_change_tick()
@@ -5,7 +5,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Iterable
 
 from neighborly.ecs import GameObject, World
 
@@ -29,6 +29,20 @@ class Effect(ABC):
         """Remove the effects of this effect."""
         raise NotImplementedError()
 
+    def apply_many(self, targets: Iterable[GameObject]) -> None:
+        """Apply this effect to several GameObjects.
+
+        Subclasses can override this method to share lookups and allocations
+        between targets.
+        """
+        for target in targets:
+            self.apply(target)
+
+    def remove_many(self, targets: Iterable[GameObject]) -> None:
+        """Remove this effect from several GameObjects."""
+        for target in targets:
+            self.remove(target)
+
     @classmethod
     @abstractmethod
     def instantiate(cls, world: World, params: dict[str, Any]) -> Effect:
@@ -7,11 +7,17 @@ social rules.
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Iterable
 
 from neighborly.components.location import LocationPreferenceRule, LocationPreferences
 from neighborly.components.relationship import SocialRule
-from neighborly.components.stats import StatModifier, StatModifierType
+from neighborly.components.skills import Skills
+from neighborly.components.stats import (
+    StatModifier,
+    StatModifierType,
+    Stats,
+    StatSchema,
+)
 from neighborly.ecs import GameObject, World
 from neighborly.effects.base_types import Effect
 from neighborly.helpers.relationship import (
@@ -20,7 +26,7 @@ from neighborly.helpers.relationship import (
 )
 from neighborly.helpers.skills import add_skill, get_skill, has_skill
 from neighborly.helpers.stats import get_stat
-from neighborly.libraries import EffectLibrary, PreconditionLibrary
+from neighborly.libraries import EffectLibrary, PreconditionLibrary, SkillLibrary
 from neighborly.preconditions.base_types import Precondition
 
 
@@ -65,6 +71,26 @@ class StatBuff(Effect):
     def remove(self, target: GameObject) -> None:
         get_stat(target, self.stat_id).remove_modifiers_from_source(self)
 
+    def apply_many(self, targets: Iterable[GameObject]) -> None:
+        # Modifiers are not changed after they are added, so the targets share one
+        slot = StatSchema.get_slot(self.stat_id)
+        modifier = StatModifier(
+            modifier_type=self.modifier_type,
+            value=self.amount,
+            source=self,
+        )
+
+        for target in targets:
+            target.get_component(Stats).get_stat_by_slot(slot).add_modifier(modifier)
+
+    def remove_many(self, targets: Iterable[GameObject]) -> None:
+        slot = StatSchema.get_slot(self.stat_id)
+
+        for target in targets:
+            target.get_component(Stats).get_stat_by_slot(
+                slot
+            ).remove_modifiers_from_source(self)
+
     @classmethod
     def instantiate(cls, world: World, params: dict[str, Any]) -> Effect:
         modifier_name: str = params.get("modifier_type", "FLAT")
@@ -104,6 +130,26 @@ class IncreaseSkill(Effect):
         # Skill increases the skill stat. Cannot be removed.
         return
 
+    def apply_many(self, targets: Iterable[GameObject]) -> None:
+        skill = None
+
+        for target in targets:
+            if skill is None:
+                # All targets belong to the same world
+                skill = target.world.resource_manager.get_resource(
+                    SkillLibrary
+                ).get_skill(self.skill_name)
+
+            skills = target.get_component(Skills)
+
+            if not skills.has_skill(skill):
+                skills.add_skill(skill)
+
+            skills.get_skill(skill).base_value += self.amount
+
+    def remove_many(self, targets: Iterable[GameObject]) -> None:
+        return
+
     @classmethod
     def instantiate(cls, world: World, params: dict[str, Any]) -> Effect:
         skill_name: str = params["skill"]
@@ -159,6 +205,17 @@ class AddLocationPreference(Effect):
     def remove(self, target: GameObject) -> None:
         target.get_component(LocationPreferences).remove_rules_from_source(self)
 
+    def apply_many(self, targets: Iterable[GameObject]) -> None:
+        # Rules are not changed after they are added, so the targets share one
+        rule = LocationPreferenceRule(
+            preconditions=self.preconditions,
+            probability=self.probability,
+            source=self,
+        )
+
+        for target in targets:
+            target.get_component(LocationPreferences).add_rule(rule)
+
     @classmethod
     def instantiate(cls, world: World, params: dict[str, Any]) -> Effect:
         preconditions_data: list[dict[str, Any]] = params.get("preconditions", [])
@@ -29,6 +29,7 @@ from neighborly.helpers.relationship import (
     deactivate_relationships,
     get_relationship,
     get_relationships_with_traits,
+    peek_relationship,
 )
 from neighborly.helpers.traits import add_trait, has_trait, remove_trait
 from neighborly.life_event import EventRole, LifeEvent
@@ -519,14 +520,14 @@ class DepartSettlement(LifeEvent):
                 if resident == character:
                     continue
 
-                rel_to_resident = get_relationship(character, resident)
+                rel_to_resident = peek_relationship(character, resident)
 
-                if has_trait(rel_to_resident, "spouse") and not has_trait(
+                if rel_to_resident.has_trait("spouse") and not has_trait(
                     resident, "departed"
                 ):
                     DepartSettlement(resident).dispatch()
 
-                elif has_trait(rel_to_resident, "child") and not has_trait(
+                elif rel_to_resident.has_trait("child") and not has_trait(
                     resident, "departed"
                 ):
                     DepartSettlement(resident).dispatch()
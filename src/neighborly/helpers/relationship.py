@@ -1,18 +1,21 @@
-"""Relationship System Helper Functions.
+"""Relationship System Helper Functions."""
 
-"""
+from typing import cast
 
 from neighborly.components.relationship import (
+    RELATIONSHIP_STATS,
     Relationship,
+    RelationshipArchive,
     Relationships,
+    RelationshipStore,
+    RelationshipView,
     SocialRule,
     SocialRules,
 )
 from neighborly.components.stats import Stat, Stats
 from neighborly.components.traits import Traits
-from neighborly.ecs import GameObject
+from neighborly.ecs import GameObject, World
 from neighborly.helpers.stats import add_stat
-from neighborly.helpers.traits import has_trait
 
 
 def add_relationship(owner: GameObject, target: GameObject) -> GameObject:
@@ -43,14 +46,14 @@ def add_relationship(owner: GameObject, target: GameObject) -> GameObject:
         ],
     )
 
-    add_stat(relationship, "reputation", Stat(base_value=0, bounds=(-100, 100)))
-    add_stat(relationship, "romance", Stat(base_value=0, bounds=(-100, 100)))
-    add_stat(relationship, "compatibility", Stat(base_value=0))
-    add_stat(relationship, "romantic_compatibility", Stat(base_value=0))
-    add_stat(relationship, "interaction_score", Stat(base_value=0, bounds=(0, 10)))
+    for stat_id, bounds in RELATIONSHIP_STATS:
+        add_stat(relationship, stat_id, Stat(base_value=0, bounds=bounds))
 
     relationship.name = f"{owner.name} -> {target.name}"
 
+    if store := owner.world.resource_manager.try_resource(RelationshipStore):
+        store.add_relationship(relationship)
+
     owner.get_component(Relationships).add_outgoing_relationship(target, relationship)
     target.get_component(Relationships).add_incoming_relationship(owner, relationship)
 
@@ -97,6 +100,50 @@ def get_relationship(
     return add_relationship(owner, target)
 
 
+_DEFAULT_RELATIONSHIP_VIEW = RelationshipView()
+"""The view shared by all relationships that do not exist."""
+
+
+def peek_relationship(owner: GameObject, target: GameObject) -> RelationshipView:
+    """Get a read-only view of a relationship from one GameObject to another.
+
+    Unlike get_relationship(), this function never creates a relationship, and it
+    does not create GameObjects for relationships in a RelationshipStore. If there is
+    no relationship, it returns a shared view with the stat values of a new
+    relationship (before any social rules apply) and no traits. Use
+    get_relationship() to change a relationship.
+
+    Parameters
+    ----------
+    owner
+        The owner of the relationship.
+    target
+        The target of the relationship.
+
+    Returns
+    -------
+    RelationshipView
+        A view of the relationship.
+    """
+    relationships = owner.get_component(Relationships)
+
+    if store := owner.world.resource_manager.try_resource(RelationshipStore):
+        row = store.get_row(owner, target)
+
+        if row is None:
+            return _DEFAULT_RELATIONSHIP_VIEW
+
+        if not store.has_gameobject(row):
+            return RelationshipView(relationships, target, store=store, row=row)
+
+    elif not relationships.has_outgoing_relationship(target):
+        return _DEFAULT_RELATIONSHIP_VIEW
+
+    relationship = relationships.get_outgoing_relationship(target)
+
+    return RelationshipView(relationships, target, relationship.get_component(Stats))
+
+
 def has_relationship(owner: GameObject, target: GameObject) -> bool:
     """Check if there is an existing relationship from the owner to the target.
 
@@ -131,14 +178,22 @@ def destroy_relationship(owner: GameObject, target: GameObject) -> bool:
     bool
         Returns True if a relationship was removed. False otherwise.
     """
-    if has_relationship(owner, target):
-        relationship = get_relationship(owner, target)
-        owner.get_component(Relationships).remove_outgoing_relationship(target)
-        target.get_component(Relationships).remove_incoming_relationship(owner)
+    if not has_relationship(owner, target):
+        return False
+
+    store = owner.world.resource_manager.try_resource(RelationshipStore)
+    relationship = None if store else get_relationship(owner, target)
+
+    owner.get_component(Relationships).remove_outgoing_relationship(target)
+    target.get_component(Relationships).remove_incoming_relationship(owner)
+
+    if store:
+        relationship = store.remove_relationship(owner, target)
+
+    if relationship is not None:
         relationship.destroy()
-        return True
 
-    return False
+    return True
 
 
 def get_relationships_with_traits(
@@ -158,13 +213,15 @@ def get_relationships_with_traits(
     list[GameObject]
         Relationships with the given traits.
     """
-    matches: list[GameObject] = []
+    relationships = gameobject.get_component(Relationships)
 
-    for _, relationship in gameobject.get_component(Relationships).outgoing.items():
-        if all(has_trait(relationship, trait) for trait in traits):
-            matches.append(relationship)
+    if not traits:
+        return list(relationships.outgoing.values())
 
-    return matches
+    return [
+        relationships.get_outgoing_relationship(target)
+        for target in relationships.get_outgoing_with_traits(*traits)
+    ]
 
 
 def add_social_rule(gameobject: GameObject, rule: SocialRule) -> None:
@@ -242,6 +299,16 @@ def remove_all_social_rules_from_source(gameobject: GameObject, source: object)
 def deactivate_relationships(gameobject: GameObject) -> None:
     """Deactivates all an objects incoming and outgoing relationships."""
 
+    if store := gameobject.world.resource_manager.try_resource(RelationshipStore):
+        # Deactivate relationships without creating GameObjects for them
+        for row in store.get_outgoing_rows(gameobject).values():
+            store.deactivate(row)
+
+        for row in store.get_incoming_rows(gameobject).values():
+            store.deactivate(row)
+
+        return
+
     relationships = gameobject.get_component(Relationships)
 
     for _, relationship in relationships.outgoing.items():
@@ -249,3 +316,49 @@ def deactivate_relationships(gameobject: GameObject) -> None:
 
     for _, relationship in relationships.incoming.items():
         relationship.deactivate()
+
+
+def archive_relationships(world: World) -> int:
+    """Move relationships between inactive GameObjects into the RelationshipArchive.
+
+    Archived relationships are destroyed, so they no longer appear in the owner's or
+    target's Relationships component. Relationships in a RelationshipStore that do
+    not have GameObjects are archived from the store's rows.
+
+    Parameters
+    ----------
+    world
+        The world instance. It must have a RelationshipArchive resource.
+
+    Returns
+    -------
+    int
+        The number of relationships archived.
+    """
+    archive = world.resource_manager.get_resource(RelationshipArchive)
+
+    pairs = [
+        (relationships.gameobject, target)
+        for _, (relationships,) in world.get_components((Relationships,))
+        if not relationships.gameobject.is_active
+        for target in relationships.outgoing
+        if not target.is_active
+    ]
+
+    if store := world.resource_manager.try_resource(RelationshipStore):
+        rows = [cast(int, store.get_row(owner, target)) for owner, target in pairs]
+
+        archive.add_relationships(
+            store.get_relationship(row) for row in rows if store.has_gameobject(row)
+        )
+        archive.add_rows(store, [row for row in rows if not store.has_gameobject(row)])
+
+    else:
+        archive.add_relationships(
+            get_relationship(owner, target) for owner, target in pairs
+        )
+
+    for owner, target in pairs:
+        destroy_relationship(owner, target)
+
+    return len(pairs)
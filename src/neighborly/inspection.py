@@ -6,6 +6,7 @@ Tools and helper functions for inspecting simulations.
 
 from typing import Callable, Union
 
+import polars as pl
 import tabulate
 
 from neighborly.__version__ import VERSION
@@ -19,7 +20,11 @@ from neighborly.components.business import (
 )
 from neighborly.components.character import Character
 from neighborly.components.location import FrequentedBy, FrequentedLocations
-from neighborly.components.relationship import Relationship, Relationships
+from neighborly.components.relationship import (
+    Relationship,
+    RelationshipArchive,
+    Relationships,
+)
 from neighborly.components.residence import (
     Resident,
     ResidentialBuilding,
@@ -29,7 +34,7 @@ from neighborly.components.settlement import District, Settlement
 from neighborly.components.skills import Skill, Skills
 from neighborly.components.stats import Stats
 from neighborly.components.traits import Trait, Traits
-from neighborly.ecs import Active, GameObject, GameObjectNotFoundError
+from neighborly.ecs import Active, GameObject, GameObjectNotFoundError, World
 from neighborly.helpers.stats import get_stat
 from neighborly.life_event import PersonalEventHistory
 from neighborly.simulation import Simulation
@@ -482,6 +487,24 @@ def _get_relationships_table(obj: GameObject) -> str:
             )
         )
 
+    if archive := obj.world.resource_manager.try_resource(RelationshipArchive):
+        for row in archive.get_outgoing(obj.uid).iter_rows(named=True):
+            stats = archive.get_stats(row["uid"])
+
+            relationship_data.append(
+                (
+                    False,
+                    row["uid"],
+                    _get_name(obj.world, row["target"]),
+                    int(stats["reputation"]),
+                    int(stats["romance"]),
+                    stats["compatibility"],
+                    stats["romantic_compatibility"],
+                    int(stats["interaction_score"]),
+                    ", ".join(archive.get_traits(row["uid"])),
+                )
+            )
+
     output = "=== Relationships ===\n"
     output += tabulate.tabulate(
         relationship_data,
@@ -502,6 +525,43 @@ def _get_relationships_table(obj: GameObject) -> str:
     return output
 
 
+def _get_name(world: World, uid: int) -> str:
+    """Get the name of a GameObject, or its UID if it no longer exists."""
+    try:
+        return world.gameobject_manager.get_gameobject(uid).name
+    except GameObjectNotFoundError:
+        return str(uid)
+
+
+def _get_archived_relationship_description(
+    world: World, archive: RelationshipArchive, uid: int
+) -> str:
+    """Generate inspector output for a relationship in the RelationshipArchive."""
+    relationship = archive.relationships.filter(pl.col("uid") == uid).row(0, named=True)
+
+    output = "Relationship (Archived)\n"
+    output += "=======================\n"
+    output += "\n"
+    output += f"UID: {uid}\n"
+    output += f"Name: {relationship['name']}\n"
+    output += "\n"
+    output += f"Owner: {_get_name(world, relationship['owner'])}\n"
+    output += f"Target: {_get_name(world, relationship['target'])}\n"
+    output += "\n"
+    output += "=== Stats ===\n"
+    output += tabulate.tabulate(
+        list(archive.get_stats(uid).items()), headers=("Stat", "Value"), numalign="left"
+    )
+    output += "\n\n"
+    output += "=== Traits ===\n"
+    output += tabulate.tabulate(
+        [(name,) for name in archive.get_traits(uid)], headers=("Name",)
+    )
+    output += "\n"
+
+    return output
+
+
 def _get_stats_table(obj: GameObject) -> str:
     """Generate a table for stats."""
     stats = obj.try_component(Stats)
@@ -657,7 +717,12 @@ def inspect(sim: Simulation, obj: Union[int, GameObject]) -> None:
         try:
             obj_ref = sim.world.gameobject_manager.get_gameobject(obj)
         except GameObjectNotFoundError:
-            print(f"No GameObject exists with the ID: {obj}.")
+            archive = sim.world.resource_manager.try_resource(RelationshipArchive)
+
+            if archive is not None and archive.has_relationship(obj):
+                print(_get_archived_relationship_description(sim.world, archive, obj))
+            else:
+                print(f"No GameObject exists with the ID: {obj}.")
             return
     else:
         obj_ref = obj
@@ -32,6 +32,7 @@ from neighborly.helpers.location import add_frequented_location
 from neighborly.helpers.relationship import (
     get_relationship,
     get_relationships_with_traits,
+    peek_relationship,
 )
 from neighborly.helpers.stats import get_stat
 from neighborly.helpers.traits import add_trait, has_trait, remove_trait
@@ -104,10 +105,9 @@ class StartANewJob(LifeEvent):
         business_owner = event.roles["business"].get_component(Business).owner
 
         if business_owner is not None:
-            return get_stat(
-                get_relationship(business_owner, subject),
-                "reputation",
-            ).normalized
+            return peek_relationship(business_owner, subject).get_normalized(
+                "reputation"
+            )
 
         return -1
 
@@ -363,7 +363,7 @@ class StartDating(LifeEvent):
         subject = event.roles["subject"]
         other = event.roles["partner"]
 
-        if has_trait(get_relationship(subject, other), "crush"):
+        if peek_relationship(subject, other).has_trait("crush"):
             return 0.7
 
         return 0.2
@@ -375,7 +375,7 @@ class StartDating(LifeEvent):
         subject = event.roles["subject"]
         other = event.roles["partner"]
 
-        if has_trait(get_relationship(other, subject), "crush"):
+        if peek_relationship(other, subject).has_trait("crush"):
             return 0.7
 
         return 0.2
@@ -385,10 +385,9 @@ class StartDating(LifeEvent):
     def romance_to_partner(event: StartDating) -> float:
         """Consider the romance from the partner to the subject."""
         return (
-            get_stat(
-                get_relationship(event.roles["subject"], event.roles["partner"]),
-                "romance",
-            ).normalized
+            peek_relationship(
+                event.roles["subject"], event.roles["partner"]
+            ).get_normalized("romance")
             ** 2
         )
 
@@ -397,10 +396,9 @@ class StartDating(LifeEvent):
     def romance_to_subject(event: StartDating) -> float:
         """Consider the romance from the partner to the subject."""
         return (
-            get_stat(
-                get_relationship(event.roles["partner"], event.roles["subject"]),
-                "romance",
-            ).normalized
+            peek_relationship(
+                event.roles["partner"], event.roles["subject"]
+            ).get_normalized("romance")
             ** 2
         )
 
@@ -424,19 +422,17 @@ class StartDating(LifeEvent):
         if len(get_relationships_with_traits(subject, "dating")) > 0:
             return None
 
-        relationships = list(subject.get_component(Relationships).outgoing.items())
-
         potential_partners: list[GameObject] = []
         partner_weights: list[float] = []
 
-        for target, relationship in relationships:
+        for target in subject.get_component(Relationships).outgoing:
             if target.get_component(Character).life_stage <= LifeStage.ADOLESCENT:
                 continue
 
             if target.is_active is False:
                 continue
 
-            romance = get_stat(relationship, "romance").normalized
+            romance = peek_relationship(subject, target).get_normalized("romance")
 
             if romance > 0:
                 potential_partners.append(target)
@@ -503,7 +499,7 @@ class GetMarried(LifeEvent):
         """Consider the romance from the partner to the subject."""
         subject_0, subject_1 = event.roles.get_all("subject")
 
-        return get_stat(get_relationship(subject_0, subject_1), "romance").normalized
+        return peek_relationship(subject_0, subject_1).get_normalized("romance")
 
     @staticmethod
     @event_consideration
@@ -511,7 +507,7 @@ class GetMarried(LifeEvent):
         """Consider the romance from the partner to the subject."""
         subject_0, subject_1 = event.roles.get_all("subject")
 
-        return get_stat(get_relationship(subject_1, subject_0), "romance").normalized
+        return peek_relationship(subject_1, subject_0).get_normalized("romance")
 
     @classmethod
     def instantiate(cls, subject: GameObject, **kwargs: Any) -> LifeEvent | None:
@@ -583,7 +579,7 @@ class GetMarried(LifeEvent):
         for rel in get_relationships_with_traits(subject_0, "child"):
             if rel.is_active:
                 child = rel.get_component(Relationship).target
-                if not has_trait(get_relationship(subject_1, child), "child"):
+                if not peek_relationship(subject_1, child).has_trait("child"):
                     add_trait(get_relationship(subject_1, child), "child")
                     add_trait(get_relationship(subject_1, child), "step_child")
                     add_trait(get_relationship(child, subject_1), "parent")
@@ -592,7 +588,7 @@ class GetMarried(LifeEvent):
         for rel in get_relationships_with_traits(subject_1, "child"):
             if rel.is_active:
                 child = rel.get_component(Relationship).target
-                if not has_trait(get_relationship(subject_0, child), "child"):
+                if not peek_relationship(subject_0, child).has_trait("child"):
                     add_trait(get_relationship(subject_0, child), "child")
                     add_trait(get_relationship(subject_0, child), "step_child")
                     add_trait(get_relationship(child, subject_0), "parent")
@@ -620,13 +616,9 @@ class GetDivorced(LifeEvent):
     @event_consideration
     def romance_to_spouse(event: GetDivorced) -> float:
         """Consider how in-love the subject is with the ex_spouse"""
-        return (
-            1.0
-            - get_stat(
-                get_relationship(event.roles["subject"], event.roles["ex_spouse"]),
-                "romance",
-            ).normalized
-        )
+        return 1.0 - peek_relationship(
+            event.roles["subject"], event.roles["ex_spouse"]
+        ).get_normalized("romance")
 
     @classmethod
     def instantiate(cls, subject: GameObject, **kwargs: Any) -> Optional[LifeEvent]:
@@ -697,13 +689,9 @@ class BreakUp(LifeEvent):
     @event_consideration
     def romance_to_partner(event: StartDating) -> float:
         """Consider the romance from the partner to the subject."""
-        return (
-            1.0
-            - get_stat(
-                get_relationship(event.roles["subject"], event.roles["ex_partner"]),
-                "romance",
-            ).normalized
-        )
+        return 1.0 - peek_relationship(
+            event.roles["subject"], event.roles["ex_partner"]
+        ).get_normalized("romance")
 
     @classmethod
     def instantiate(cls, subject: GameObject, **kwargs: Any) -> LifeEvent | None:
@@ -1079,10 +1067,9 @@ class BecomeFriends(LifeEvent):
     def other_reputation_consideration(event: BecomeFriends) -> float:
         """Consider the reputation from the subject to the other person."""
         return (
-            get_stat(
-                get_relationship(event.roles["other"], event.roles["subject"]),
-                "reputation",
-            ).normalized
+            peek_relationship(
+                event.roles["other"], event.roles["subject"]
+            ).get_normalized("reputation")
             ** 2
         )
 
@@ -1091,10 +1078,9 @@ class BecomeFriends(LifeEvent):
     def subject_reputation_consideration(event: BecomeFriends) -> float:
         """Consider the reputation from the subject to the other person."""
         return (
-            get_stat(
-                get_relationship(event.roles["subject"], event.roles["other"]),
-                "reputation",
-            ).normalized
+            peek_relationship(
+                event.roles["subject"], event.roles["other"]
+            ).get_normalized("reputation")
             ** 2
         )
 
@@ -1102,8 +1088,8 @@ class BecomeFriends(LifeEvent):
     @event_consideration
     def are_enemies(event: BecomeFriends) -> float:
         """Consider if they are enemies."""
-        if has_trait(
-            get_relationship(event.roles["other"], event.roles["subject"]), "enemy"
+        if peek_relationship(event.roles["other"], event.roles["subject"]).has_trait(
+            "enemy"
         ):
             return 0.01
         return -1
@@ -1118,7 +1104,9 @@ class BecomeFriends(LifeEvent):
         options: list[GameObject] = []
         scores: list[float] = []
 
-        for target, rel in subject.get_component(Relationships).outgoing.items():
+        for target in subject.get_component(Relationships).outgoing:
+            rel = peek_relationship(subject, target)
+
             # Only allow friendships between characters
             if not target.has_component(Character):
                 continue
@@ -1126,13 +1114,13 @@ class BecomeFriends(LifeEvent):
             if target.is_active is False:
                 continue
 
-            if has_trait(rel, "friend"):
+            if rel.has_trait("friend"):
                 continue
 
-            if get_stat(rel, "reputation").value <= 0:
+            if rel.get_stat_value("reputation") <= 0:
                 continue
 
-            score = get_stat(rel, "reputation").normalized
+            score = rel.get_normalized("reputation")
             if score > 0:
                 options.append(target)
                 scores.append(score)
@@ -1178,10 +1166,9 @@ class DissolveFriendship(LifeEvent):
         """Consider the reputation from the subject to the other person."""
         return (
             1
-            - get_stat(
-                get_relationship(event.roles["other"], event.roles["subject"]),
-                "reputation",
-            ).normalized
+            - peek_relationship(
+                event.roles["other"], event.roles["subject"]
+            ).get_normalized("reputation")
             ** 2
         )
 
@@ -1191,10 +1178,9 @@ class DissolveFriendship(LifeEvent):
         """Consider the reputation from the subject to the other person."""
         return (
             1
-            - get_stat(
-                get_relationship(event.roles["subject"], event.roles["other"]),
-                "reputation",
-            ).normalized
+            - peek_relationship(
+                event.roles["subject"], event.roles["other"]
+            ).get_normalized("reputation")
             ** 2
         )
 
@@ -1208,18 +1194,20 @@ class DissolveFriendship(LifeEvent):
         options: list[GameObject] = []
         scores: list[float] = []
 
-        for target, rel in subject.get_component(Relationships).outgoing.items():
+        for target in subject.get_component(Relationships).outgoing:
+            rel = peek_relationship(subject, target)
+
             # Only allow friendships between characters
             if not target.has_component(Character):
                 continue
 
-            if not has_trait(rel, "friend"):
+            if not rel.has_trait("friend"):
                 continue
 
             if target.is_active is False:
                 continue
 
-            score = 1.0 - get_stat(rel, "reputation").normalized
+            score = 1.0 - rel.get_normalized("reputation")
             if score > 0:
                 options.append(target)
                 scores.append(score)
@@ -1263,8 +1251,8 @@ class BecomeEnemies(LifeEvent):
     @event_consideration
     def are_friends(event: BecomeEnemies) -> float:
         """Consider if they are friends."""
-        if has_trait(
-            get_relationship(event.roles["other"], event.roles["subject"]), "friend"
+        if peek_relationship(event.roles["other"], event.roles["subject"]).has_trait(
+            "friend"
         ):
             return 0.01
         return -1
@@ -1275,10 +1263,9 @@ class BecomeEnemies(LifeEvent):
         """Consider the reputation from the subject to the other person."""
         return (
             1
-            - get_stat(
-                get_relationship(event.roles["other"], event.roles["subject"]),
-                "reputation",
-            ).normalized
+            - peek_relationship(
+                event.roles["other"], event.roles["subject"]
+            ).get_normalized("reputation")
         ) ** 2
 
     @staticmethod
@@ -1287,10 +1274,9 @@ class BecomeEnemies(LifeEvent):
         """Consider the reputation from the subject to the other person."""
         return (
             1
-            - get_stat(
-                get_relationship(event.roles["subject"], event.roles["other"]),
-                "reputation",
-            ).normalized
+            - peek_relationship(
+                event.roles["subject"], event.roles["other"]
+            ).get_normalized("reputation")
         ) ** 2
 
     @classmethod
@@ -1303,7 +1289,9 @@ class BecomeEnemies(LifeEvent):
         options: list[GameObject] = []
         scores: list[float] = []
 
-        for target, rel in subject.get_component(Relationships).outgoing.items():
+        for target in subject.get_component(Relationships).outgoing:
+            rel = peek_relationship(subject, target)
+
             # Only allow enmity between characters
             if not target.has_component(Character):
                 continue
@@ -1311,13 +1299,13 @@ class BecomeEnemies(LifeEvent):
             if target.is_active is False:
                 continue
 
-            if has_trait(rel, "enemy"):
+            if rel.has_trait("enemy"):
                 continue
 
-            if get_stat(rel, "reputation").value >= 0:
+            if rel.get_stat_value("reputation") >= 0:
                 continue
 
-            score = 1 - get_stat(rel, "reputation").normalized
+            score = 1 - rel.get_normalized("reputation")
             if score > 0:
                 options.append(target)
                 scores.append(score)
@@ -1362,10 +1350,9 @@ class DissolveEnmity(LifeEvent):
     def other_reputation_consideration(event: BecomeFriends) -> float:
         """Consider the reputation from the subject to the other person."""
         return (
-            get_stat(
-                get_relationship(event.roles["other"], event.roles["subject"]),
-                "reputation",
-            ).normalized
+            peek_relationship(
+                event.roles["other"], event.roles["subject"]
+            ).get_normalized("reputation")
             ** 2
         )
 
@@ -1374,10 +1361,9 @@ class DissolveEnmity(LifeEvent):
     def subject_reputation_consideration(event: BecomeFriends) -> float:
         """Consider the reputation from the subject to the other person."""
         return (
-            get_stat(
-                get_relationship(event.roles["subject"], event.roles["other"]),
-                "reputation",
-            ).normalized
+            peek_relationship(
+                event.roles["subject"], event.roles["other"]
+            ).get_normalized("reputation")
             ** 2
         )
 
@@ -1391,7 +1377,9 @@ class DissolveEnmity(LifeEvent):
         options: list[GameObject] = []
         scores: list[float] = []
 
-        for target, rel in subject.get_component(Relationships).outgoing.items():
+        for target in subject.get_component(Relationships).outgoing:
+            rel = peek_relationship(subject, target)
+
             # Only allow friendships between characters
             if not target.has_component(Character):
                 continue
@@ -1399,10 +1387,10 @@ class DissolveEnmity(LifeEvent):
             if target.is_active is False:
                 continue
 
-            if not has_trait(rel, "enemy"):
+            if not rel.has_trait("enemy"):
                 continue
 
-            score = get_stat(rel, "reputation").normalized
+            score = rel.get_normalized("reputation")
             if score > 0:
                 options.append(target)
                 scores.append(score)
@@ -1461,10 +1449,9 @@ class FormCrush(LifeEvent):
     def romance_consideration(event: FormCrush) -> float:
         """Consider a character's romance value."""
         return (
-            get_stat(
-                get_relationship(event.roles["subject"], event.roles["other"]),
-                "romance",
-            ).normalized
+            peek_relationship(
+                event.roles["subject"], event.roles["other"]
+            ).get_normalized("romance")
             ** 2
         )
 
@@ -1476,7 +1463,9 @@ class FormCrush(LifeEvent):
         options: list[GameObject] = []
         scores: list[float] = []
 
-        for target, rel in subject.get_component(Relationships).outgoing.items():
+        for target in subject.get_component(Relationships).outgoing:
+            rel = peek_relationship(subject, target)
+
             # Only allow friendships between characters
             if not target.has_component(Character):
                 continue
@@ -1484,13 +1473,13 @@ class FormCrush(LifeEvent):
             if target.is_active is False:
                 continue
 
-            if has_trait(rel, "crush"):
+            if rel.has_trait("crush"):
                 continue
 
-            if get_stat(rel, "romance").value <= 0:
+            if rel.get_stat_value("romance") <= 0:
                 continue
 
-            score = get_stat(rel, "romance").normalized
+            score = rel.get_normalized("romance")
             if score > 0:
                 options.append(target)
                 scores.append(score)
@@ -1612,10 +1601,7 @@ class PromotedToBusinessOwner(LifeEvent):
 
         if business_owner is not None:
             return (
-                get_stat(
-                    get_relationship(business_owner, subject),
-                    "reputation",
-                ).normalized
+                peek_relationship(business_owner, subject).get_normalized("reputation")
                 ** 2
             )
 
@@ -1712,10 +1698,9 @@ class JobPromotion(LifeEvent):
         business_owner = event.roles["business"].get_component(Business).owner
 
         if business_owner is not None:
-            return get_stat(
-                get_relationship(business_owner, subject),
-                "reputation",
-            ).normalized
+            return peek_relationship(business_owner, subject).get_normalized(
+                "reputation"
+            )
 
         return -1
 
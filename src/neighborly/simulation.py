@@ -6,15 +6,23 @@ This module contains class definitions for creating simulation instances.
 
 from __future__ import annotations
 
+import io
 import json
 import logging
 import pathlib
+import pickle
 import random
-from typing import Optional
+import zlib
+from typing import Any, Optional, Union
 
+import attrs
+
+from neighborly.components.relationship import RelationshipArchive, RelationshipStore
+from neighborly.components.stats import StatStore
 from neighborly.config import SimulationConfig
 from neighborly.data_collection import DataCollectionSystems, DataTables
 from neighborly.datetime import SimDate
+from neighborly.defs.base_types import ContentDefinition
 from neighborly.defs.defaults import (
     DefaultBusinessDef,
     DefaultCharacterDef,
@@ -26,7 +34,13 @@ from neighborly.defs.defaults import (
     DefaultSpeciesDef,
     DefaultTraitDef,
 )
-from neighborly.ecs import World
+from neighborly.ecs import (
+    ArchetypeComponentStorage,
+    ComponentStorage,
+    EsperComponentStorage,
+    SystemProfiler,
+    World,
+)
 from neighborly.effects.effects import (
     AddLocationPreference,
     AddSocialRule,
@@ -58,7 +72,9 @@ from neighborly.preconditions.defaults import (
 )
 from neighborly.systems import (
     AgingSystem,
+    ArchiveRelationshipsSystem,
     ChildBirthSystem,
+    CompactRelationshipsSystem,
     CompileBusinessDefsSystem,
     CompileCharacterDefsSystem,
     CompileDistrictDefsSystem,
@@ -78,6 +94,7 @@ from neighborly.systems import (
     MeetNewPeopleSystem,
     PassiveReputationChange,
     PassiveRomanceChange,
+    RecalculateStatsSystem,
     SpawnNewBusinessesSystem,
     SpawnNewResidentSystem,
     SpawnResidentialBuildingsSystem,
@@ -86,6 +103,52 @@ from neighborly.systems import (
 )
 from neighborly.tracery import Tracery
 
+CHECKPOINT_VERSION = 1
+"""The checkpoint format version written by Simulation.to_checkpoint()."""
+
+
+class _ForkPickler(pickle.Pickler):
+    """Pickles a simulation while leaving out the content definitions.
+
+    Content definitions are not modified after they are loaded. So, instead of
+    copying them, the pickler stores a reference and the unpickler returns the
+    same instance. Everything else is pickled normally.
+    """
+
+    shared_objects: list[object]
+    """Objects referenced by the pickled data in the order they were found."""
+
+    def __init__(self, file: io.BytesIO) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.shared_objects = []
+        self._shared_ids: dict[int, int] = {}
+
+    def persistent_id(self, obj: Any) -> Optional[int]:
+        if not isinstance(obj, ContentDefinition):
+            return None
+
+        key = id(obj)
+
+        if key not in self._shared_ids:
+            self._shared_ids[key] = len(self.shared_objects)
+            self.shared_objects.append(obj)
+
+        return self._shared_ids[key]
+
+
+class _ForkUnpickler(pickle.Unpickler):
+    """Unpickles a simulation pickled by a _ForkPickler."""
+
+    shared_objects: list[object]
+    """Objects referenced by the pickled data."""
+
+    def __init__(self, file: io.BytesIO, shared_objects: list[object]) -> None:
+        super().__init__(file)
+        self.shared_objects = shared_objects
+
+    def persistent_load(self, pid: Any) -> object:
+        return self.shared_objects[pid]
+
 
 class Simulation:
     """A Neighborly simulation instance."""
@@ -107,7 +170,7 @@ class Simulation:
             provided.
         """
         self._config = config if config is not None else SimulationConfig()
-        self._world = World()
+        self._world = World(component_storage=self._create_component_storage())
 
         # Seed the global rng for third-party packages
         random.seed(self._config.seed)
@@ -119,10 +182,32 @@ class Simulation:
         self._init_traits()
         self._init_logging()
 
+    def _create_component_storage(self) -> ComponentStorage:
+        """Create the component storage backend specified in the config."""
+        if self._config.component_storage == "esper":
+            return EsperComponentStorage()
+
+        if self._config.component_storage == "archetype":
+            return ArchetypeComponentStorage()
+
+        raise ValueError(
+            f"Unknown component storage: {self._config.component_storage!r}."
+        )
+
     def _init_resources(self) -> None:
         """Initialize built-in resources."""
         self.world.resource_manager.add_resource(self._config)
+        self.world.resource_manager.get_resource(SystemProfiler).enabled = (
+            self._config.profile_systems
+        )
+        self.world.event_manager.queued = self._config.queue_events
         self.world.resource_manager.add_resource(random.Random(self._config.seed))
+        if self._config.columnar_stats:
+            self.world.resource_manager.add_resource(StatStore())
+        if self._config.compact_relationships:
+            self.world.resource_manager.add_resource(RelationshipStore(self.world))
+        if self._config.archive_relationships:
+            self.world.resource_manager.add_resource(RelationshipArchive())
         self.world.resource_manager.add_resource(SimDate())
         self.world.resource_manager.add_resource(DataTables())
         self.world.resource_manager.add_resource(CharacterLibrary(DefaultCharacterDef))
@@ -184,6 +269,9 @@ class Simulation:
         )
 
         # Add core update systems
+        self.world.system_manager.add_system(
+            system=RecalculateStatsSystem(), system_group=EarlyUpdateSystems
+        )
         self.world.system_manager.add_system(
             system=SpawnNewResidentSystem(), system_group=UpdateSystems
         )
@@ -223,6 +311,12 @@ class Simulation:
         self.world.system_manager.add_system(
             system=DeathSystem(), system_group=UpdateSystems
         )
+        self.world.system_manager.add_system(
+            system=ArchiveRelationshipsSystem(), system_group=LateUpdateSystems
+        )
+        self.world.system_manager.add_system(
+            system=CompactRelationshipsSystem(), system_group=LateUpdateSystems
+        )
 
     def _init_effects(self) -> None:
         """Initialize built-in Effect definitions."""
@@ -513,9 +607,141 @@ class Simulation:
         self._world.step()
         self.date.increment_month()
 
+    def to_checkpoint(self) -> bytes:
+        """Capture the full simulation state in memory.
+
+        The checkpoint contains every GameObject, component, resource, system, and
+        the state of the random number generators. So, a simulation restored from it
+        continues exactly as this one would.
+
+        Returns
+        -------
+        bytes
+            The compressed simulation state.
+        """
+        state = {
+            "version": CHECKPOINT_VERSION,
+            "simulation": self,
+            "global_rng_state": random.getstate(),
+        }
+
+        return zlib.compress(pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL), 1)
+
+    @classmethod
+    def from_checkpoint(cls, data: bytes) -> Simulation:
+        """Restore a simulation from an in-memory checkpoint.
+
+        Parameters
+        ----------
+        data
+            A checkpoint created by to_checkpoint().
+
+        Returns
+        -------
+        Simulation
+            The restored simulation.
+        """
+        state = pickle.loads(zlib.decompress(data))
+
+        if state.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(
+                f"Unsupported checkpoint version: {state.get('version')!r}."
+            )
+
+        simulation: Simulation = state["simulation"]
+
+        random.setstate(state["global_rng_state"])
+        simulation._init_logging()
+
+        return simulation
+
+    def save_checkpoint(self, path: Union[str, pathlib.Path]) -> None:
+        """Save the full simulation state to a file.
+
+        Parameters
+        ----------
+        path
+            The path of the checkpoint file.
+
+        Notes
+        -----
+        Checkpoints use pickle. Only load checkpoints from trusted sources.
+        """
+        pathlib.Path(path).write_bytes(self.to_checkpoint())
+
+    @classmethod
+    def load_checkpoint(cls, path: Union[str, pathlib.Path]) -> Simulation:
+        """Restore a simulation from a checkpoint file.
+
+        Parameters
+        ----------
+        path
+            The path of a file created by save_checkpoint().
+
+        Returns
+        -------
+        Simulation
+            The restored simulation.
+        """
+        return cls.from_checkpoint(pathlib.Path(path).read_bytes())
+
+    def fork(self, seed: Optional[Union[str, int]] = None) -> Simulation:
+        """Create an independent copy of the simulation.
+
+        The fork is a full copy made by pickling the simulation. Only the content
+        definitions in the libraries are shared with the fork since they do not
+        change during the simulation. Everything else is copied, including the
+        trait, skill, and job role GameObjects instantiated from the definitions
+        (they belong to the world) and the full event history.
+
+        Parameters
+        ----------
+        seed
+            A new seed for the fork's random number generators, by default None.
+            If None, the fork continues exactly as this simulation would.
+
+        Returns
+        -------
+        Simulation
+            The forked simulation.
+        """
+        buffer = io.BytesIO()
+        pickler = _ForkPickler(buffer)
+        pickler.dump(self)
+
+        buffer.seek(0)
+        simulation: Simulation = _ForkUnpickler(buffer, pickler.shared_objects).load()
+
+        if seed is not None:
+            simulation.reseed(seed)
+
+        return simulation
+
+    def reseed(self, seed: Union[str, int]) -> None:
+        """Reset the random number generators using a new seed.
+
+        Parameters
+        ----------
+        seed
+            Value used for pseudo-random number generation.
+        """
+        self._config = attrs.evolve(self._config, seed=seed)
+        self._world.resource_manager.remove_resource(SimulationConfig)
+        self._world.resource_manager.add_resource(self._config)
+
+        # Seed the global rng for third-party packages
+        random.seed(seed)
+
+        self._world.resource_manager.get_resource(random.Random).seed(seed)
+        self._world.resource_manager.get_resource(Tracery).set_rng_seed(seed)
+
     def to_json(self, indent: Optional[int] = None) -> str:
         """Export the simulation as a JSON string.
 
+        Relationships stored in a RelationshipStore are given GameObjects first, so
+        that they are included in the output. Archived relationships are exported
+        under "archived_relationships".
+
         Parameters
         ----------
         indent
@@ -526,6 +752,9 @@ class Simulation:
         str
             A JSON data string.
         """
+        if store := self.world.resource_manager.try_resource(RelationshipStore):
+            store.materialize_all()
+
         serialized_data = {
             "seed": self.config.seed,
             "gameobjects": {
@@ -540,6 +769,9 @@ class Simulation:
             ).to_dict(),
         }
 
+        if archive := self.world.resource_manager.try_resource(RelationshipArchive):
+            serialized_data["archived_relationships"] = archive.to_dict()
+
         return json.dumps(
             serialized_data,
             indent=indent,
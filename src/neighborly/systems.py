@@ -11,10 +11,12 @@ import random
 from collections import defaultdict
 from typing import ClassVar, Optional
 
+import numpy as np
 import polars as pl
 
 from neighborly.components.business import (
     Business,
+    JobRole,
     Occupation,
     OpenToPublic,
     PendingOpening,
@@ -25,7 +27,12 @@ from neighborly.components.location import (
     FrequentedLocations,
     LocationPreferences,
 )
-from neighborly.components.relationship import Relationship
+from neighborly.components.relationship import (
+    Relationship,
+    RelationshipArchive,
+    Relationships,
+    RelationshipStore,
+)
 from neighborly.components.residence import Resident, ResidentialUnit, Vacant
 from neighborly.components.settlement import District
 from neighborly.components.spawn_table import (
@@ -33,11 +40,23 @@ from neighborly.components.spawn_table import (
     CharacterSpawnTable,
     ResidenceSpawnTable,
 )
+from neighborly.components.stats import Stats, StatSchema, StatStore
+from neighborly.components.traits import Traits
 from neighborly.config import SimulationConfig
 from neighborly.datetime import MONTHS_PER_YEAR, SimDate
 from neighborly.defs.base_types import CharacterGenOptions
 from neighborly.defs.definition_compiler import compile_definitions
-from neighborly.ecs import Active, GameObject, System, SystemGroup, World
+from neighborly.ecs import (
+    ENTITY_INDEX_MASK,
+    Active,
+    Changed,
+    CommandBuffer,
+    GameObject,
+    System,
+    SystemGroup,
+    SystemSchedule,
+    World,
+)
 from neighborly.events.defaults import (
     BecomeAdolescentEvent,
     BecomeAdultEvent,
@@ -53,6 +72,7 @@ from neighborly.helpers.business import create_business
 from neighborly.helpers.character import create_character
 from neighborly.helpers.relationship import (
     add_relationship,
+    archive_relationships,
     get_relationship,
     get_relationships_with_traits,
     has_relationship,
@@ -72,10 +92,17 @@ from neighborly.libraries import (
     SkillLibrary,
     TraitLibrary,
 )
-from neighborly.life_event import LifeEvent
+from neighborly.life_event import GlobalEventHistory, LifeEvent, PersonalEventHistory
 
 _logger = logging.getLogger(__name__)
 
+# Stat slots used by relationship systems
+_INTERACTION_SCORE = StatSchema.get_slot("interaction_score")
+_REPUTATION = StatSchema.get_slot("reputation")
+_COMPATIBILITY = StatSchema.get_slot("compatibility")
+_ROMANCE = StatSchema.get_slot("romance")
+_ROMANTIC_COMPATIBILITY = StatSchema.get_slot("romantic_compatibility")
+
 
 class InitializationSystems(SystemGroup):
     """A group of systems that run once at the beginning of the simulation.
@@ -97,6 +124,8 @@ class EarlyUpdateSystems(SystemGroup):
 class UpdateSystems(SystemGroup):
     """The main phase of the update loop."""
 
+    use_command_buffer = True
+
 
 class LateUpdateSystems(SystemGroup):
     """The late phase of the update loop."""
@@ -123,6 +152,9 @@ class InitializeSettlementSystem(System):
 class SpawnResidentialBuildingsSystem(System):
     """Attempt to build new residential buildings in all districts."""
 
+    # Building construction does not need monthly resolution
+    default_schedule = SystemSchedule(interval=3)
+
     @staticmethod
     def get_random_single_family_building(
         district: District, spawn_table: ResidenceSpawnTable
@@ -294,6 +326,9 @@ class SpawnNewResidentSystem(System):
 class SpawnNewBusinessesSystem(System):
     """Spawns new businesses for characters to open."""
 
+    # Staggered so that it does not update on the same month as residences
+    default_schedule = SystemSchedule(interval=3, offset=1)
+
     @staticmethod
     def get_random_business(
         district: District, spawn_table: BusinessSpawnTable
@@ -329,6 +364,8 @@ class SpawnNewBusinessesSystem(System):
         )[0]
 
     def on_update(self, world: World) -> None:
+        command_buffer = world.resource_manager.get_resource(CommandBuffer)
+
         for _, (_, district, spawn_table) in world.get_components(
             (Active, District, BusinessSpawnTable)
         ):
@@ -350,7 +387,7 @@ class SpawnNewBusinessesSystem(System):
                 district.gameobject.add_child(business)
                 spawn_table.increment_count(business_id)
 
-                business.add_component(PendingOpening())
+                command_buffer.add_component(business, PendingOpening())
 
 
 class InstantiateTraitsSystem(System):
@@ -486,10 +523,14 @@ class UpdateFrequentedLocationSystem(System):
     This system runs on a regular interval to allow characters to update the locations
     that they frequent to reflect their current status and the state of the settlement.
     It allows characters to choose new places to frequent that maybe didn't exist prior.
+    Each character is updated once every three months, with the work spread evenly
+    across the months in between.
     """
 
     __slots__ = "ideal_location_count", "location_score_threshold"
 
+    default_schedule = SystemSchedule(interval=3, spread=True)
+
     ideal_location_count: int
     """The ideal number of frequented locations that characters should have"""
 
@@ -548,6 +589,9 @@ class UpdateFrequentedLocationSystem(System):
         ) in world.get_components(
             (FrequentedLocations, LocationPreferences, Character, Active)
         ):
+            if not self.schedule.in_shard(world.tick, character.gameobject.uid):
+                continue
+
             if character.life_stage < LifeStage.YOUNG_ADULT:
                 continue
 
@@ -572,6 +616,10 @@ class UpdateFrequentedLocationSystem(System):
 class AgingSystem(System):
     """Increases the age of all active GameObjects with Age components."""
 
+    # Life stage events are logged to the subject's and the global event history
+    reads = (Character, Active, Species)
+    writes = (Character, PersonalEventHistory, GlobalEventHistory)
+
     def on_update(self, world: World) -> None:
         # This system runs every simulated month
         elapsed_years: float = 1.0 / MONTHS_PER_YEAR
@@ -602,47 +650,189 @@ class AgingSystem(System):
                         character.life_stage = LifeStage.CHILD
 
 
+class RecalculateStatsSystem(System):
+    """Recalculate the values of all changed stats at once using the StatStore.
+
+    This system does nothing if the world does not have a StatStore resource.
+    """
+
+    reads = ()
+    writes = (StatStore,)
+
+    def on_update(self, world: World) -> None:
+        if stat_store := world.resource_manager.try_resource(StatStore):
+            stat_store.recalculate_all()
+
+
 class HealthDecaySystem(System):
-    """Decay the health points of characters as they get older."""
+    """Decay the health points of characters as they get older.
+
+    If the world has a StatStore, health is updated for all characters at once.
+    """
+
+    reads = (Active, Character)
+    writes = (Stats, StatStore)
 
     def on_update(self, world: World) -> None:
         # This system runs every simulated month
         elapsed_time: float = 1.0 / MONTHS_PER_YEAR
 
-        for _, (
-            _,
-            character,
-        ) in world.get_components((Active, Character)):
+        characters = world.get_components((Active, Character))
+
+        if stat_store := world.resource_manager.try_resource(StatStore):
+            gameobject_ids = np.fromiter(
+                (uid for uid, _ in characters), dtype=np.int64, count=len(characters)
+            )
+            rows = gameobject_ids & ENTITY_INDEX_MASK
+
+            health = stat_store.get_column("health")
+            health_decay = stat_store.get_column("health_decay")
+
+            # Skip characters without health stats
+            is_bound = health.get_bound_mask(rows) & health_decay.get_bound_mask(rows)
+            gameobject_ids, rows = gameobject_ids[is_bound], rows[is_bound]
+
+            health.set_base_values(
+                rows,
+                health.base_values[rows] - health_decay.get_values(rows) * elapsed_time,
+            )
+
+            world.mark_components_changed(Stats, gameobject_ids.tolist())
+            return
+
+        for _, (_, character) in characters:
             get_stat(character.gameobject, "health").base_value -= (
                 get_stat(character.gameobject, "health_decay").value * elapsed_time
             )
 
 
+def _sample_passive_changes(
+    rng: random.Random, chance_of_change: float, interaction_scores: np.ndarray
+) -> np.ndarray:
+    """Randomly choose which relationships have a passive stat change.
+
+    Parameters
+    ----------
+    rng
+        The random number generator used to seed a NumPy generator.
+    chance_of_change
+        The chance of a relationship changing before its interaction boost.
+    interaction_scores
+        The interaction scores of the relationships.
+
+    Returns
+    -------
+    np.ndarray
+        A boolean array that is True for relationships that change.
+    """
+    generator = np.random.default_rng(rng.getrandbits(64))
+    interaction_boost = np.maximum(1.0, interaction_scores / 10.0)
+    final_chance = chance_of_change * (1.0 + interaction_boost)
+
+    return generator.random(len(interaction_scores)) < final_chance
+
+
+def _apply_passive_change(
+    world: World,
+    rng: random.Random,
+    chance_of_change: float,
+    stat_slot: int,
+    change_stat_slot: int,
+) -> None:
+    """Randomly add one relationship stat to another for all active relationships.
+
+    Parameters
+    ----------
+    world
+        The world instance.
+    rng
+        The random number generator to use.
+    chance_of_change
+        The chance of a relationship changing before its interaction boost.
+    stat_slot
+        The StatSchema slot of the stat to change.
+    change_stat_slot
+        The StatSchema slot of the stat whose value is added to the changed stat.
+    """
+    stat_id = StatSchema.get_stat_id(stat_slot)
+    change_stat_id = StatSchema.get_stat_id(change_stat_slot)
+
+    if store := world.resource_manager.try_resource(RelationshipStore):
+        rows = store.get_active_rows()
+        rows = rows[
+            _sample_passive_changes(
+                rng,
+                chance_of_change,
+                store.get_column("interaction_score").get_values(rows),
+            )
+        ]
+
+        column = store.get_column(stat_id)
+        column.set_base_values(
+            rows,
+            column.base_values[rows]
+            + store.get_column(change_stat_id).get_values(rows),
+        )
+        world.mark_components_changed(Stats, store.get_gameobject_ids(rows))
+        return
+
+    if stat_store := world.resource_manager.try_resource(StatStore):
+        relationships = world.get_components((Relationship, Active))
+        gameobject_ids = np.fromiter(
+            (uid for uid, _ in relationships), dtype=np.int64, count=len(relationships)
+        )
+        gameobject_ids = gameobject_ids[
+            _sample_passive_changes(
+                rng,
+                chance_of_change,
+                stat_store.get_column("interaction_score").get_values(
+                    gameobject_ids & ENTITY_INDEX_MASK
+                ),
+            )
+        ]
+        rows = gameobject_ids & ENTITY_INDEX_MASK
+
+        column = stat_store.get_column(stat_id)
+        column.set_base_values(
+            rows,
+            column.base_values[rows]
+            + stat_store.get_column(change_stat_id).get_values(rows),
+        )
+        world.mark_components_changed(Stats, gameobject_ids.tolist())
+        return
+
+    stats = [s for _, (_, _, s) in world.get_components((Relationship, Active, Stats))]
+    interaction_scores = np.fromiter(
+        (s.get_stat_by_slot(_INTERACTION_SCORE).value for s in stats),
+        dtype=np.float64,
+        count=len(stats),
+    )
+
+    for i in np.flatnonzero(
+        _sample_passive_changes(rng, chance_of_change, interaction_scores)
+    ):
+        stat = stats[i].get_stat_by_slot(stat_slot)
+        stat.base_value = (
+            stat.base_value + stats[i].get_stat_by_slot(change_stat_slot).value
+        )
+
+
 class PassiveReputationChange(System):
     """Reputation stats have a probability of changing each time step."""
 
     CHANCE_OF_CHANGE: ClassVar[float] = 0.05
 
-    def on_update(self, world: World) -> None:
-        rng = world.resource_manager.get_resource(random.Random)
+    reads = (Relationship, Active)
+    writes = (Stats, RelationshipStore)
 
-        for _, (
-            relationship,
-            _,
-        ) in world.get_components((Relationship, Active)):
-            interaction_boost = max(
-                1.0, get_stat(relationship.gameobject, "interaction_score").value / 10.0
-            )
-
-            final_chance = PassiveReputationChange.CHANCE_OF_CHANGE * (
-                1.0 + interaction_boost
-            )
-
-            if rng.random() < final_chance:
-                get_stat(relationship.gameobject, "reputation").base_value = (
-                    get_stat(relationship.gameobject, "reputation").base_value
-                    + get_stat(relationship.gameobject, "compatibility").value
-                )
+    def on_update(self, world: World) -> None:
+        _apply_passive_change(
+            world,
+            self.get_rng(world),
+            PassiveReputationChange.CHANCE_OF_CHANGE,
+            _REPUTATION,
+            _COMPATIBILITY,
+        )
 
 
 class PassiveRomanceChange(System):
@@ -650,33 +840,103 @@ class PassiveRomanceChange(System):
 
     CHANCE_OF_CHANGE: ClassVar[float] = 0.05
 
+    reads = (Relationship, Active)
+    writes = (Stats, RelationshipStore)
+
     def on_update(self, world: World) -> None:
-        rng = world.resource_manager.get_resource(random.Random)
+        _apply_passive_change(
+            world,
+            self.get_rng(world),
+            PassiveRomanceChange.CHANCE_OF_CHANGE,
+            _ROMANCE,
+            _ROMANTIC_COMPATIBILITY,
+        )
 
-        for _, (
-            relationship,
-            _,
-        ) in world.get_components((Relationship, Active)):
-            interaction_boost = max(
-                1.0, get_stat(relationship.gameobject, "interaction_score").value / 10.0
-            )
 
-            final_chance = PassiveRomanceChange.CHANCE_OF_CHANGE * (
-                1.0 + interaction_boost
-            )
+class ArchiveRelationshipsSystem(System):
+    """Move relationships between inactive GameObjects out of the world.
 
-            if rng.random() < final_chance:
-                get_stat(relationship.gameobject, "romance").base_value = (
-                    get_stat(relationship.gameobject, "romance").base_value
-                    + get_stat(relationship.gameobject, "romantic_compatibility").value
-                )
+    This system does nothing if the world does not have a RelationshipArchive
+    resource.
+    """
+
+    # This system destroys GameObjects, so it does not declare reads and writes and
+    # never runs alongside other systems
+    default_schedule = SystemSchedule(interval=MONTHS_PER_YEAR)
+
+    def on_update(self, world: World) -> None:
+        if world.resource_manager.has_resource(RelationshipArchive):
+            archive_relationships(world)
+
+
+class CompactRelationshipsSystem(System):
+    """Destroy relationship GameObjects that are not needed and keep their data.
+
+    This system does nothing if the world does not have a RelationshipStore resource.
+    """
+
+    # GameObjects are rebuilt whenever relationships are used, so compacting every
+    # month would keep rebuilding the relationships that are used most often
+    default_schedule = SystemSchedule(interval=MONTHS_PER_YEAR)
+
+    reads = ()
+    writes = (RelationshipStore,)
+
+    def on_update(self, world: World) -> None:
+        if store := world.resource_manager.try_resource(RelationshipStore):
+            store.compact_all()
 
 
 class DeathSystem(System):
     """Characters die when their health hits zero."""
 
+    # Death events deactivate characters and update their traits, relationships,
+    # residences, frequented locations, and jobs
+    reads = (Active, Character, Stats, StatStore)
+    writes = (
+        Active,
+        Character,
+        Stats,
+        StatStore,
+        Traits,
+        Relationships,
+        RelationshipStore,
+        Resident,
+        ResidentialUnit,
+        Vacant,
+        FrequentedLocations,
+        FrequentedBy,
+        Occupation,
+        Business,
+        PersonalEventHistory,
+        GlobalEventHistory,
+    )
+
     def on_update(self, world: World) -> None:
-        for _, (_, character) in world.get_components((Active, Character)):
+        if stat_store := world.resource_manager.try_resource(StatStore):
+            # Check the health of every character at once
+            characters = world.get_components((Active, Character))
+            rows = np.fromiter(
+                (uid & ENTITY_INDEX_MASK for uid, _ in characters),
+                dtype=np.int64,
+                count=len(characters),
+            )
+
+            health = stat_store.get_column("health")
+
+            # Skip characters without health stats
+            indices = np.flatnonzero(health.get_bound_mask(rows))
+            values = health.get_values(rows[indices])
+
+            for i in indices[values <= 0]:
+                Death(characters[i][1][1].gameobject).dispatch()
+
+            return
+
+        # Only characters whose stats changed since the last update can have died
+        for _, (_, character) in world.get_changed_components(
+            (Active, Character), (Changed[Stats],), self.last_run_tick
+        ):
             if get_stat(character.gameobject, "health").value <= 0:
                 Death(character.gameobject).dispatch()
 
@@ -686,6 +946,7 @@ class ChildBirthSystem(System):
 
     def on_update(self, world: World) -> None:
         current_date = world.resource_manager.get_resource(SimDate)
+        command_buffer = world.resource_manager.get_resource(CommandBuffer)
 
         for _, (character, pregnancy, _) in world.get_components(
             (Character, Pregnant, Active)
@@ -767,7 +1028,7 @@ class ChildBirthSystem(System):
                 add_trait(get_relationship(baby, sibling), "sibling")
                 add_trait(get_relationship(sibling, baby), "sibling")
 
-            character.gameobject.remove_component(Pregnant)
+            command_buffer.remove_component(character.gameobject, Pregnant)
             get_stat(character.gameobject, "fertility").base_value -= 0.2
 
             HaveChildEvent(
@@ -899,8 +1160,14 @@ class JobRoleMonthlyEffectsSystem(System):
     """
 
     def on_update(self, world: World) -> None:
+        # Group workers by role so each effect is applied to all of them at once
+        workers_by_role: defaultdict[JobRole, list[GameObject]] = defaultdict(list)
+
         for _, (character, occupation, _) in world.get_components(
             (Character, Occupation, Active)
         ):
-            for effect in occupation.job_role.monthly_effects:
-                effect.apply(character.gameobject)
+            workers_by_role[occupation.job_role].append(character.gameobject)
+
+        for job_role, workers in workers_by_role.items():
+            for effect in job_role.monthly_effects:
+                effect.apply_many(workers)
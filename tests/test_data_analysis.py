@@ -0,0 +1,67 @@
+"""Test exporting simulation data for analysis."""
+
+import pathlib
+
+from neighborly.components.business import (
+    ClosedForBusiness,
+    OpenForBusiness,
+    OpenToPublic,
+    PendingOpening,
+)
+from neighborly.components.residence import Vacant
+from neighborly.config import SimulationConfig
+from neighborly.data_analysis import create_sql_db
+from neighborly.loaders import (
+    load_businesses,
+    load_characters,
+    load_districts,
+    load_job_roles,
+    load_residences,
+    load_settlements,
+    load_skills,
+)
+from neighborly.plugins import default_traits
+from neighborly.simulation import Simulation
+
+_TEST_DATA_DIR = pathlib.Path(__file__).parent / "data"
+
+
+def test_create_sql_db_tag_tables() -> None:
+    """Test that tag tables list the GameObjects with each tag."""
+
+    sim = Simulation(SimulationConfig(seed=3, settlement="basic_settlement"))
+
+    load_districts(sim, _TEST_DATA_DIR / "districts.json")
+    load_settlements(sim, _TEST_DATA_DIR / "settlements.json")
+    load_businesses(sim, _TEST_DATA_DIR / "businesses.json")
+    load_characters(sim, _TEST_DATA_DIR / "characters.json")
+    load_residences(sim, _TEST_DATA_DIR / "residences.json")
+    load_job_roles(sim, _TEST_DATA_DIR / "job_roles.json")
+    load_skills(sim, _TEST_DATA_DIR / "skills.json")
+    default_traits.load_plugin(sim)
+
+    for _ in range(24):
+        sim.step()
+
+    db = create_sql_db(sim)
+    tables = db.tables()
+
+    # The settlement has businesses, so at least one business tag is exported
+    assert "PendingOpening" in tables or "OpenForBusiness" in tables
+
+    for tag_type in (
+        Vacant,
+        OpenToPublic,
+        PendingOpening,
+        OpenForBusiness,
+        ClosedForBusiness,
+    ):
+        expected = sorted(uid for uid, _ in sim.world.get_component(tag_type))
+
+        if not expected:
+            assert tag_type.__name__ not in tables
+            continue
+
+        table = db.execute(f"SELECT uid FROM {tag_type.__name__}", eager=True)
+
+        assert sorted(table["uid"].to_list()) == expected
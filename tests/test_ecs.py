@@ -0,0 +1,712 @@
+"""Entity-Component System Unit Tests.
+
+"""
+
+from __future__ import annotations
+
+import pathlib
+import random
+from typing import Any, Type
+
+import pytest
+
+from neighborly.ecs import (
+    Active,
+    Added,
+    ArchetypeComponentStorage,
+    Changed,
+    CommandBuffer,
+    Component,
+    ComponentStorage,
+    EsperComponentStorage,
+    Event,
+    GameObjectNotFoundError,
+    System,
+    SystemGroup,
+    SystemNotFoundError,
+    SystemProfiler,
+    SystemSchedule,
+    SystemScheduler,
+    TagComponent,
+    World,
+)
+
+STORAGE_TYPES = (EsperComponentStorage, ArchetypeComponentStorage)
+
+
+class Position(Component):
+    """A test component with 2D coordinates."""
+
+    __slots__ = "x", "y"
+
+    x: int
+    y: int
+
+    def __init__(self, x: int = 0, y: int = 0) -> None:
+        super().__init__()
+        self.x = x
+        self.y = y
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"x": self.x, "y": self.y}
+
+
+class Velocity(Component):
+    """A test component with 2D velocity."""
+
+    __slots__ = "dx", "dy"
+
+    dx: int
+    dy: int
+
+    def __init__(self, dx: int = 0, dy: int = 0) -> None:
+        super().__init__()
+        self.dx = dx
+        self.dy = dy
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"dx": self.dx, "dy": self.dy}
+
+
+@pytest.mark.parametrize("storage_type", STORAGE_TYPES)
+def test_get_components_tracks_changes(storage_type: Type[ComponentStorage]) -> None:
+    """Test that cached queries update when components are added or removed."""
+
+    world = World(storage_type())
+
+    a = world.gameobject_manager.spawn_gameobject([Position(), Velocity()])
+    b = world.gameobject_manager.spawn_gameobject([Position()])
+
+    assert [uid for uid, _ in world.get_components((Position, Velocity))] == [a.uid]
+
+    b.add_component(Velocity(1, 1))
+
+    results = world.get_components((Position, Velocity))
+    assert [uid for uid, _ in results] == [a.uid, b.uid]
+    assert results[1][1][1] is b.get_component(Velocity)
+
+    a.remove_component(Velocity)
+
+    assert [uid for uid, _ in world.get_components((Position, Velocity))] == [b.uid]
+    assert [uid for uid, _ in world.get_component(Velocity)] == [b.uid]
+
+    b.deactivate()
+
+    assert world.get_components((Position, Velocity, Active)) == []
+
+
+@pytest.mark.parametrize("storage_type", STORAGE_TYPES)
+def test_get_components_after_destroy(storage_type: Type[ComponentStorage]) -> None:
+    """Test that destroyed GameObjects are removed from cached queries."""
+
+    world = World(storage_type())
+
+    a = world.gameobject_manager.spawn_gameobject([Position()])
+    b = world.gameobject_manager.spawn_gameobject([Position()])
+
+    assert len(world.get_component(Position)) == 2
+
+    a.destroy()
+    world.step()
+
+    assert [uid for uid, _ in world.get_component(Position)] == [b.uid]
+
+
+def test_archetype_storage() -> None:
+    """Test that archetype storage moves rows between tables correctly."""
+
+    storage = ArchetypeComponentStorage()
+
+    a = storage.create_entity()
+    b = storage.create_entity()
+    c = storage.create_entity()
+
+    positions = {entity: Position(entity, entity) for entity in (a, b, c)}
+
+    for entity, position in positions.items():
+        storage.add_component(entity, position)
+
+    storage.add_component(b, Velocity(1, 1))
+
+    assert storage.has_components(b, Position, Velocity)
+    assert storage.has_component(a, Velocity) is False
+    assert storage.try_component(a, Velocity) is None
+
+    # Removing 'a' moves the last row of the table into its place
+    storage.delete_entity(a)
+
+    assert storage.component_for_entity(c, Position) is positions[c]
+    assert sorted(e for e, _ in storage.get_components((Position,))) == [b, c]
+    assert [e for e, _ in storage.get_components((Position, Velocity))] == [b]
+
+    storage.remove_component(b, Velocity)
+
+    assert storage.get_components((Position, Velocity)) == []
+    assert storage.components_for_entity(b) == (positions[b],)
+
+    with pytest.raises(KeyError):
+        storage.remove_component(b, Velocity)
+
+    # Reach the (Position, Velocity) archetype by adding components in reverse order
+    d = storage.create_entity()
+    storage.add_component(d, Velocity(2, 2))
+    storage.add_component(d, Position(3, 3))
+
+    assert storage.component_for_entity(d, Velocity).dx == 2
+    assert storage.component_for_entity(d, Position).x == 3
+
+
+def test_command_buffer() -> None:
+    """Test that buffered commands are only applied when flushed."""
+
+    world = World()
+    command_buffer = world.resource_manager.get_resource(CommandBuffer)
+
+    a = world.gameobject_manager.spawn_gameobject([Position()])
+    b = world.gameobject_manager.spawn_gameobject([Position()])
+
+    command_buffer.add_component(a, Velocity())
+    command_buffer.destroy_gameobject(b)
+    c = command_buffer.spawn_gameobject([Position(), Velocity()], name="c")
+    d = command_buffer.spawn_gameobject([Position()])
+    command_buffer.add_component(d, Velocity(2))
+    a.add_child(d)
+
+    assert len(command_buffer) == 5
+    assert a.has_component(Velocity) is False
+    assert len(world.get_component(Position)) == 2
+    assert c.exists is False
+    assert c.uid not in (a.uid, b.uid, d.uid)
+
+    command_buffer.flush()
+
+    assert len(command_buffer) == 0
+    assert a.has_component(Velocity) is True
+    assert b.is_active is False
+    assert world.gameobject_manager.get_gameobject(c.uid) is c
+    assert c.name == f"c({c.uid})"
+    assert d.get_component(Velocity).dx == 2
+    assert d.parent is a
+    assert len(world.get_components((Position, Velocity, Active))) == 3
+
+    # Discarded spawns release their reserved IDs
+    e = command_buffer.spawn_gameobject([Position()])
+    command_buffer.clear()
+
+    assert world.gameobject_manager.is_stale(e.uid) is True
+
+
+class MovementSystem(System):
+    """Moves GameObjects and records when they should stop."""
+
+    def on_update(self, world: World) -> None:
+        command_buffer = world.resource_manager.get_resource(CommandBuffer)
+        for _, (position, velocity) in world.get_components((Position, Velocity)):
+            position.x += velocity.dx
+            command_buffer.remove_component(position.gameobject, Velocity)
+
+        assert len(world.get_components((Position, Velocity))) > 0
+
+
+class MovementSystems(SystemGroup):
+    """A group that flushes buffered commands after each system."""
+
+    use_command_buffer = True
+
+
+def test_system_group_flushes_command_buffer() -> None:
+    """Test that SystemGroups flush the command buffer after systems run."""
+
+    world = World()
+    world.system_manager.add_system(MovementSystems())
+    world.system_manager.add_system(MovementSystem(), system_group=MovementSystems)
+
+    gameobject = world.gameobject_manager.spawn_gameobject([Position(), Velocity(1)])
+
+    world.step()
+
+    assert gameobject.get_component(Position).x == 1
+    assert gameobject.has_component(Velocity) is False
+    assert len(world.resource_manager.get_resource(CommandBuffer)) == 0
+
+
+class CountingSystem(System):
+    """Records the ticks when it updates and the GameObjects in its shard."""
+
+    default_schedule = SystemSchedule(interval=2, offset=1)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.updates: list[tuple[int, list[int]]] = []
+
+    def on_update(self, world: World) -> None:
+        self.updates.append(
+            (
+                world.tick,
+                [
+                    uid
+                    for uid, _ in world.get_component(Position)
+                    if self.schedule.in_shard(world.tick, uid)
+                ],
+            )
+        )
+
+
+def test_system_schedule() -> None:
+    """Test that systems only update on the ticks given by their schedule."""
+
+    world = World()
+    system = CountingSystem()
+    world.system_manager.add_system(system)
+
+    a = world.gameobject_manager.spawn_gameobject([Position()])
+    b = world.gameobject_manager.spawn_gameobject([Position()])
+
+    for _ in range(4):
+        world.step()
+
+    assert [tick for tick, _ in system.updates] == [1, 3]
+
+    system.updates.clear()
+    system.schedule = SystemSchedule(interval=2, spread=True)
+
+    for _ in range(2):
+        world.step()
+
+    # Every tick runs, but each GameObject is only processed once per interval
+    assert [tick for tick, _ in system.updates] == [4, 5]
+    assert sorted(uid for _, shard in system.updates for uid in shard) == [
+        a.uid,
+        b.uid,
+    ]
+
+
+def test_system_profiler(tmp_path: pathlib.Path) -> None:
+    """Test that SystemGroups only record timing data when profiling is enabled."""
+
+    world = World()
+    profiler = world.resource_manager.get_resource(SystemProfiler)
+    world.system_manager.add_system(MovementSystems())
+    world.system_manager.add_system(MovementSystem(), system_group=MovementSystems)
+
+    world.gameobject_manager.spawn_gameobject([Position(), Velocity(1)])
+    world.gameobject_manager.spawn_gameobject([Position(), Velocity(1)])
+
+    world.step()
+
+    assert list(profiler.profiles) == []
+
+    profiler.enabled = True
+    world.gameobject_manager.spawn_gameobject([Position(), Velocity(1)])
+    world.step()
+
+    movement = profiler.get_profile(MovementSystem)
+    assert movement.call_count == 1
+    assert movement.entity_count == 2
+    assert movement.samples[0][0] == 1
+    assert profiler.get_profile(MovementSystems).call_count == 1
+    assert sum(count for _, count in profiler.get_histogram(MovementSystem)) == 1
+
+    df = profiler.to_dataframe()
+    assert sorted(df["system"].to_list()) == ["MovementSystem", "MovementSystems"]
+
+    profiler.to_csv(tmp_path / "profile.csv")
+    assert (tmp_path / "profile.csv").exists()
+
+
+class MoveXSystem(System):
+    """Moves GameObjects along the x-axis by a random amount."""
+
+    reads = (Velocity,)
+    writes = (Position,)
+
+    def on_update(self, world: World) -> None:
+        rng = self.get_rng(world)
+        for _, (position, velocity) in world.get_components((Position, Velocity)):
+            position.x += velocity.dx * rng.randint(1, 10)
+
+
+class AccelerateSystem(System):
+    """Increases the velocity of all GameObjects."""
+
+    reads = ()
+    writes = (Velocity,)
+
+    def on_update(self, world: World) -> None:
+        for _, velocity in world.get_component(Velocity):
+            velocity.dy += 1
+
+
+class CountVelocitySystem(System):
+    """Counts GameObjects with velocity (does not conflict with MoveXSystem)."""
+
+    reads = (Velocity,)
+    writes = ()
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.count = 0
+
+    def on_update(self, world: World) -> None:
+        self.count = len(world.get_component(Velocity))
+
+
+class ParallelSystems(SystemGroup):
+    """A group that runs non-conflicting systems concurrently."""
+
+    parallel = True
+
+
+def test_build_system_stages() -> None:
+    """Test that conflicting systems are placed in separate stages."""
+
+    move = MoveXSystem()
+    count = CountVelocitySystem()
+    accelerate = AccelerateSystem()
+    movement = MovementSystem()
+
+    stages = SystemScheduler.build_stages([move, count, accelerate, movement])
+
+    # Undeclared systems (MovementSystem) conflict with everything
+    assert stages == [[move, count], [accelerate], [movement]]
+
+
+def test_parallel_system_group() -> None:
+    """Test that parallel SystemGroups produce reproducible results."""
+
+    def run() -> list[tuple[int, int]]:
+        world = World()
+        world.resource_manager.add_resource(random.Random(42))
+        world.system_manager.add_system(ParallelSystems())
+        for system in (MoveXSystem(), CountVelocitySystem(), AccelerateSystem()):
+            world.system_manager.add_system(system, system_group=ParallelSystems)
+
+        for i in range(5):
+            world.gameobject_manager.spawn_gameobject([Position(), Velocity(i)])
+
+        for _ in range(3):
+            world.step()
+
+        assert world.system_manager.get_system(CountVelocitySystem).count == 5
+
+        return [(p.x, v.dy) for _, (p, v) in world.get_components((Position, Velocity))]
+
+    results = run()
+
+    assert results == run()
+    assert all(dy == 3 for _, dy in results)
+
+
+def test_parallel_system_group_profiling() -> None:
+    """Test that systems running concurrently record their own query counts."""
+
+    world = World()
+    world.resource_manager.add_resource(random.Random(42))
+    profiler = world.resource_manager.get_resource(SystemProfiler)
+    profiler.enabled = True
+    world.system_manager.add_system(ParallelSystems())
+    for system in (MoveXSystem(), CountVelocitySystem()):
+        world.system_manager.add_system(system, system_group=ParallelSystems)
+
+    for i in range(4):
+        world.gameobject_manager.spawn_gameobject([Position(), Velocity(i)])
+    world.gameobject_manager.spawn_gameobject([Velocity()])
+
+    world.step()
+
+    assert profiler.get_profile(MoveXSystem).entity_count == 4
+    assert profiler.get_profile(CountVelocitySystem).entity_count == 5
+    assert world.entities_queried == 9
+
+
+@pytest.mark.parametrize("storage_type", STORAGE_TYPES)
+def test_gameobject_id_recycling(storage_type: Type[ComponentStorage]) -> None:
+    """Test that deleted GameObject slots are reused with a new generation."""
+
+    world = World(storage_type())
+    manager = world.gameobject_manager
+
+    a = manager.spawn_gameobject([Position()])
+    b = manager.spawn_gameobject([Position()])
+
+    assert (a.index, a.generation) == (1, 0)
+    assert (b.index, b.generation) == (2, 0)
+
+    a.destroy()
+    world.step()
+
+    assert manager.is_stale(a.uid) is True
+    assert a.exists is False
+
+    c = manager.spawn_gameobject([Velocity()])
+
+    assert (c.index, c.generation) == (1, 1)
+    assert c.uid != a.uid
+    assert manager.is_stale(c.uid) is False
+    assert manager.get_gameobject(c.uid) is c
+    assert [uid for uid, _ in world.get_component(Position)] == [b.uid]
+    assert [uid for uid, _ in world.get_component(Velocity)] == [c.uid]
+
+    with pytest.raises(GameObjectNotFoundError):
+        manager.get_gameobject(a.uid)
+
+
+class DamageEvent(Event):
+    """A test event."""
+
+
+class CriticalDamageEvent(DamageEvent):
+    """A subclass of the test event."""
+
+
+def test_event_listeners_include_base_classes() -> None:
+    """Test that listeners for a base event type are called for its subclasses."""
+
+    world = World()
+    calls: list[tuple[str, int]] = []
+
+    world.event_manager.on_event(
+        DamageEvent, lambda e: calls.append(("base", e.event_id))
+    )
+
+    DamageEvent(world).dispatch()
+    CriticalDamageEvent(world).dispatch()
+
+    assert calls == [("base", 0), ("base", 1)]
+
+    # Adding listeners invalidates the cached dispatch table
+    world.event_manager.on_event(
+        CriticalDamageEvent, lambda e: calls.append(("critical", e.event_id))
+    )
+    world.event_manager.on_any_event(lambda e: calls.append(("any", e.event_id)))
+    calls.clear()
+
+    CriticalDamageEvent(world).dispatch()
+
+    assert calls == [("critical", 2), ("base", 2), ("any", 2)]
+
+
+class DamageSystem(System):
+    """Dispatches events during its update."""
+
+    def on_update(self, world: World) -> None:
+        DamageEvent(world).dispatch()
+        CriticalDamageEvent(world).dispatch()
+        DamageEvent(world).dispatch()
+
+
+def test_queued_events() -> None:
+    """Test that queued events are sent to batch listeners at flush points."""
+
+    world = World()
+    world.system_manager.add_system(DamageSystem())
+    world.event_manager.queued = True
+
+    calls: list[Any] = []
+
+    world.event_manager.on_event(DamageEvent, lambda e: calls.append(e.event_id))
+    world.event_manager.on_events(
+        DamageEvent,
+        lambda event_type, events: calls.append(
+            (event_type.__name__, [e.event_id for e in events])
+        ),
+    )
+
+    DamageEvent(world).dispatch()
+
+    assert calls == []
+
+    # The SystemManager flushes events after each top-level system
+    world.step()
+
+    assert calls == [
+        0,
+        1,
+        2,
+        3,
+        ("DamageEvent", [0, 1, 3]),
+        ("CriticalDamageEvent", [2]),
+    ]
+
+    calls.clear()
+    world.event_manager.queued = False
+    DamageEvent(world).dispatch()
+
+    assert calls == [4, ("DamageEvent", [4])]
+
+
+def test_system_registry() -> None:
+    """Test getting, adding, and removing systems by type."""
+
+    world = World()
+    manager = world.system_manager
+
+    manager.add_system(ParallelSystems())
+    manager.add_system(MovementSystems())
+    manager.add_system(MoveXSystem(), system_group=ParallelSystems)
+    manager.add_system(MovementSystem(), system_group=MovementSystems)
+
+    assert isinstance(manager.get_system(MoveXSystem), MoveXSystem)
+    # Systems can be retrieved by their base types
+    assert isinstance(manager.get_system(SystemGroup), ParallelSystems)
+
+    manager.remove_system(MoveXSystem)
+
+    with pytest.raises(SystemNotFoundError):
+        manager.get_system(MoveXSystem)
+
+    assert list(manager.get_system(ParallelSystems).iter_children()) == []
+
+    # Removing a group also removes its children
+    manager.remove_system(MovementSystems)
+
+    with pytest.raises(SystemNotFoundError):
+        manager.get_system(MovementSystem)
+
+    with pytest.raises(SystemNotFoundError):
+        manager.add_system(MovementSystem(), system_group=MovementSystems)
+
+
+class ChangedPositionSystem(System):
+    """Records GameObjects whose positions were added or changed."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.added: list[int] = []
+        self.changed: list[int] = []
+
+    def on_update(self, world: World) -> None:
+        self.added = [
+            uid
+            for uid, _ in world.get_changed_components(
+                (Position,), (Added[Position],), self.last_run_tick
+            )
+        ]
+        self.changed = [
+            uid
+            for uid, _ in world.get_changed_components(
+                (Position, Active), (Changed[Position],), self.last_run_tick
+            )
+        ]
+
+
+def test_change_detection() -> None:
+    """Test that change filters only match components touched since the last run."""
+
+    world = World()
+    system = ChangedPositionSystem()
+    world.system_manager.add_system(system)
+
+    a = world.gameobject_manager.spawn_gameobject([Position()])
+    b = world.gameobject_manager.spawn_gameobject([Position()])
+
+    world.step()
+
+    assert system.added == [a.uid, b.uid]
+    assert system.changed == [a.uid, b.uid]
+
+    world.step()
+
+    assert system.added == []
+    assert system.changed == []
+
+    b.get_component(Position).mark_changed()
+    a.get_component(Position).mark_changed()
+    c = world.gameobject_manager.spawn_gameobject([Position()])
+
+    world.step()
+
+    assert system.added == [c.uid]
+    assert system.changed == [b.uid, a.uid, c.uid]
+
+    a.get_component(Position).mark_changed()
+    a.deactivate()
+
+    world.step()
+
+    assert system.changed == []
+
+
+def test_change_logs_are_pruned() -> None:
+    """Test that changes older than every active system's last update are dropped."""
+
+    world = World()
+    world.system_manager.add_system(ChangedPositionSystem())
+    query_cache = world.gameobject_manager.query_cache
+
+    a = world.gameobject_manager.spawn_gameobject([Position()])
+    b = world.gameobject_manager.spawn_gameobject([Position()])
+
+    assert query_cache.get_changes(Changed[Position], 0) == [a.uid, b.uid]
+
+    world.step()
+
+    assert query_cache.get_changes(Changed[Position], 0) == []
+    assert query_cache.get_changes(Added[Position], 0) == []
+
+    # Systems that have not run since a change keep it in the logs
+    slow_system = ChangedPositionSystem()
+    slow_system.schedule = SystemSchedule(interval=2)
+    world.system_manager.add_system(slow_system)
+
+    b.get_component(Position).mark_changed()
+    world.step()
+
+    assert query_cache.get_changes(Changed[Position], 0) == [b.uid]
+
+    world.step()
+
+    assert slow_system.changed == [b.uid]
+    assert query_cache.get_changes(Changed[Position], 0) == []
+
+
+class Frozen(TagComponent):
+    """A test tag."""
+
+
+@pytest.mark.parametrize("storage_type", STORAGE_TYPES)
+def test_tag_components(storage_type: Type[ComponentStorage]) -> None:
+    """Test that tags are tracked by the tag index instead of component storage."""
+
+    world = World(storage_type())
+    tag_index = world.gameobject_manager.tag_index
+
+    a = world.gameobject_manager.spawn_gameobject([Position(), Frozen()])
+    b = world.gameobject_manager.spawn_gameobject([Position()])
+
+    assert Frozen() is Frozen()
+    assert a.get_component(Frozen) is Frozen()
+
+    # The shared tag instance does not belong to any GameObject
+    with pytest.raises(AttributeError):
+        _ = a.get_component(Frozen).gameobject
+
+    with pytest.raises(TypeError):
+
+        class _LifecycleTag(TagComponent):  # pyright: ignore[reportUnusedClass]
+            def on_add(self) -> None:
+                return
+
+    assert a.has_components(Position, Frozen, Active)
+    assert b.try_component(Frozen) is None
+    assert tag_index.get_entities(Active) == {a.uid, b.uid}
+
+    # Tags are not stored with component data
+    component_manager = world.gameobject_manager.component_manager
+    assert component_manager.has_component(a.uid, Frozen) is False
+    assert component_manager.has_component(a.uid, Active) is False
+
+    assert [uid for uid, _ in world.get_components((Position, Frozen, Active))] == [
+        a.uid
+    ]
+
+    b.add_component(Frozen())
+    a.deactivate()
+
+    assert [uid for uid, _ in world.get_components((Frozen, Active))] == [b.uid]
+    assert [type(c) for c in a.get_components()] == [Position, Frozen]
+
+    b.destroy()
+    world.step()
+
+    assert tag_index.get_entities(Frozen) == {a.uid}
@@ -1,20 +1,31 @@
 # pylint: disable=redefined-outer-name
-"""Test Relationship Components, Systems, and Helper Functions.
-
-"""
+"""Test Relationship Components, Systems, and Helper Functions."""
 
 import pathlib
 
 import pytest
 
+from neighborly.components.relationship import (
+    Relationship,
+    RelationshipArchive,
+    RelationshipStore,
+)
+from neighborly.config import SimulationConfig
+from neighborly.data_analysis import create_sql_db
 from neighborly.helpers.character import create_character
 from neighborly.helpers.relationship import (
     add_relationship,
+    archive_relationships,
+    deactivate_relationships,
+    destroy_relationship,
     get_relationship,
+    get_relationships_with_traits,
     has_relationship,
+    peek_relationship,
 )
 from neighborly.helpers.stats import get_stat
-from neighborly.helpers.traits import add_trait, remove_trait
+from neighborly.helpers.traits import add_trait, has_trait, remove_trait
+from neighborly.inspection import inspect
 from neighborly.loaders import (
     load_businesses,
     load_characters,
@@ -26,6 +37,7 @@ from neighborly.loaders import (
 )
 from neighborly.plugins import default_traits
 from neighborly.simulation import Simulation
+from neighborly.systems import PassiveReputationChange
 
 _TEST_DATA_DIR = pathlib.Path(__file__).parent / "data"
 
@@ -33,7 +45,12 @@ _TEST_DATA_DIR = pathlib.Path(__file__).parent / "data"
 @pytest.fixture
 def sim() -> Simulation:
     """Create sample simulation to use for test cases"""
-    simulation = Simulation()
+    return _create_simulation(SimulationConfig())
+
+
+def _create_simulation(config: SimulationConfig) -> Simulation:
+    """Create a simulation with the test data loaded."""
+    simulation = Simulation(config)
 
     load_districts(simulation, _TEST_DATA_DIR / "districts.json")
     load_settlements(simulation, _TEST_DATA_DIR / "settlements.json")
@@ -113,3 +130,274 @@ def test_trait_with_social_rules(sim: Simulation) -> None:
 
     assert get_stat(rel, "reputation").value == 0
     assert get_stat(rel_to_noble, "reputation").value == 0
+
+
+def test_relationship_store() -> None:
+    """Test storing relationships without GameObjects."""
+
+    sim = _create_simulation(SimulationConfig(compact_relationships=True))
+    store = sim.world.resource_manager.get_resource(RelationshipStore)
+
+    farmer = create_character(sim.world, "farmer")
+    noble = create_character(sim.world, "nobility")
+
+    add_trait(farmer, "gullible")
+
+    relationship = add_relationship(farmer, noble)
+    add_trait(relationship, "coworker")
+    get_stat(relationship, "reputation").base_value = 10
+
+    row = store.get_row(farmer, noble)
+    assert row is not None
+
+    assert store.compact(row) is True
+    sim.world.gameobject_manager.clear_dead_gameobjects()
+
+    assert relationship.exists is False
+    assert has_relationship(farmer, noble) is True
+    assert store.has_gameobject(row) is False
+    assert store.has_trait(row, "coworker") is True
+    assert store.get_column("reputation").get_values(
+        store.get_active_rows()
+    ).tolist() == [15]
+
+    # Looking up the relationship rebuilds its GameObject with the same data and ID
+    (rebuilt,) = get_relationships_with_traits(farmer, "coworker")
+
+    assert rebuilt is relationship
+    assert relationship.exists is True
+    assert store.has_gameobject(row) is True
+    assert get_relationship(farmer, noble) is relationship
+    assert has_trait(relationship, "coworker") is True
+    assert get_stat(relationship, "reputation").value == 15
+
+    remove_trait(farmer, "gullible")
+
+    assert get_stat(relationship, "reputation").value == 10
+
+    store.compact(row)
+    deactivate_relationships(farmer)
+
+    assert store.has_gameobject(row) is False
+    assert get_relationship(farmer, noble) is relationship
+    assert relationship.is_active is False
+
+    # Destroying a compacted relationship releases its ID for reuse
+    store.compact(row)
+    sim.world.gameobject_manager.clear_dead_gameobjects()
+    destroy_relationship(farmer, noble)
+
+    assert sim.world.gameobject_manager.is_stale(relationship.uid) is True
+
+
+@pytest.mark.parametrize("compact_relationships", [False, True])
+def test_get_relationships_with_traits(compact_relationships: bool) -> None:
+    """Test that relationship trait lookups follow trait and relationship changes."""
+
+    sim = _create_simulation(
+        SimulationConfig(compact_relationships=compact_relationships)
+    )
+
+    farmer = create_character(sim.world, "farmer")
+    others = [create_character(sim.world, "farmer") for _ in range(3)]
+
+    for other in others:
+        add_relationship(farmer, other)
+
+    add_trait(get_relationship(farmer, others[2]), "coworker")
+    add_trait(get_relationship(farmer, others[0]), "coworker")
+    add_trait(get_relationship(farmer, others[0]), "child")
+
+    if store := sim.world.resource_manager.try_resource(RelationshipStore):
+        store.compact_all()
+
+    assert [
+        r.get_component(Relationship).target
+        for r in get_relationships_with_traits(farmer, "coworker")
+    ] == [others[2], others[0]]
+    assert [
+        r.get_component(Relationship).target
+        for r in get_relationships_with_traits(farmer, "coworker", "child")
+    ] == [others[0]]
+    assert len(get_relationships_with_traits(farmer)) == 3
+
+    remove_trait(get_relationship(farmer, others[2]), "coworker")
+    destroy_relationship(farmer, others[0])
+
+    assert get_relationships_with_traits(farmer, "coworker") == []
+    assert get_relationships_with_traits(farmer, "child") == []
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        SimulationConfig(seed=1234),
+        SimulationConfig(seed=1234, columnar_stats=True),
+        SimulationConfig(seed=1234, compact_relationships=True),
+    ],
+)
+def test_passive_reputation_change(config: SimulationConfig) -> None:
+    """Test that passive reputation changes are random but reproducible."""
+
+    results: list[list[float]] = []
+
+    for _ in range(2):
+        sim = _create_simulation(config)
+        characters = [create_character(sim.world, "farmer") for _ in range(20)]
+        relationships = [
+            add_relationship(a, b) for a in characters for b in characters if a is not b
+        ]
+
+        for relationship in relationships:
+            get_stat(relationship, "compatibility").base_value = 5
+
+        sim.world.system_manager.get_system(PassiveReputationChange).on_update(
+            sim.world
+        )
+
+        results.append([get_stat(r, "reputation").value for r in relationships])
+
+    assert results[0] == results[1]
+
+    # Relationships without interactions have a 10% chance of changing
+    changed = sum(1 for value in results[0] if value != 0)
+    assert 0 < changed < len(results[0]) / 2
+
+
+@pytest.mark.parametrize("compact_relationships", [False, True])
+def test_archive_relationships(
+    compact_relationships: bool, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test moving relationships between inactive characters into the archive."""
+
+    sim = _create_simulation(
+        SimulationConfig(
+            seed=3,
+            settlement="basic_settlement",
+            archive_relationships=True,
+            compact_relationships=compact_relationships,
+        )
+    )
+    archive = sim.world.resource_manager.get_resource(RelationshipArchive)
+
+    # Step the simulation so the settlement has businesses and residences
+    for _ in range(24):
+        sim.step()
+
+    # Archive relationships left over from the steps before adding test characters
+    archive_relationships(sim.world)
+
+    farmer = create_character(sim.world, "farmer")
+    noble = create_character(sim.world, "nobility")
+    other = create_character(sim.world, "farmer")
+
+    relationship = add_relationship(farmer, noble)
+    add_trait(relationship, "coworker")
+    get_stat(relationship, "reputation").base_value = 10
+    add_relationship(noble, farmer)
+    add_relationship(farmer, other)
+
+    uid = relationship.uid
+
+    for character in (farmer, noble):
+        character.deactivate()
+        deactivate_relationships(character)
+
+    if store := sim.world.resource_manager.try_resource(RelationshipStore):
+        store.compact_all()
+        sim.world.gameobject_manager.clear_dead_gameobjects()
+
+    gameobject_count = len(list(sim.world.gameobject_manager.gameobjects))
+
+    assert archive_relationships(sim.world) == 2
+
+    # Archiving does not create GameObjects for compacted relationships
+    assert len(list(sim.world.gameobject_manager.gameobjects)) <= gameobject_count
+
+    assert has_relationship(farmer, noble) is False
+    assert has_relationship(noble, farmer) is False
+    assert has_relationship(farmer, other) is True
+    assert archive.has_relationship(uid) is True
+    assert archive.get_outgoing(farmer.uid)["target"].to_list() == [noble.uid]
+    assert archive.get_stats(uid)["reputation"] == 10
+    assert archive.get_traits(uid) == ["Coworker"]
+
+    sim.world.gameobject_manager.clear_dead_gameobjects()
+
+    db = create_sql_db(sim)
+    archived = db.execute(
+        "SELECT gameobjects.active, Relationship.owner FROM Relationship "
+        "JOIN gameobjects ON Relationship.uid = gameobjects.uid "
+        f"WHERE gameobjects.uid = {uid}",
+        eager=True,
+    )
+
+    assert archived.rows() == [(False, farmer.uid)]
+
+    # Every archived relationship joins with an inactive row in the gameobjects table
+    joined = db.execute(
+        "SELECT Relationship.uid FROM Relationship "
+        "JOIN gameobjects ON Relationship.uid = gameobjects.uid "
+        "WHERE gameobjects.active = false",
+        eager=True,
+    )
+
+    assert set(archive.relationships["uid"].to_list()) <= set(joined["uid"].to_list())
+    assert "PendingOpening" in db.tables() or "OpenForBusiness" in db.tables()
+
+    inspect(sim, uid)
+
+    assert "Relationship (Archived)" in capsys.readouterr().out
+
+    inspect(sim, farmer)
+
+    assert noble.name in capsys.readouterr().out
+
+    restored = Simulation.from_checkpoint(sim.to_checkpoint())
+    restored_archive = restored.world.resource_manager.get_resource(RelationshipArchive)
+
+    assert restored_archive.relationships.equals(archive.relationships)
+
+
+@pytest.mark.parametrize("compact_relationships", [False, True])
+def test_peek_relationship(compact_relationships: bool) -> None:
+    """Test reading relationships without creating them."""
+
+    sim = _create_simulation(
+        SimulationConfig(compact_relationships=compact_relationships)
+    )
+
+    farmer = create_character(sim.world, "farmer")
+    noble = create_character(sim.world, "nobility")
+
+    missing = peek_relationship(farmer, noble)
+
+    assert missing is peek_relationship(noble, farmer)
+    assert missing.exists is False
+    assert missing.get_stat_value("reputation") == 0
+    assert missing.get_normalized("reputation") == 0.5
+    assert missing.has_trait("coworker") is False
+    assert has_relationship(farmer, noble) is False
+
+    relationship = add_relationship(farmer, noble)
+    add_trait(relationship, "coworker")
+    get_stat(relationship, "reputation").base_value = 10
+    expected_value = get_stat(relationship, "reputation").value
+
+    if store := sim.world.resource_manager.try_resource(RelationshipStore):
+        store.compact_all()
+
+    view = peek_relationship(farmer, noble)
+
+    assert view.exists is True
+    assert view.get_stat_value("reputation") == expected_value
+    assert view.get_normalized("reputation") == (expected_value + 100) / 200
+    assert view.has_trait("coworker") is True
+    assert view.has_trait("friend") is False
+
+    with pytest.raises(ValueError):
+        view.get_normalized("compatibility")
+
+    if store is not None:
+        row = store.get_row(farmer, noble)
+        assert row is not None and store.has_gameobject(row) is False
@@ -1,7 +1,12 @@
 import pathlib
 
+import pytest
+
+from neighborly.components.relationship import RelationshipStore
 from neighborly.components.settlement import Settlement
 from neighborly.config import SimulationConfig
+from neighborly.ecs import ArchetypeComponentStorage
+from neighborly.libraries import TraitLibrary
 from neighborly.loaders import (
     load_businesses,
     load_characters,
@@ -13,6 +18,7 @@ from neighborly.loaders import (
 )
 from neighborly.plugins import (
     default_character_names,
+    default_events,
     default_settlement_names,
     default_traits,
 )
@@ -64,6 +70,34 @@ def test_simulation_initialization() -> None:
     assert settlements[0][1].gameobject.metadata["definition_id"] == "basic_settlement"
 
 
+def test_simulation_archetype_storage() -> None:
+    sim = Simulation(
+        SimulationConfig(
+            seed=1234, settlement="basic_settlement", component_storage="archetype"
+        )
+    )
+
+    load_districts(sim, _TEST_DATA_DIR / "districts.json")
+    load_settlements(sim, _TEST_DATA_DIR / "settlements.json")
+    load_businesses(sim, _TEST_DATA_DIR / "businesses.json")
+    load_characters(sim, _TEST_DATA_DIR / "characters.json")
+    load_residences(sim, _TEST_DATA_DIR / "residences.json")
+    load_job_roles(sim, _TEST_DATA_DIR / "job_roles.json")
+    load_skills(sim, _TEST_DATA_DIR / "skills.json")
+
+    default_traits.load_plugin(sim)
+    default_character_names.load_plugin(sim)
+    default_settlement_names.load_plugin(sim)
+
+    for _ in range(24):
+        sim.step()
+
+    assert isinstance(
+        sim.world.gameobject_manager.component_manager, ArchetypeComponentStorage
+    )
+    assert len(sim.world.get_component(Settlement)) == 1
+
+
 def test_simulation_to_json() -> None:
     sim = Simulation(SimulationConfig(settlement="basic_settlement"))
 
@@ -89,3 +123,143 @@ def test_simulation_to_json() -> None:
         fp.write(sim.to_json(2))
 
     assert True
+
+
+@pytest.mark.parametrize("component_storage", ["esper", "archetype"])
+def test_simulation_checkpoint(tmp_path: pathlib.Path, component_storage: str) -> None:
+    """Test that a restored simulation continues exactly like the original."""
+    sim = Simulation(
+        SimulationConfig(
+            seed=1234,
+            settlement="basic_settlement",
+            component_storage=component_storage,
+        )
+    )
+
+    load_districts(sim, _TEST_DATA_DIR / "districts.json")
+    load_settlements(sim, _TEST_DATA_DIR / "settlements.json")
+    load_businesses(sim, _TEST_DATA_DIR / "businesses.json")
+    load_characters(sim, _TEST_DATA_DIR / "characters.json")
+    load_residences(sim, _TEST_DATA_DIR / "residences.json")
+    load_job_roles(sim, _TEST_DATA_DIR / "job_roles.json")
+    load_skills(sim, _TEST_DATA_DIR / "skills.json")
+
+    default_traits.load_plugin(sim)
+    default_character_names.load_plugin(sim)
+    default_settlement_names.load_plugin(sim)
+
+    for _ in range(24):
+        sim.step()
+
+    checkpoint_path = tmp_path / "checkpoint.bin"
+    sim.save_checkpoint(checkpoint_path)
+    restored = Simulation.load_checkpoint(checkpoint_path)
+
+    assert restored.date.total_months == sim.date.total_months
+    assert restored.to_json() == sim.to_json()
+
+    for _ in range(12):
+        sim.step()
+        restored.step()
+
+    assert restored.to_json() == sim.to_json()
+
+
+def test_simulation_compact_relationships() -> None:
+    """Test running and restoring a simulation that stores relationships as rows."""
+    sim = Simulation(
+        SimulationConfig(
+            seed=1234, settlement="basic_settlement", compact_relationships=True
+        )
+    )
+
+    load_districts(sim, _TEST_DATA_DIR / "districts.json")
+    load_settlements(sim, _TEST_DATA_DIR / "settlements.json")
+    load_businesses(sim, _TEST_DATA_DIR / "businesses.json")
+    load_characters(sim, _TEST_DATA_DIR / "characters.json")
+    load_residences(sim, _TEST_DATA_DIR / "residences.json")
+    load_job_roles(sim, _TEST_DATA_DIR / "job_roles.json")
+    load_skills(sim, _TEST_DATA_DIR / "skills.json")
+
+    default_traits.load_plugin(sim)
+    default_character_names.load_plugin(sim)
+    default_settlement_names.load_plugin(sim)
+    default_events.load_plugin(sim)
+
+    for _ in range(24):
+        sim.step()
+
+    store = sim.world.resource_manager.get_resource(RelationshipStore)
+    store.compact_all()
+    rows = store.get_active_rows()
+
+    assert len(rows) > 0
+    assert not any(store.has_gameobject(row) for row in rows)
+
+    restored = Simulation.from_checkpoint(sim.to_checkpoint())
+
+    for _ in range(12):
+        sim.step()
+        restored.step()
+
+    assert restored.to_json() == sim.to_json()
+
+
+def test_simulation_checkpoint_in_memory() -> None:
+    """Test that in-memory checkpoints create independent copies."""
+    sim = Simulation(SimulationConfig(seed=1234))
+
+    for _ in range(3):
+        sim.step()
+
+    copy = Simulation.from_checkpoint(sim.to_checkpoint())
+    copy.step()
+
+    assert copy.date.total_months == 4
+    assert sim.date.total_months == 3
+
+
+def test_simulation_fork() -> None:
+    """Test that forks share content definitions and copy everything else."""
+    sim = Simulation(SimulationConfig(seed=1234, settlement="basic_settlement"))
+
+    load_districts(sim, _TEST_DATA_DIR / "districts.json")
+    load_settlements(sim, _TEST_DATA_DIR / "settlements.json")
+    load_businesses(sim, _TEST_DATA_DIR / "businesses.json")
+    load_characters(sim, _TEST_DATA_DIR / "characters.json")
+    load_residences(sim, _TEST_DATA_DIR / "residences.json")
+    load_job_roles(sim, _TEST_DATA_DIR / "job_roles.json")
+    load_skills(sim, _TEST_DATA_DIR / "skills.json")
+
+    default_traits.load_plugin(sim)
+    default_character_names.load_plugin(sim)
+    default_settlement_names.load_plugin(sim)
+
+    for _ in range(12):
+        sim.step()
+
+    fork = sim.fork()
+    reseeded_fork = sim.fork(seed=5678)
+
+    trait_library = sim.world.resource_manager.get_resource(TraitLibrary)
+    fork_trait_library = fork.world.resource_manager.get_resource(TraitLibrary)
+
+    assert fork.world is not sim.world
+    assert fork_trait_library is not trait_library
+    for definition_id, definition in trait_library.definitions.items():
+        assert fork_trait_library.definitions[definition_id] is definition
+
+    assert reseeded_fork.config.seed == 5678
+    assert (
+        reseeded_fork.world.resource_manager.get_resource(SimulationConfig).seed
+        == 5678
+    )
+    assert sim.config.seed == 1234
+
+    for _ in range(12):
+        sim.step()
+        fork.step()
+        reseeded_fork.step()
+
+    assert fork.to_json() == sim.to_json()
+    assert reseeded_fork.date.total_months == sim.date.total_months
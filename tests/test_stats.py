@@ -6,12 +6,28 @@ from __future__ import annotations
 
 import pathlib
 
-from neighborly.components.stats import Stat
+import numpy as np
+import pytest
+
+from neighborly.components.character import Character, Sex
+from neighborly.components.stats import (
+    Stat,
+    StatModifier,
+    StatModifierType,
+    Stats,
+    StatSchema,
+    StatStore,
+)
+from neighborly.config import SimulationConfig
+from neighborly.ecs import Active, Changed
+from neighborly.effects.effects import IncreaseSkill, StatBuff
 from neighborly.helpers.character import create_character
+from neighborly.helpers.skills import get_skill
 from neighborly.helpers.stats import add_stat, get_stat, has_stat, remove_stat
 from neighborly.loaders import load_characters, load_skills
 from neighborly.plugins import default_traits
 from neighborly.simulation import Simulation
+from neighborly.systems import DeathSystem, HealthDecaySystem
 
 _TEST_DATA_DIR = pathlib.Path(__file__).parent / "data"
 
@@ -98,3 +114,311 @@ def test_remove_stat() -> None:
     remove_stat(character, "hunger")
 
     assert has_stat(character, "hunger") is False
+
+
+def test_stat_changes_mark_stats_changed() -> None:
+    """Test that modifying a stat marks its Stats component as changed."""
+
+    sim = Simulation()
+
+    load_characters(sim, _TEST_DATA_DIR / "characters.json")
+    load_skills(sim, _TEST_DATA_DIR / "skills.json")
+
+    default_traits.load_plugin(sim)
+
+    sim.initialize()
+
+    character = create_character(sim.world, "farmer")
+    other = create_character(sim.world, "farmer")
+
+    since = sim.world.increment_change_tick()
+    sim.world.increment_change_tick()
+
+    get_stat(character, "health").base_value -= 10
+
+    changed = sim.world.get_changed_components((Stats,), (Changed[Stats],), since)
+
+    # Only the modified character matches, not 'other'
+    assert [uid for uid, _ in changed] == [character.uid]
+
+
+@pytest.mark.parametrize(
+    "modifiers",
+    [
+        [],
+        [
+            StatModifier(10, StatModifierType.FLAT),
+            StatModifier(0.5, StatModifierType.PERCENT_ADD),
+            StatModifier(0.25, StatModifierType.PERCENT_ADD),
+            StatModifier(1.0, StatModifierType.PERCENT_MULTIPLY),
+        ],
+        [
+            StatModifier(0.5, StatModifierType.PERCENT_ADD, order=1),
+            StatModifier(10, StatModifierType.FLAT, order=2),
+            StatModifier(0.5, StatModifierType.PERCENT_ADD, order=3),
+        ],
+    ],
+)
+def test_columnar_stats(modifiers: list[StatModifier]) -> None:
+    """Test that stats stored in a StatStore match stats that store their own data."""
+
+    sim = Simulation(SimulationConfig(columnar_stats=True))
+
+    load_characters(sim, _TEST_DATA_DIR / "characters.json")
+    load_skills(sim, _TEST_DATA_DIR / "skills.json")
+
+    default_traits.load_plugin(sim)
+
+    sim.initialize()
+
+    character = create_character(sim.world, "farmer")
+    store = sim.world.resource_manager.get_resource(StatStore)
+
+    stat = add_stat(character, "hunger", Stat(base_value=20, bounds=(0, 255)))
+    expected = Stat(base_value=20, bounds=(0, 255))
+
+    assert stat.column is store.get_column("hunger")
+
+    for modifier in modifiers:
+        stat.add_modifier(modifier)
+        expected.add_modifier(modifier)
+
+    stat.base_value += 5
+    expected.base_value += 5
+
+    store.recalculate_all()
+
+    assert stat.value == expected.value
+    assert stat.base_value == expected.base_value
+
+    # Removing the stat moves its data back into the Stat instance
+    remove_stat(character, "hunger")
+
+    assert stat.column is None
+    assert stat.value == expected.value
+
+
+@pytest.mark.parametrize("columnar_stats", [False, True])
+def test_health_decay_and_death(columnar_stats: bool) -> None:
+    """Test that characters lose health each month and die at zero health."""
+
+    sim = Simulation(SimulationConfig(columnar_stats=columnar_stats))
+
+    load_characters(sim, _TEST_DATA_DIR / "characters.json")
+    load_skills(sim, _TEST_DATA_DIR / "skills.json")
+
+    default_traits.load_plugin(sim)
+
+    sim.initialize()
+
+    healthy = create_character(sim.world, "farmer")
+    dying = create_character(sim.world, "farmer")
+
+    get_stat(healthy, "health").base_value = 100
+    get_stat(dying, "health").base_value = 0.01
+
+    decay = get_stat(healthy, "health_decay").value
+
+    sim.world.system_manager.get_system(HealthDecaySystem).on_update(sim.world)
+    sim.world.system_manager.get_system(DeathSystem).on_update(sim.world)
+
+    assert get_stat(healthy, "health").value == pytest.approx(100 - decay / 12)
+    assert healthy.has_component(Active)
+    assert dying.has_component(Active) is False
+
+
+def test_columnar_health_decay_skips_characters_without_health() -> None:
+    """Test that StatStore health updates ignore rows that are not bound to stats."""
+
+    sim = Simulation(SimulationConfig(columnar_stats=True))
+
+    load_characters(sim, _TEST_DATA_DIR / "characters.json")
+    load_skills(sim, _TEST_DATA_DIR / "skills.json")
+
+    default_traits.load_plugin(sim)
+
+    sim.initialize()
+
+    character = create_character(sim.world, "farmer")
+    remove_stat(character, "health")
+    remove_stat(character, "health_decay")
+
+    health = sim.world.resource_manager.get_resource(StatStore).get_column("health")
+
+    # Place a character that never had stats beyond the capacity of the column
+    for _ in range(health.capacity):
+        sim.world.gameobject_manager.spawn_gameobject()
+    distant = sim.world.gameobject_manager.spawn_gameobject(
+        [Character("A", "B", Sex.MALE, character.get_component(Character).species)]
+    )
+
+    assert distant.index >= health.capacity
+
+    sim.world.system_manager.get_system(HealthDecaySystem).on_update(sim.world)
+    sim.world.system_manager.get_system(DeathSystem).on_update(sim.world)
+
+    assert character.has_component(Active)
+    assert distant.has_component(Active)
+    assert health.get_stat(character.index) is None
+    assert health.get_bound_mask(np.array([character.index])).tolist() == [False]
+
+
+def test_stat_modifier_bookkeeping() -> None:
+    """Test that cached modifier totals match applying modifiers one at a time."""
+
+    def expected_value(base_value: float, modifiers: list[StatModifier]) -> float:
+        value = base_value
+        percent_add = 0.0
+        ordered = sorted(modifiers, key=lambda m: m.order)
+
+        for i, modifier in enumerate(ordered):
+            if modifier.modifier_type == StatModifierType.FLAT:
+                value += modifier.value
+            elif modifier.modifier_type == StatModifierType.PERCENT_ADD:
+                percent_add += modifier.value
+                if (
+                    i + 1 == len(ordered)
+                    or ordered[i + 1].modifier_type != StatModifierType.PERCENT_ADD
+                ):
+                    value *= 1 + percent_add
+                    percent_add = 0.0
+            else:
+                value *= 1 + modifier.value
+
+        return value
+
+    source_a = object()
+    source_b = object()
+
+    stat = Stat(base_value=10)
+    modifiers = [
+        StatModifier(5, StatModifierType.FLAT, source=source_a),
+        StatModifier(0.5, StatModifierType.PERCENT_ADD, source=source_a),
+        StatModifier(0.5, StatModifierType.PERCENT_MULTIPLY, source=source_b),
+        StatModifier(0.25, StatModifierType.PERCENT_ADD, source=source_b),
+        StatModifier(3, StatModifierType.FLAT, order=250, source=source_b),
+        StatModifier(2, StatModifierType.FLAT, source=source_a),
+    ]
+    active: list[StatModifier] = []
+
+    for modifier in modifiers:
+        stat.add_modifier(modifier)
+        active.append(modifier)
+        assert stat.value == pytest.approx(expected_value(10, active))
+
+    assert [m.order for m in stat.modifiers] == sorted(m.order for m in active)
+
+    # Removing the out-of-order FLAT modifier restores the grouped order
+    assert stat.remove_modifier(modifiers[4]) is True
+    assert stat.remove_modifier(modifiers[4]) is False
+    active.remove(modifiers[4])
+    assert stat.value == pytest.approx(expected_value(10, active))
+
+    assert stat.remove_modifiers_from_source(source_a) is True
+    assert stat.remove_modifiers_from_source(source_a) is False
+    active = [m for m in active if m.source is not source_a]
+    assert stat.value == pytest.approx(expected_value(10, active))
+
+    assert stat.remove_modifiers_from_source(source_b) is True
+    assert stat.modifiers == []
+    assert stat.value == 10
+
+
+def test_stat_schema_slots() -> None:
+    """Test looking up stats using StatSchema slots."""
+
+    stats = Stats()
+    hunger = Stat(base_value=10)
+    thirst = Stat(base_value=5)
+
+    stats.add_stat("hunger", hunger)
+    stats.add_stat("thirst", thirst)
+
+    hunger_slot = StatSchema.get_slot("hunger")
+
+    assert StatSchema.get_slot("hunger") == hunger_slot
+    assert StatSchema.get_stat_id(hunger_slot) == "hunger"
+    assert stats.get_stat_by_slot(hunger_slot) is hunger
+    assert stats.get_stat("thirst") is thirst
+    assert [stat_id for stat_id, _ in stats] == ["hunger", "thirst"]
+
+    stats.remove_stat("hunger")
+
+    assert stats.has_stat("hunger") is False
+    with pytest.raises(KeyError):
+        stats.get_stat_by_slot(hunger_slot)
+
+    assert StatSchema.try_slot("not-a-stat-id") is None
+    assert stats.has_stat("not-a-stat-id") is False
+
+
+def test_effect_apply_many() -> None:
+    """Test applying and removing effects on several GameObjects at once."""
+
+    sim = Simulation()
+
+    load_characters(sim, _TEST_DATA_DIR / "characters.json")
+    load_skills(sim, _TEST_DATA_DIR / "skills.json")
+
+    default_traits.load_plugin(sim)
+
+    sim.initialize()
+
+    characters = [create_character(sim.world, "farmer") for _ in range(3)]
+
+    for character in characters:
+        get_stat(character, "sociability").base_value = 10
+
+    buff = StatBuff("sociability", 5, StatModifierType.FLAT)
+    buff.apply_many(characters)
+
+    assert [get_stat(c, "sociability").value for c in characters] == [15, 15, 15]
+
+    buff.remove_many(characters[1:])
+
+    assert [get_stat(c, "sociability").value for c in characters] == [15, 10, 10]
+
+    IncreaseSkill("blacksmithing", 2).apply_many(characters)
+    IncreaseSkill("blacksmithing", 3).apply_many(characters[:1])
+
+    assert [get_skill(c, "blacksmithing").value for c in characters] == [5, 2, 2]
+
+
+@pytest.mark.parametrize("columnar_stats", [False, True])
+def test_stat_normalized(columnar_stats: bool) -> None:
+    """Test that cached normalized values update when a stat changes."""
+
+    sim = Simulation(SimulationConfig(columnar_stats=columnar_stats))
+
+    load_characters(sim, _TEST_DATA_DIR / "characters.json")
+    load_skills(sim, _TEST_DATA_DIR / "skills.json")
+
+    default_traits.load_plugin(sim)
+
+    sim.initialize()
+
+    characters = [create_character(sim.world, "farmer") for _ in range(2)]
+    stats = [
+        add_stat(c, "hunger", Stat(base_value=50, bounds=(0, 100)))
+        for c in characters
+    ]
+
+    assert stats[0].normalized == 0.5
+
+    stats[0].base_value = 25
+    stats[1].add_modifier(StatModifier(25, StatModifierType.FLAT))
+
+    assert stats[0].normalized == 0.25
+    assert stats[1].normalized == 0.75
+
+    if columnar_stats:
+        column = sim.world.resource_manager.get_resource(StatStore).get_column(
+            "hunger"
+        )
+        stats[0].base_value = 100
+        rows = np.array([c.index for c in characters])
+
+        assert column.get_normalized(rows).tolist() == [1.0, 0.75]
+
+    with pytest.raises(ValueError):
+        _ = Stat(base_value=10).normalized